@@ -3,21 +3,31 @@ Classroom Pilot - Python CLI Package
 
 A comprehensive automation suite for managing Classroom assignments
 with advanced workflow orchestration, repository discovery, and secret management capabilities.
+
+Public classes and helpers are resolved lazily on first attribute access
+(PEP 562), so ``import classroom_pilot`` - and therefore every CLI invocation -
+does not load the configuration, bash wrapper, or service stacks up front.
+``__version__`` is resolved the same way, so package metadata is only read
+when something asks for the version.
 """
 
-from ._version import get_version
+import importlib
 
-__version__ = get_version()
 __author__ = "Hugo Valle"
 __description__ = "Classroom Pilot - Comprehensive automation suite for managing assignments"
 
-from .config import ConfigLoader, ConfigValidator
-from .utils import setup_logging, get_logger
-from .bash_wrapper import BashWrapper
-from .services.assignment_service import AssignmentService
-from .services.repos_service import ReposService
-from .services.secrets_service import SecretsService
-from .services.automation_service import AutomationService
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    "ConfigLoader": ".config",
+    "ConfigValidator": ".config",
+    "setup_logging": ".utils",
+    "get_logger": ".utils",
+    "BashWrapper": ".bash_wrapper",
+    "AssignmentService": ".services.assignment_service",
+    "ReposService": ".services.repos_service",
+    "SecretsService": ".services.secrets_service",
+    "AutomationService": ".services.automation_service",
+}
 
 __all__ = [
     "ConfigLoader",
@@ -31,3 +41,24 @@ __all__ = [
     "AutomationService",
     "__version__",
 ]
+
+
+def __getattr__(name: str):
+    """Import public attributes on first access and cache them on the package."""
+    if name == "__version__":
+        from ._version import get_version
+        value = globals()["__version__"] = get_version()
+        return value
+
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | {"__version__"})
@@ -1,13 +1,6 @@
 """Version utility for classroom-pilot package."""
 
-import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING or sys.version_info >= (3, 8):
-    from importlib import metadata
-else:
-    import importlib_metadata as metadata
 
 
 def get_version() -> str:
@@ -20,6 +13,9 @@ def get_version() -> str:
     Returns:
         str: The version string
     """
+    # Imported here so that importing this module stays free of metadata scans
+    from importlib import metadata
+
     try:
         # Try to get version from installed package metadata
         return metadata.version("classroom-pilot")
@@ -15,19 +15,48 @@ Features:
 """
 
 import json
+import os
 import re
 import subprocess
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, TextIO, Tuple
 
 from ..config.global_config import load_global_config
 from ..utils import get_logger
+from ..utils.file_cache import FileParseCache, read_list_file
+from ..utils.token_pool import TokenPool, load_extra_tokens
 
 logger = get_logger("assignments.cycle_collaborator")
 
+# Repositories looked up per GraphQL request (GitHub's node limit per connection)
+GRAPHQL_BATCH_SIZE = 100
+
+# Repositories cycled at once in batch mode. GitHub's secondary rate limits
+# apply to concurrent requests, so parallel cycling is opt-in and capped.
+DEFAULT_CONCURRENCY = 1
+MAX_CONCURRENCY = 25
+
+# Retries for writes rejected by a rate limit (HTTP 403/429)
+RATE_LIMIT_RETRIES = 3
+
+# Seconds to wait on a rate-limit response without Retry-After or reset
+# headers (GitHub asks for at least a minute on secondary limits)
+RATE_LIMIT_FALLBACK_WAIT = 60
+
+# Supported GitHub repository URL formats (HTTPS and SSH)
+_REPO_URL_PATTERNS = (
+    re.compile(r'https://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$'),
+    re.compile(r'git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$'),
+)
+
+# Parsed batch files, reused while unchanged on disk
+_BATCH_PARSE_CACHE = FileParseCache()
+
 
 class AccessStatus(Enum):
     """Repository access status enumeration."""
@@ -81,6 +110,29 @@ class BatchSummary:
     errors: List[str]
 
 
+def _split_gh_include(output: Optional[str]) -> Tuple[str, Dict[str, str], str]:
+    """
+    Split ``gh api --include`` output into (status code, headers, body).
+
+    Header names are lower-cased; the status is '' if there is no response head.
+    """
+    head, _, body = (output or '').replace('\r\n', '\n').partition('\n\n')
+    status_line, *header_lines = head.split('\n')
+    fields = status_line.split()
+    status = fields[1] if len(fields) > 1 and fields[0].startswith('HTTP/') else ''
+
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+def _write_lines(lines: List[str], file: Optional[TextIO] = None) -> None:
+    """Write display lines to file (default: stdout) with a single write call."""
+    (file or sys.stdout).write("\n".join(lines) + "\n")
+
+
 class CycleCollaboratorManager:
     """
     Manager for cycling collaborator permissions to fix repository access issues.
@@ -101,6 +153,8 @@ class CycleCollaboratorManager:
         self.auto_confirm = auto_confirm
         self.github_organization = self.config.github_organization
         self.assignment_prefix = self.config.assignment_name
+        # Tokens from GITHUB_TOKENS / GITHUB_TOKENS_FILE; gh's own login otherwise
+        self._token_pool = TokenPool(load_extra_tokens())
 
     def validate_configuration(self) -> bool:
         """
@@ -210,6 +264,127 @@ class CycleCollaboratorManager:
             needs_cycling=needs_cycling
         )
 
+    def check_repository_statuses(
+        self,
+        targets: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], RepositoryStatus]:
+        """
+        Check access for many repositories with batched GraphQL queries.
+
+        Each query looks up to GRAPHQL_BATCH_SIZE repositories through aliased
+        ``repository`` fields, so N repositories cost ceil(N / 100) requests
+        instead of two or three REST calls each. Pending invitations are not
+        exposed over GraphQL and are only fetched (via REST) for users who
+        are not collaborators.
+
+        Targets that cannot be resolved this way (invalid URLs, partial
+        GraphQL errors, gh failures) are left out of the result, so callers
+        fall back to check_repository_status() for them.
+
+        Args:
+            targets: List of (repo_url, username) pairs
+
+        Returns:
+            Dictionary mapping (repo_url, username) to RepositoryStatus
+        """
+        parsed = []
+        for repo_url, username in targets:
+            try:
+                owner, repo_name = self._parse_repository_url(repo_url)
+            except ValueError:
+                continue
+            parsed.append((repo_url, username, owner, repo_name))
+
+        statuses = {}
+        for start in range(0, len(parsed), GRAPHQL_BATCH_SIZE):
+            chunk = parsed[start:start + GRAPHQL_BATCH_SIZE]
+            data = self._query_collaborators_graphql(
+                [(owner, repo_name, username)
+                 for _, username, owner, repo_name in chunk])
+            if data is None:
+                continue
+
+            for index, (repo_url, username, owner, repo_name) in enumerate(chunk):
+                alias = f"r{index}"
+                if alias not in data:
+                    continue
+
+                repository = data[alias]
+                if repository is None:
+                    statuses[(repo_url, username)] = RepositoryStatus(
+                        repo_url=repo_url,
+                        username=username,
+                        accessible=False,
+                        has_collaborator_access=False,
+                        has_pending_invitation=False,
+                        access_status=AccessStatus.NOT_FOUND,
+                        needs_cycling=False,
+                        error_message="Repository not found or not accessible"
+                    )
+                    continue
+
+                collaborators = repository.get("collaborators")
+                if collaborators is None:
+                    # Collaborator list not readable with this token
+                    continue
+
+                has_collaborator_access = collaborators.get("totalCount", 0) > 0
+                has_pending_invitation = (
+                    not has_collaborator_access
+                    and self._check_pending_invitations(owner, repo_name, username))
+
+                statuses[(repo_url, username)] = RepositoryStatus(
+                    repo_url=repo_url,
+                    username=username,
+                    accessible=True,
+                    has_collaborator_access=has_collaborator_access,
+                    has_pending_invitation=has_pending_invitation,
+                    access_status=(AccessStatus.OK if has_collaborator_access
+                                   else AccessStatus.CORRUPTED),
+                    needs_cycling=not has_collaborator_access
+                )
+
+        return statuses
+
+    def _query_collaborators_graphql(
+        self,
+        lookups: List[Tuple[str, str, str]]
+    ) -> Optional[dict]:
+        """
+        Run one aliased GraphQL query for (owner, repo_name, username) lookups.
+
+        Returns:
+            The ``data`` object keyed by alias (r0, r1, ...), or None if the
+            request failed outright
+        """
+        params = []
+        fields = []
+        cmd = ['gh', 'api', 'graphql']
+        for index, (owner, repo_name, username) in enumerate(lookups):
+            params.append(
+                f"$o{index}: String!, $n{index}: String!, $u{index}: String!")
+            fields.append(
+                f"r{index}: repository(owner: $o{index}, name: $n{index}) "
+                f"{{ collaborators(login: $u{index}, first: 1) {{ totalCount }} }}")
+            cmd.extend(['-f', f'o{index}={owner}',
+                        '-f', f'n{index}={repo_name}',
+                        '-f', f'u{index}={username}'])
+
+        query = f"query({', '.join(params)}) {{ {' '.join(fields)} }}"
+        cmd.extend(['-f', f'query={query}'])
+
+        try:
+            # gh exits non-zero when the response carries partial errors
+            # (e.g. NOT_FOUND for one alias), but still prints the payload
+            proc = subprocess.run(cmd, capture_output=True, text=True,
+                                  **self._gh_token_kwargs())
+            data = json.loads(proc.stdout).get('data')
+        except (OSError, ValueError, AttributeError) as e:
+            logger.debug("Batched collaborator query failed: %s", e)
+            return None
+
+        return data if isinstance(data, dict) else None
+
     def _parse_repository_url(self, repo_url: str) -> Tuple[str, str]:
         """
         Parse repository URL to extract owner and repository name.
@@ -223,14 +398,9 @@ class CycleCollaboratorManager:
         Raises:
             ValueError: If URL format is invalid
         """
-        # Handle various GitHub URL formats
-        patterns = [
-            r'https://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$',
-            r'git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$',
-        ]
-
-        for pattern in patterns:
-            match = re.match(pattern, repo_url.strip())
+        url = repo_url.strip()
+        for pattern in _REPO_URL_PATTERNS:
+            match = pattern.match(url)
             if match:
                 owner, repo_name = match.groups()
                 return owner, repo_name
@@ -267,14 +437,8 @@ class CycleCollaboratorManager:
     def _check_pending_invitations(self, owner: str, repo_name: str, username: str) -> bool:
         """Check if user has pending invitations for the repository."""
         try:
-            proc = subprocess.run(
-                ['gh', 'api', f'repos/{owner}/{repo_name}/invitations'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-
-            invitations = json.loads(proc.stdout)
+            invitations = json.loads(self._gh_api_get(
+                f'repos/{owner}/{repo_name}/invitations'))
             for invitation in invitations:
                 if invitation.get('invitee', {}).get('login') == username:
                     return True
@@ -282,11 +446,50 @@ class CycleCollaboratorManager:
         except (subprocess.CalledProcessError, json.JSONDecodeError):
             return False
 
+    def _gh_api_get(self, endpoint: str) -> str:
+        """
+        GET a REST endpoint through ``gh api`` with the next pooled token.
+
+        With pooled tokens the response head is requested as well, so the
+        token's rate-limit state can be recorded.
+
+        Returns:
+            The response body
+
+        Raises:
+            subprocess.CalledProcessError: If the request failed
+        """
+        token_kwargs = self._gh_token_kwargs()
+        if not token_kwargs:
+            return subprocess.run(['gh', 'api', endpoint], capture_output=True,
+                                  text=True, check=True).stdout
+
+        cmd = ['gh', 'api', '--include', endpoint]
+        proc = subprocess.run(cmd, capture_output=True, text=True, **token_kwargs)
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(
+                proc.returncode, cmd, proc.stdout, proc.stderr)
+
+        _, headers, body = _split_gh_include(proc.stdout)
+        self._token_pool.update(token_kwargs['env']['GH_TOKEN'], headers)
+        return body
+
+    def _gh_token_kwargs(self) -> Dict[str, Dict[str, str]]:
+        """
+        Return ``subprocess.run`` keyword arguments selecting the next pooled token.
+
+        Empty when no extra tokens are configured, so gh uses its own login.
+        """
+        if not self._token_pool:
+            return {}
+        return {'env': {**os.environ, 'GH_TOKEN': self._token_pool.next_token()}}
+
     def cycle_single_repository(
         self,
         repo_url: str,
         username: str,
-        force: bool = False
+        force: bool = False,
+        status: Optional[RepositoryStatus] = None
     ) -> CycleOperation:
         """
         Cycle collaborator permissions for a single repository.
@@ -295,6 +498,8 @@ class CycleCollaboratorManager:
             repo_url: URL of the repository
             username: Username to cycle permissions for
             force: Whether to force cycling even if access appears correct
+            status: Previously fetched status (e.g. from
+                    check_repository_statuses); checked here when omitted
 
         Returns:
             CycleOperation with result details
@@ -306,7 +511,8 @@ class CycleCollaboratorManager:
 
         try:
             # Check current status
-            status = self.check_repository_status(repo_url, username)
+            if status is None:
+                status = self.check_repository_status(repo_url, username)
 
             if not status.accessible:
                 return CycleOperation(
@@ -384,13 +590,9 @@ class CycleCollaboratorManager:
     def _remove_collaborator(self, owner: str, repo_name: str, username: str) -> bool:
         """Remove collaborator from repository."""
         try:
-            subprocess.run(
+            self._run_gh_write(
                 ['gh', 'api',
-                    f'repos/{owner}/{repo_name}/collaborators/{username}', '--method', 'DELETE'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+                    f'repos/{owner}/{repo_name}/collaborators/{username}', '--method', 'DELETE'])
             logger.info(
                 f"Successfully removed {username} from {owner}/{repo_name}")
             return True
@@ -401,11 +603,11 @@ class CycleCollaboratorManager:
     def _add_collaborator(self, owner: str, repo_name: str, username: str, permission: str = "write") -> bool:
         """Add collaborator to repository with specified permissions."""
         try:
-            subprocess.run([
+            self._run_gh_write([
                 'gh', 'api', f'repos/{owner}/{repo_name}/collaborators/{username}',
                 '--method', 'PUT',
                 '--field', f'permission={permission}'
-            ], capture_output=True, text=True, check=True)
+            ])
 
             logger.info(
                 f"Successfully added {username} to {owner}/{repo_name} with {permission} permission")
@@ -414,6 +616,57 @@ class CycleCollaboratorManager:
             logger.error(f"Failed to add collaborator: {e}")
             return False
 
+    def _run_gh_write(self, cmd: List[str]) -> None:
+        """
+        Run a mutating ``gh api`` call, waiting out rate-limit responses.
+
+        The response head is requested so that a 429, or a 403 carrying
+        Retry-After or an exhausted X-RateLimit-Remaining, can be told apart
+        from a permission error. Such calls are retried after the time
+        GitHub asks for.
+
+        Raises:
+            subprocess.CalledProcessError: If the call still fails
+        """
+        cmd = cmd[:2] + ['--include'] + cmd[2:]
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            token_kwargs = self._gh_token_kwargs()
+            try:
+                subprocess.run(cmd, capture_output=True, text=True, check=True,
+                               **token_kwargs)
+                return
+            except subprocess.CalledProcessError as e:
+                delay = self._rate_limit_delay(e.stdout, token_kwargs)
+                if attempt == RATE_LIMIT_RETRIES or delay is None:
+                    raise
+                logger.warning(
+                    "Rate limited by GitHub, retrying in %ss", delay)
+                time.sleep(delay)
+
+    def _rate_limit_delay(self, output: Optional[str],
+                          token_kwargs: Dict[str, Dict[str, str]]) -> Optional[int]:
+        """
+        Return the seconds to wait before retrying a failed ``gh api --include`` call.
+
+        Returns:
+            The wait for a rate-limit response, or None for any other failure
+        """
+        status, headers, _ = _split_gh_include(output)
+        if token_kwargs:
+            self._token_pool.update(token_kwargs['env']['GH_TOKEN'], headers)
+
+        retry_after = headers.get('retry-after', '')
+        exhausted = headers.get('x-ratelimit-remaining') == '0'
+        if status != '429' and not (status == '403' and (retry_after or exhausted)):
+            return None
+
+        if retry_after.isdigit():
+            return int(retry_after)
+        reset = headers.get('x-ratelimit-reset', '')
+        if exhausted and reset.isdigit():
+            return max(1, int(reset) - int(time.time()))
+        return RATE_LIMIT_FALLBACK_WAIT
+
     def cycle_multiple_repositories(
         self,
         repo_urls: List[str],
@@ -434,11 +687,16 @@ class CycleCollaboratorManager:
         logger.info(
             f"Cycling permissions for {username} across {len(repo_urls)} repositories")
 
+        # Fetch every repository's status up front in batched queries
+        statuses = self.check_repository_statuses(
+            [(repo_url, username) for repo_url in repo_urls])
+
         results = []
         for repo_url in repo_urls:
             try:
                 result = self.cycle_single_repository(
-                    repo_url, username, force)
+                    repo_url, username, force,
+                    status=statuses.get((repo_url, username)))
                 results.append(result)
 
                 # Brief delay between operations to avoid rate limiting
@@ -461,7 +719,9 @@ class CycleCollaboratorManager:
         self,
         batch_file_path: Path,
         repo_url_mode: bool = False,
-        force: bool = False
+        force: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        file_stat: Optional[os.stat_result] = None
     ) -> BatchSummary:
         """
         Process batch cycling operations from a file.
@@ -470,23 +730,66 @@ class CycleCollaboratorManager:
             batch_file_path: Path to file containing repository URLs or usernames
             repo_url_mode: If True, file contains repo URLs; if False, contains usernames
             force: Whether to force cycling even if access appears correct
+            concurrency: Number of repositories to cycle at once
+            file_stat: Result of a stat() the caller already made on the file
 
         Returns:
             BatchSummary with operation results
         """
         logger.info(f"Processing batch file: {batch_file_path}")
 
-        if not batch_file_path.exists():
-            raise FileNotFoundError(f"Batch file not found: {batch_file_path}")
+        lines = self._read_batch_file(batch_file_path, file_stat)
+        return self.batch_cycle_from_parsed(
+            lines, repo_url_mode, force, concurrency)
 
-        # Read and parse batch file
-        lines = []
-        with open(batch_file_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    lines.append(line)
+    @classmethod
+    def _read_batch_file(cls, batch_file_path: Path,
+                         stat: Optional[os.stat_result] = None) -> List[str]:
+        """
+        Return the non-blank, non-comment lines of a batch file.
+
+        Parsed entries are reused while the file's mtime and size are
+        unchanged, so repeated runs (e.g. from cron) skip re-reading it.
+        A stat result the caller already has is used instead of a new one.
+        Large files are scanned through mmap (see read_list_file).
+        """
+        if stat is None:
+            try:
+                stat = batch_file_path.stat()
+            except OSError:
+                raise FileNotFoundError(f"Batch file not found: {batch_file_path}")
 
+        return _BATCH_PARSE_CACHE.load(
+            batch_file_path,
+            lambda path: cls._parse_batch_file(path, stat.st_size), stat)
+
+    @staticmethod
+    def _parse_batch_file(batch_file_path: Path, size: int) -> List[str]:
+        """Parse a batch file of ``size`` bytes."""
+        return read_list_file(batch_file_path, size)
+
+    def batch_cycle_from_parsed(
+        self,
+        lines: List[str],
+        repo_url_mode: bool = False,
+        force: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY
+    ) -> BatchSummary:
+        """
+        Process batch cycling operations for already parsed batch entries.
+
+        Repositories are cycled on up to ``concurrency`` worker threads
+        (capped at MAX_CONCURRENCY); the work is network-bound ``gh`` calls.
+
+        Args:
+            lines: Repository URLs or usernames, one entry each
+            repo_url_mode: If True, entries are repo URLs; if False, usernames
+            force: Whether to force cycling even if access appears correct
+            concurrency: Number of repositories to cycle at once
+
+        Returns:
+            BatchSummary with operation results
+        """
         if not lines:
             logger.warning("No valid entries found in batch file")
             return BatchSummary(
@@ -502,6 +805,8 @@ class CycleCollaboratorManager:
         results = []
         errors = []
 
+        # Resolve every entry to a (repo_url, username) target first
+        targets = []
         for line in lines:
             try:
                 # Auto-detect if line is a URL or username
@@ -512,9 +817,7 @@ class CycleCollaboratorManager:
                     repo_url = line
                     username = self._extract_username_from_repo_url(repo_url)
                     if username:
-                        result = self.cycle_single_repository(
-                            repo_url, username, force)
-                        results.append(result)
+                        targets.append((line, repo_url, username))
                     else:
                         errors.append(
                             f"Could not extract username from URL: {repo_url}")
@@ -527,13 +830,39 @@ class CycleCollaboratorManager:
 
                     username = line
                     repo_url = f"https://github.com/{self.github_organization}/{self.assignment_prefix}-{username}"
-                    result = self.cycle_single_repository(
-                        repo_url, username, force)
-                    results.append(result)
+                    targets.append((line, repo_url, username))
             except Exception as e:
-                logger.error(f"Failed to process entry {line}: {e}")
+                logger.error("Failed to process entry %s: %s", line, e)
                 errors.append(f"Failed to process {line}: {e}")
 
+        # Fetch every repository's status up front in batched queries, so
+        # only the cycling itself needs per-repository REST calls
+        statuses = self.check_repository_statuses(
+            [(repo_url, username) for _, repo_url, username in targets])
+
+        def cycle_target(target):
+            line, repo_url, username = target
+            try:
+                return self.cycle_single_repository(
+                    repo_url, username, force,
+                    status=statuses.get((repo_url, username))), None
+            except Exception as e:
+                logger.error("Failed to process entry %s: %s", line, e)
+                return None, f"Failed to process {line}: {e}"
+
+        workers = max(1, min(concurrency, MAX_CONCURRENCY, len(targets)))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(cycle_target, targets))
+        else:
+            outcomes = [cycle_target(target) for target in targets]
+
+        for result, error in outcomes:
+            if error is None:
+                results.append(result)
+            else:
+                errors.append(error)
+
         # Generate summary
         successful = len(
             [r for r in results if r.result == CycleResult.SUCCESS])
@@ -580,60 +909,71 @@ class CycleCollaboratorManager:
         except ValueError:
             return None
 
-    def display_repository_status(self, status: RepositoryStatus) -> None:
+    def display_repository_status(self, status: RepositoryStatus,
+                                  file: Optional[TextIO] = None) -> None:
         """Display repository status information in a user-friendly format."""
-        print("\n=== Repository Status ===")
-        print(f"Repository: {status.repo_url}")
-        print(f"Student: {status.username}")
-        print(f"Accessible: {'✅ Yes' if status.accessible else '❌ No'}")
+        lines = [
+            "\n=== Repository Status ===",
+            f"Repository: {status.repo_url}",
+            f"Student: {status.username}",
+            f"Accessible: {'✅ Yes' if status.accessible else '❌ No'}",
+        ]
 
         if status.accessible:
-            print(
-                f"Collaborator Access: {'✅ Yes' if status.has_collaborator_access else '❌ No'}")
-            print(
-                f"Pending Invitation: {'⏳ Yes' if status.has_pending_invitation else '✅ No'}")
-            print(
-                f"Status: {'✅ OK' if status.access_status == AccessStatus.OK else '🚨 CORRUPTED'}")
-            print(
-                f"Needs Cycling: {'🔄 Yes' if status.needs_cycling else '✅ No'}")
+            lines += [
+                f"Collaborator Access: {'✅ Yes' if status.has_collaborator_access else '❌ No'}",
+                f"Pending Invitation: {'⏳ Yes' if status.has_pending_invitation else '✅ No'}",
+                f"Status: {'✅ OK' if status.access_status == AccessStatus.OK else '🚨 CORRUPTED'}",
+                f"Needs Cycling: {'🔄 Yes' if status.needs_cycling else '✅ No'}",
+            ]
 
         if status.error_message:
-            print(f"Error: {status.error_message}")
+            lines.append(f"Error: {status.error_message}")
 
-    def display_cycle_result(self, result: CycleOperation) -> None:
+        _write_lines(lines, file)
+
+    def display_cycle_result(self, result: CycleOperation,
+                             file: Optional[TextIO] = None) -> None:
         """Display cycle operation result in a user-friendly format."""
-        print("\n=== Cycle Operation Result ===")
-        print(f"Repository: {result.repo_url}")
-        print(f"Student: {result.username}")
+        lines = [
+            "\n=== Cycle Operation Result ===",
+            f"Repository: {result.repo_url}",
+            f"Student: {result.username}",
+        ]
 
         if result.result == CycleResult.SUCCESS:
-            print("Result: ✅ SUCCESS")
+            lines.append("Result: ✅ SUCCESS")
         elif result.result == CycleResult.SKIPPED:
-            print("Result: ⏭️ SKIPPED")
+            lines.append("Result: ⏭️ SKIPPED")
         else:
-            print("Result: ❌ FAILED")
+            lines.append("Result: ❌ FAILED")
 
-        print(f"Message: {result.message}")
+        lines.append(f"Message: {result.message}")
 
         if result.actions_taken:
-            print("Actions Taken:")
-            for action in result.actions_taken:
-                print(f"  • {action}")
+            lines.append("Actions Taken:")
+            lines += [f"  • {action}" for action in result.actions_taken]
 
         if result.error:
-            print(f"Error Details: {result.error}")
+            lines.append(f"Error Details: {result.error}")
 
-    def display_batch_summary(self, summary: BatchSummary) -> None:
+        _write_lines(lines, file)
+
+    def display_batch_summary(self, summary: BatchSummary,
+                              file: Optional[TextIO] = None) -> None:
         """Display batch operation summary in a user-friendly format."""
-        print("\n=== Batch Operation Summary ===")
-        print(f"Total Repositories: {summary.total_repositories}")
-        print(f"Successful Operations: {summary.successful_operations}")
-        print(f"Skipped Operations: {summary.skipped_operations}")
-        print(f"Failed Operations: {summary.failed_operations}")
-        print(f"Repositories Fixed: {summary.repositories_fixed}")
-        print(f"Repositories Already OK: {summary.repositories_already_ok}")
+        lines = [
+            "\n=== Batch Operation Summary ===",
+            f"Total Repositories: {summary.total_repositories}",
+            f"Successful Operations: {summary.successful_operations}",
+            f"Skipped Operations: {summary.skipped_operations}",
+            f"Failed Operations: {summary.failed_operations}",
+            f"Repositories Fixed: {summary.repositories_fixed}",
+            f"Repositories Already OK: {summary.repositories_already_ok}",
+        ]
 
         if summary.errors:
-            print(f"\nErrors ({len(summary.errors)}):")
-            for error in summary.errors:
-                print(f"  • {error}")
+            lines.append(f"\nErrors ({len(summary.errors)}):")
+            lines += [f"  • {error}" for error in summary.errors]
+
+        _write_lines(lines, file)
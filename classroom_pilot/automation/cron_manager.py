@@ -20,6 +20,40 @@ from ..utils import get_logger
 
 logger = get_logger("automation.cron_manager")
 
+# Workflow log location, relative to the assignment root
+CRON_LOG_SUBPATH = Path("tools", "generated", "cron-workflow.log")
+
+
+def read_last_lines(path: Union[str, Path], count: int, block_size: int = 8192) -> List[str]:
+    """
+    Return the last ``count`` lines of a text file.
+
+    Blocks are read backwards from the end of the file until enough line
+    breaks have been seen, so only the tail of a large log is touched.
+
+    Args:
+        path: File to read
+        count: Number of lines to return
+        block_size: Bytes to read per backwards step
+
+    Returns:
+        Up to ``count`` lines, without line endings
+    """
+    if count <= 0:
+        return []
+
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+
+    return data.decode('utf-8', errors='replace').splitlines()[-count:]
+
 
 class CronJobType(Enum):
     """Supported cron job workflow types."""
@@ -116,8 +150,7 @@ class CronManager:
 
     def _get_log_file_path(self) -> Path:
         """Get path to the cron workflow log file."""
-        # Use current working directory + tools/generated
-        return Path.cwd() / "tools" / "generated" / "cron-workflow.log"
+        return Path.cwd() / CRON_LOG_SUBPATH
 
     def _get_assignment_config_path(self) -> Path:
         """Get path to the assignment configuration file."""
@@ -374,9 +407,17 @@ class CronManager:
             logger.warning(f"Error removing crontab: {e}")
             return True  # Assume success if crontab doesn't exist
 
-    def job_exists(self, steps: List[str]) -> bool:
-        """Check if cron job for given steps exists."""
-        current_crontab = self._get_current_crontab()
+    def job_exists(self, steps: List[str], current_crontab: Optional[str] = None) -> bool:
+        """
+        Check if cron job for given steps exists.
+
+        Args:
+            steps: Workflow steps of the job
+            current_crontab: Crontab content already read by the caller
+                ("" for none); read from the system when omitted
+        """
+        if current_crontab is None:
+            current_crontab = self._get_current_crontab()
         if not current_crontab:
             return False
 
@@ -412,8 +453,11 @@ class CronManager:
                     "; ".join(schedule_validation.errors)
                 return CronOperationResult.VALIDATION_ERROR, error_msg
 
+            # Read the crontab once for the existence check and the update
+            current_crontab = self._get_current_crontab()
+
             # Check if job already exists
-            if self.job_exists(steps):
+            if self.job_exists(steps, current_crontab or ""):
                 return CronOperationResult.ALREADY_EXISTS, f"Cron job for steps '{' '.join(steps)}' already exists"
 
             # Create cron job entry
@@ -421,8 +465,7 @@ class CronManager:
             command = self._get_cron_command(steps)
             cron_entry = f"{comment}\n{schedule} {command}"
 
-            # Get current crontab and add new entry
-            current_crontab = self._get_current_crontab()
+            # Add new entry to the current crontab
             if current_crontab:
                 new_crontab = f"{current_crontab.rstrip()}\n{cron_entry}\n"
             else:
@@ -570,10 +613,9 @@ class CronManager:
         if log_file_exists:
             try:
                 # Get last few lines from log file
-                with open(self.log_file_path, 'r') as f:
-                    lines = f.readlines()
-                    if lines:
-                        last_log_activity = "".join(lines[-3:]).strip()
+                lines = read_last_lines(self.log_file_path, 3)
+                if lines:
+                    last_log_activity = "\n".join(lines).strip()
             except Exception as e:
                 logger.warning(f"Could not read log file: {e}")
 
@@ -600,8 +642,6 @@ class CronManager:
             )
 
             if result.returncode == 0:
-                output = f"=== Recent Workflow Log Entries ===\n{result.stdout}\n"
-
                 # Add file info
                 stat = self.log_file_path.stat()
                 file_size = stat.st_size
@@ -615,11 +655,13 @@ class CronManager:
                 mod_time = datetime.fromtimestamp(
                     stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
 
-                output += "\n=== Log File Info ===\n"
-                output += f"File: {self.log_file_path}\n"
-                output += f"Size: {size_str}\n"
-                output += f"Last modified: {mod_time}\n"
-
+                output = (
+                    f"=== Recent Workflow Log Entries ===\n{result.stdout}\n"
+                    "\n=== Log File Info ===\n"
+                    f"File: {self.log_file_path}\n"
+                    f"Size: {size_str}\n"
+                    f"Last modified: {mod_time}\n"
+                )
                 return True, output
             else:
                 return False, f"Failed to read log file: {result.stderr}"
@@ -629,16 +671,16 @@ class CronManager:
 
     def list_default_schedules(self) -> str:
         """List default schedules for all workflow steps."""
-        output = "Default schedules for workflow steps:\n\n"
-
-        for job_type in CronJobType:
-            schedule = self.default_schedules[job_type]
-            output += f"  {job_type.value:<10} {schedule}\n"
-
-        output += "\nSchedule format: minute hour day_of_month month day_of_week\n"
-        output += "Examples:\n"
-        output += "  0 */4 * * *   - Every 4 hours\n"
-        output += "  0 2 * * *     - Daily at 2 AM\n"
-        output += "  0 6 * * 0     - Weekly on Sunday at 6 AM\n"
-
-        return output
+        parts = ["Default schedules for workflow steps:\n\n"]
+        parts.extend(
+            f"  {job_type.value:<10} {self.default_schedules[job_type]}\n"
+            for job_type in CronJobType
+        )
+        parts.append(
+            "\nSchedule format: minute hour day_of_month month day_of_week\n"
+            "Examples:\n"
+            "  0 */4 * * *   - Every 4 hours\n"
+            "  0 2 * * *     - Daily at 2 AM\n"
+            "  0 6 * * 0     - Weekly on Sunday at 6 AM\n"
+        )
+        return "".join(parts)
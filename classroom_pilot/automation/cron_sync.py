@@ -23,6 +23,7 @@ from dataclasses import dataclass
 
 from ..config import GlobalConfig
 from ..utils import get_logger
+from .cron_manager import CRON_LOG_SUBPATH, read_last_lines
 
 
 class WorkflowStep(Enum):
@@ -63,6 +64,40 @@ class CronSyncExecutionResult:
     error_summary: Optional[str] = None
 
 
+def validate_workflow_steps(steps: Optional[List[str]]) -> Tuple[bool, List[WorkflowStep], str]:
+    """
+    Validate and convert step names to WorkflowStep enums.
+
+    Args:
+        steps: List of step names to validate
+
+    Returns:
+        Tuple of (is_valid, valid_steps, error_message)
+    """
+    if not steps:
+        # Default to sync step for backward compatibility
+        return True, [WorkflowStep.SYNC], "Using default sync step"
+
+    valid_steps = []
+    invalid_steps = []
+
+    for step_name in steps:
+        try:
+            step = WorkflowStep(step_name.lower())
+            valid_steps.append(step)
+        except ValueError:
+            invalid_steps.append(step_name)
+
+    if invalid_steps:
+        valid_step_names = [step.value for step in WorkflowStep]
+        return False, [], (
+            f"Invalid step names: {invalid_steps}. "
+            f"Valid steps are: {valid_step_names}"
+        )
+
+    return True, valid_steps, f"Validated {len(valid_steps)} steps"
+
+
 class CronSyncManager:
     """
     Manager for automated workflow cron job execution.
@@ -88,8 +123,8 @@ class CronSyncManager:
         self.logger = get_logger("cron_sync")
 
         # Set up log file path
-        self.log_dir = self.assignment_root / "tools" / "generated"
-        self.log_file = self.log_dir / "cron-workflow.log"
+        self.log_file = self.assignment_root / CRON_LOG_SUBPATH
+        self.log_dir = self.log_file.parent
 
         # Ensure log directory exists
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -130,28 +165,7 @@ class CronSyncManager:
         Returns:
             Tuple of (is_valid, valid_steps, error_message)
         """
-        if not steps:
-            # Default to sync step for backward compatibility
-            return True, [WorkflowStep.SYNC], "Using default sync step"
-
-        valid_steps = []
-        invalid_steps = []
-
-        for step_name in steps:
-            try:
-                step = WorkflowStep(step_name.lower())
-                valid_steps.append(step)
-            except ValueError:
-                invalid_steps.append(step_name)
-
-        if invalid_steps:
-            valid_step_names = [step.value for step in WorkflowStep]
-            return False, [], (
-                f"Invalid step names: {invalid_steps}. "
-                f"Valid steps are: {valid_step_names}"
-            )
-
-        return True, valid_steps, f"Validated {len(valid_steps)} steps"
+        return validate_workflow_steps(steps)
 
     def rotate_log_if_needed(self) -> bool:
         """
@@ -372,9 +386,7 @@ class CronSyncManager:
             return []
 
         try:
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-                return [line.rstrip() for line in all_lines[-lines:]]
+            return [line.rstrip() for line in read_last_lines(self.log_file, lines)]
         except Exception as e:
             self.logger.error(f"Failed to read log file: {e}")
             return [f"Error reading log file: {e}"]
@@ -8,6 +8,7 @@ existing bash script functionality.
 
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -55,6 +56,29 @@ class BashWrapper:
         self.verbose = verbose
         self.auto_yes = auto_yes
 
+        # Per-session caches, only populated inside a ``with`` block
+        self._session_depth = 0
+        self._session_env: Optional[Dict[str, str]] = None
+        self._session_scripts: Dict[str, Path] = {}
+
+    def __enter__(self) -> "BashWrapper":
+        """
+        Start a session that reuses setup work across several scripts.
+
+        Inside the block the script environment is built once and script
+        paths are resolved once, instead of on every step. Sessions nest, and
+        the caches are dropped when the outermost block exits so later calls
+        see configuration or environment changes.
+        """
+        self._session_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._session_depth -= 1
+        if self._session_depth == 0:
+            self._session_env = None
+            self._session_scripts.clear()
+
     def _get_script_path(self, script_name: str) -> Path:
         """
         Get the path to a script using importlib.resources for proper resolution
@@ -86,7 +110,7 @@ class BashWrapper:
 
             except (ImportError, FileNotFoundError, AttributeError) as e:
                 logger.debug(
-                    f"importlib.resources approach failed: {e}, using fallback")
+                    "importlib.resources approach failed: %s, using fallback", e)
 
         # Fallback to direct filesystem access (for source checkouts or when importlib.resources fails)
         logger.debug("Using fallback filesystem access for script resolution")
@@ -156,9 +180,13 @@ class BashWrapper:
             True if script executed successfully, False otherwise
         """
         try:
-            script_path = self._get_script_path(script_name)
+            script_path = self._session_scripts.get(script_name)
+            if script_path is None:
+                script_path = self._get_script_path(script_name)
+                if self._session_depth:
+                    self._session_scripts[script_name] = script_path
         except FileNotFoundError as e:
-            logger.error(f"Script not found: {e}")
+            logger.error("Script not found: %s", e)
             return False
 
         # Prepare command
@@ -167,17 +195,22 @@ class BashWrapper:
             cmd.extend(args)
 
         # Prepare environment
-        env = self._prepare_environment()
+        if self._session_depth:
+            if self._session_env is None:
+                self._session_env = self._prepare_environment()
+            env = self._session_env
+        else:
+            env = self._prepare_environment()
 
         # Set working directory (use current working directory by default)
         if cwd is None:
             cwd = Path.cwd()
 
-        logger.debug(f"Executing: {' '.join(cmd)}")
-        logger.debug(f"Working directory: {cwd}")
+        logger.debug("Executing: %s", ' '.join(cmd))
+        logger.debug("Working directory: %s", cwd)
 
         if self.dry_run:
-            logger.info(f"[DRY RUN] Would execute: {' '.join(cmd)}")
+            logger.info("[DRY RUN] Would execute: %s", ' '.join(cmd))
             return True
 
         try:
@@ -192,27 +225,28 @@ class BashWrapper:
             )
 
             if result.returncode == 0:
-                logger.debug(f"Script {script_name} completed successfully")
+                logger.debug("Script %s completed successfully", script_name)
                 if not self.verbose and result.stdout:
                     logger.info(result.stdout.strip())
                 return True
             else:
                 logger.error(
-                    f"Script {script_name} failed with exit code {result.returncode}")
+                    "Script %s failed with exit code %s",
+                    script_name, result.returncode)
                 if result.stderr:
-                    logger.error(f"Error output: {result.stderr.strip()}")
+                    logger.error("Error output: %s", result.stderr.strip())
                 if result.stdout:
-                    logger.error(f"Standard output: {result.stdout.strip()}")
+                    logger.error("Standard output: %s", result.stdout.strip())
                 return False
 
         except subprocess.TimeoutExpired:
-            logger.error(f"Script {script_name} timed out after 1 hour")
+            logger.error("Script %s timed out after 1 hour", script_name)
             return False
         except subprocess.CalledProcessError as e:
-            logger.error(f"Script {script_name} failed: {e}")
+            logger.error("Script %s failed: %s", script_name, e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error executing {script_name}: {e}")
+            logger.error("Unexpected error executing %s: %s", script_name, e)
             return False
 
     def assignment_orchestrator(self, workflow_type: str = "run") -> bool:
@@ -226,7 +260,7 @@ class BashWrapper:
             True if successful, False otherwise
         """
         logger.info(
-            f"🎯 Running assignment orchestrator workflow: {workflow_type}")
+            "🎯 Running assignment orchestrator workflow: %s", workflow_type)
 
         args = []
         if workflow_type != "run":
@@ -234,6 +268,52 @@ class BashWrapper:
 
         return self._execute_script("assignment-orchestrator.sh", args)
 
+    def assignment_orchestrator_concurrent(self) -> bool:
+        """
+        Execute the orchestrator workflow one step at a time, running the
+        secrets and assist steps concurrently.
+
+        Both steps only depend on repository discovery and spend most of
+        their time waiting on GitHub, so overlapping them shortens the run.
+        Step failures are handled as in the orchestrator's own workflow:
+        a failed discovery skips the steps that need student repositories.
+        Each step runs with --yes, so callers must confirm beforehand.
+
+        Returns:
+            True if every step succeeded, False otherwise
+        """
+        logger.info(
+            "🎯 Running assignment orchestrator workflow with concurrent steps")
+
+        def run_step(step: str) -> bool:
+            return self._execute_script(
+                "assignment-orchestrator.sh", ["--step", step, "--yes"])
+
+        failed_steps = []
+        with self:
+            if not run_step("sync"):
+                failed_steps.append("sync")
+
+            if run_step("discover"):
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    results = dict(zip(
+                        ("secrets", "assist"),
+                        executor.map(run_step, ("secrets", "assist"))))
+                failed_steps.extend(
+                    step for step, ok in results.items() if not ok)
+
+                if not run_step("cycle"):
+                    failed_steps.append("cycle")
+            else:
+                logger.warning(
+                    "Repository discovery failed - skipping steps that require student repositories")
+
+        if failed_steps:
+            logger.error("The following steps failed: %s",
+                         ", ".join(failed_steps))
+            return False
+        return True
+
     def push_to_classroom(self) -> bool:
         """
         Execute the push to classroom script.
@@ -291,7 +371,7 @@ class BashWrapper:
 
         except ImportError as e:
             logger.error(
-                f"Failed to import Python secrets implementation: {e}")
+                "Failed to import Python secrets implementation: %s", e)
             logger.info("Falling back to bash script implementation")
             # Fallback to bash script
             return self._execute_script("add-secrets-to-students.sh", cwd=assignment_root)
@@ -336,7 +416,7 @@ class BashWrapper:
         Returns:
             True if successful, False otherwise
         """
-        logger.info(f"⏰ Managing cron: {action}")
+        logger.info("⏰ Managing cron: %s", action)
         return self._execute_script("manage-cron.sh", [action])
 
     def cron_sync(self) -> bool:
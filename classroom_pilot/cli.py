@@ -10,23 +10,168 @@ This module provides:
   repositories, secrets, and automation workflows
 """
 
+import os
 import sys
-import typer
-from pathlib import Path
-from typing import Optional, List
 
-from .utils import setup_logging, get_logger
-from .assignments.setup import AssignmentSetup
-from .config.global_config import load_global_config, get_global_config
+# Top-level command groups, served by the completion fast path below before
+# Typer is imported. The groups are registered under these names, in order.
+_TOP_LEVEL_COMMANDS = ("assignments", "repos", "secrets", "automation", "config")
+
+
+def _complete_top_level_fast() -> None:
+    """
+    Answer bash completion of the first argument without loading Typer.
+
+    The completion script installed by ``--install-completion`` re-runs the
+    CLI with ``_CLASSROOM_PILOT_COMPLETE=complete_bash`` on every <TAB>. When
+    the word being completed is the command group itself, the answer is a
+    static list, so it is printed here and the process exits. Every other
+    completion request falls through to Typer.
+    """
+    if os.environ.get("_CLASSROOM_PILOT_COMPLETE") != "complete_bash":
+        return
+    try:
+        cword = int(os.environ["COMP_CWORD"])
+        words = os.environ["COMP_WORDS"].split()
+    except (KeyError, ValueError):
+        return
+    if cword != 1:
+        return
+
+    incomplete = words[1] if len(words) > 1 else ""
+    if incomplete.startswith("-"):
+        return
+
+    print("\n".join(name for name in _TOP_LEVEL_COMMANDS
+                    if name.startswith(incomplete)))
+    sys.exit(0)
+
+
+def _version_text() -> str:
+    """Return the text printed by ``--version``."""
+    from . import __version__
+    return (f"Classroom Pilot {__version__}\n"
+            "Modular Python CLI for GitHub Classroom automation\n"
+            "https://github.com/hugo-valle/classroom-pilot")
+
+
+def _is_cli_process() -> bool:
+    """Return True when this process was started as the classroom-pilot CLI."""
+    program = sys.argv[0] if sys.argv else ""
+    name = os.path.splitext(os.path.basename(program))[0]
+    return name == "classroom-pilot" or program.endswith(
+        os.path.join("classroom_pilot", "__main__.py"))
+
+
+# Main callback options that take a value, as declared on main() below
+_VALUE_OPTIONS = ("--config", "--assignment-root")
+
+
+def _version_requested(args) -> bool:
+    """
+    Return True if ``--version`` appears among the leading group options.
+
+    Click handles eager options in command-line order and only before the
+    first subcommand, so the scan stops at the first token that is not one
+    of main()'s options (a subcommand, ``--help``, or anything unknown).
+    """
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--version":
+            return True
+        if arg in _VALUE_OPTIONS:
+            i += 2
+        elif arg.split("=", 1)[0] in _VALUE_OPTIONS:
+            i += 1
+        else:
+            return False
+    return False
+
+
+def _version_fast() -> None:
+    """
+    Print ``classroom-pilot --version`` without building the Typer app.
+
+    ``--version`` is answered here whenever Typer would answer it, i.e.
+    when it comes before any subcommand; other invocations go through
+    Typer and version_callback, which prints the same text.
+    """
+    if _version_requested(sys.argv[1:]) and _is_cli_process():
+        print(_version_text())
+        sys.exit(0)
+
+
+_complete_top_level_fast()
+_version_fast()
+
+import bisect  # noqa: E402
+import importlib  # noqa: E402
+import logging  # noqa: E402
+import string  # noqa: E402
+import typer  # noqa: E402
+from datetime import datetime, timezone  # noqa: E402
+from pathlib import Path  # noqa: E402
+from functools import lru_cache, wraps  # noqa: E402
+from typing import Any, Dict, NamedTuple, Optional, List, Tuple  # noqa: E402
+
+from .utils import setup_logging, get_logger  # noqa: E402
+from .utils.file_cache import FileParseCache, read_list_file  # noqa: E402
 
 # Initialize logger
 logger = get_logger("cli")
 
+# Whether this process was started to show help; sys.argv does not change
+_HELP_MODE = '--help' in sys.argv or '-h' in sys.argv
+
+
+# Submodules imported by command handlers, memoized by _lazy()
+_IMPORT_CACHE: Dict[str, Any] = {}
+
+
+def _lazy(module: str):
+    """
+    Import a submodule of this package on first use and memoize it.
+
+    Command handlers resolve their services through this instead of
+    function-level imports, so only the commands that run load their
+    dependencies. Attributes are looked up on the returned module at call
+    time, so patched classes are still picked up.
+    """
+    mod = _IMPORT_CACHE.get(module)
+    if mod is None:
+        mod = _IMPORT_CACHE[module] = importlib.import_module(
+            module, __package__)
+    return mod
+
+
+def get_global_config():
+    """Return the global configuration loaded by the main callback, if any."""
+    return _lazy(".config.global_config").get_global_config()
+
+
+@lru_cache(maxsize=32)
+def _as_path(value: Optional[str]) -> Optional[Path]:
+    """Return value as a Path, or None if it is empty (paths are immutable, so cached)."""
+    return Path(value) if value else None
+
+
+# Parsed repository lists, reused while unchanged on disk
+_STUDENT_REPOS_CACHE = FileParseCache(maxsize=8)
+
+
+def _read_student_repos(path: Path, size: int) -> List[str]:
+    """Parse a repository list of ``size`` bytes."""
+    return read_list_file(path, size)
+
 
 def load_student_repos(file_path: str = "student-repos.txt") -> List[str]:
     """
     Load student repository URLs from file.
 
+    The parsed list is reused while the file's mtime and size are unchanged,
+    so repeated calls in one process do not re-read it.
+
     Args:
         file_path: Path to file containing repository URLs
 
@@ -36,20 +181,22 @@ def load_student_repos(file_path: str = "student-repos.txt") -> List[str]:
     Raises:
         FileNotFoundError: If file doesn't exist
     """
-    from pathlib import Path
-
-    repo_file = Path(file_path)
-    if not repo_file.exists():
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Repository file not found: {file_path}")
 
-    repos = []
-    with open(repo_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                repos.append(line)
+    return _STUDENT_REPOS_CACHE.load(
+        file_path, lambda path: _read_student_repos(path, stat.st_size), stat)
+
 
-    return repos
+# Whether stdout is a terminal, checked once. The selector drops its emoji
+# markers when output goes to a pipe or CI log instead.
+_STDOUT_IS_TTY = bool(sys.stdout and sys.stdout.isatty())
+
+# Selector markers: (list, prompt, selected, cancelled, warning)
+_SELECTOR_MARKS = (("📚 ", "👉 ", "✅ ", "❌ ", "⚠️  ") if _STDOUT_IS_TTY
+                   else ("", "", "", "", ""))
 
 
 def select_student_repo_interactive(repos: List[str]) -> Optional[str]:
@@ -65,49 +212,194 @@ def select_student_repo_interactive(repos: List[str]) -> Optional[str]:
     if not repos:
         return None
 
-    print("\n📚 Available student repositories:\n")
-    for i, repo in enumerate(repos, 1):
-        # Extract student name from URL
-        student_name = repo.split('/')[-1]
-        print(f"  {i}. {student_name}")
-        print(f"     {repo}")
+    list_mark, prompt_mark, ok_mark, cancel_mark, warn_mark = _SELECTOR_MARKS
 
-    print(f"\n  0. Cancel")
+    # Render the whole menu with a single write; the student name is the
+    # last component of the repository URL
+    lines = [f"\n{list_mark}Available student repositories:\n\n"]
+    lines.extend(f"  {i}. {repo.rpartition('/')[2]}\n     {repo}\n"
+                 for i, repo in enumerate(repos, 1))
+    lines.append("\n  0. Cancel\n")
+    sys.stdout.write("".join(lines))
+    sys.stdout.flush()
 
     while True:
         try:
-            choice = input("\n👉 Select a repository (enter number): ").strip()
+            choice = input(f"\n{prompt_mark}Select a repository (enter number): ").strip()
             if not choice:
                 continue
 
             choice_num = int(choice)
 
             if choice_num == 0:
-                print("❌ Cancelled")
+                print(f"{cancel_mark}Cancelled")
                 return None
 
             if 1 <= choice_num <= len(repos):
                 selected = repos[choice_num - 1]
-                student_name = selected.split('/')[-1]
-                print(f"✅ Selected: {student_name}")
+                student_name = selected.rpartition('/')[2]
+                print(f"{ok_mark}Selected: {student_name}")
                 return selected
             else:
-                print(f"⚠️  Please enter a number between 0 and {len(repos)}")
+                print(f"{warn_mark}Please enter a number between 0 and {len(repos)}")
 
         except ValueError:
-            print("⚠️  Please enter a valid number")
+            print(f"{warn_mark}Please enter a valid number")
         except KeyboardInterrupt:
-            print("\n❌ Cancelled")
+            print(f"\n{cancel_mark}Cancelled")
             return None
 
 
+def _resolve_repo_url(repo_url: Optional[str], repo_file: str) -> str:
+    """
+    Return repo_url, or let the user pick one from the repository list file.
+
+    Args:
+        repo_url: Repository URL given on the command line, if any
+        repo_file: File with student repository URLs to choose from
+
+    Returns:
+        The repository URL to operate on
+
+    Raises:
+        typer.Exit: With code 1 if the file is missing or empty, or code 0
+            if the user cancels the selection
+    """
+    if repo_url:
+        return repo_url
+
+    try:
+        repos = load_student_repos(repo_file)
+        if not repos:
+            logger.error("No repositories found in %s", repo_file)
+    except FileNotFoundError:
+        logger.error("Repository file not found: %s", repo_file)
+        repos = []
+
+    if not repos:
+        logger.info("💡 To generate a student repository list, run:")
+        logger.info("   $ classroom-pilot repos fetch")
+        raise typer.Exit(code=1)
+
+    repo_url = select_student_repo_interactive(repos)
+    if not repo_url:
+        raise typer.Exit(code=0)  # User cancelled
+
+    return repo_url
+
+
+# Dry-run report lines per command. A line is skipped when a field it
+# references is None (e.g. an option that was not given).
+_DRY_RUN_MESSAGES: Dict[str, Tuple[str, ...]] = {
+    "assignments.validate-config": (
+        "DRY RUN: Would validate configuration file: {config_file}",),
+    "assignments.cycle-collaborator": (
+        "DRY RUN: Would cycle collaborator {username} on {repo_url}",
+        "DRY RUN: Force mode: {force}",
+        "DRY RUN: Config file: {config_file}"),
+    "assignments.cycle-collaborators": (
+        "DRY RUN: Would cycle collaborator permissions for batch",
+        "Batch file: {batch_file}",
+        "Repository URL mode: {repo_url_mode}",
+        "Force mode: {force}"),
+    "repos.fetch": (
+        "DRY RUN: Would fetch student repositories using config: {config_file}",),
+    "secrets.add": (
+        "DRY RUN: Would add secrets to student repositories",
+        "DRY RUN: Would process {repo_count} specified repositories",
+        "DRY RUN: Would use assignment root: {assignment_root}"),
+    "automation.cron-install": (
+        "DRY RUN: Would install cron job for steps: {steps}",
+        "DRY RUN: Schedule: {schedule}",
+        "DRY RUN: Config file: {config_file}"),
+    "automation.cron-status": (
+        "DRY RUN: Would check cron job status",
+        "DRY RUN: Config file: {config_file}"),
+    "automation.cron-sync": (
+        "📋 Workflow steps that would be executed:\n{step_list}",
+        "📂 Log file: {log_file}",
+        "✅ Dry run completed - use without --dry-run to execute"),
+}
+
+_FORMATTER = string.Formatter()
+
+
+def _log_dry_run(command: str, **fields: Any) -> None:
+    """
+    Log what a command would do in dry-run mode.
+
+    Args:
+        command: Key into _DRY_RUN_MESSAGES ("group.command")
+        **fields: Values for the message placeholders
+    """
+    for line in _DRY_RUN_MESSAGES[command]:
+        names = [name for _, name, _, _ in _FORMATTER.parse(line) if name]
+        if any(fields.get(name) is None for name in names):
+            continue
+        logger.info(line.format(**fields))
+
+
+# Options shared by several commands, built once at import time
+DEFAULT_CONFIG_FILE = "assignment.conf"
+_CONFIG_OPTION = typer.Option(
+    DEFAULT_CONFIG_FILE, "--config", "-c", help="Configuration file path")
+_YES_OPTION = typer.Option(
+    False, "--yes", "-y", help="Automatically confirm all prompts")
+_VERBOSE_OPTION = typer.Option(
+    False, "--verbose", "-v", help="Enable verbose output")
+
+
+def _cli_command(failure_message: str):
+    """
+    Turn unexpected exceptions from a command into a logged error and exit code 1.
+
+    The traceback is attached only when debug logging is on (``--verbose``).
+
+    Args:
+        failure_message: Prefix for the error line, e.g. "Cron sync workflow failed"
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except typer.Exit:
+                raise
+            except Exception as e:
+                logger.error("%s: %s", failure_message, e,
+                             exc_info=logger.isEnabledFor(logging.DEBUG))
+                raise typer.Exit(code=1)
+        return wrapper
+    return decorator
+
+
+def _confirm(message: str, default: bool = False) -> bool:
+    """
+    Ask a yes/no question, taking ``default`` when stdin has no answer to give.
+
+    Answers piped into a non-interactive run are still read; only end of
+    input (e.g. stdin closed or /dev/null under CI) falls back to ``default``
+    instead of aborting. At a terminal, Ctrl-C/Ctrl-D still abort.
+    """
+    try:
+        return typer.confirm(message, default=default)
+    except typer.Abort:
+        if sys.stdin is not None and sys.stdin.isatty():
+            raise
+        return default
+
+
+class GlobalOpts(NamedTuple):
+    """Universal options handed to subcommands through ``ctx.obj``."""
+    verbose: bool = False
+    dry_run: bool = False
+    assignment_root: Optional[Path] = None
+
+
 def version_callback(value: bool):
     """Callback to handle --version flag."""
     if value:
-        from . import __version__
-        typer.echo(f"Classroom Pilot {__version__}")
-        typer.echo("Modular Python CLI for GitHub Classroom automation")
-        typer.echo("https://github.com/hugo-valle/classroom-pilot")
+        sys.stdout.write(_version_text() + "\n")
         raise typer.Exit()
 
 
@@ -128,7 +420,7 @@ def main(
         help="Show the application version and exit."
     ),
     config_file: str = typer.Option(
-        "assignment.conf",
+        DEFAULT_CONFIG_FILE,
         "--config",
         help="Configuration file to load (default: assignment.conf)"
     ),
@@ -147,137 +439,100 @@ def main(
     # Set up logging first
     setup_logging()
 
-    # Skip configuration loading if we're just showing help
-    # Check multiple ways to detect help mode:
-    # 1. sys.argv for terminal usage
-    # 2. context args for CliRunner usage
-    # 3. Resilient parsing mode
-    if '--help' in sys.argv or '-h' in sys.argv:
-        return
+    # Resolve --assignment-root once; groups add their options to this
+    assignment_root_path = _as_path(assignment_root)
+    ctx.obj = GlobalOpts(assignment_root=assignment_root_path)
 
-    # Check context args (works with CliRunner for main command help)
-    if '--help' in ctx.args or '-h' in ctx.args:
-        return
-
-    # Also skip if this is resilient parsing mode
-    if ctx.resilient_parsing:
+    # Skip configuration loading if we're just showing help. Help is
+    # detected from sys.argv (terminal usage, checked once at import), the
+    # context args (CliRunner usage) and resilient parsing (completion).
+    if (_HELP_MODE or ctx.resilient_parsing
+            or '--help' in ctx.args or '-h' in ctx.args):
         return
 
     # Try to load global configuration (don't fail if not found, some commands create it)
+    load_global_config = _lazy(".config.global_config").load_global_config
+
     try:
-        assignment_root_path = Path(
-            assignment_root) if assignment_root else None
         load_global_config(config_file, assignment_root_path)
         # Only log success at DEBUG level to avoid polluting help output
         logger.debug("✅ Global configuration loaded and ready")
     except FileNotFoundError:
         # Config file not found - this is OK for commands like 'assignments setup'
         logger.debug(
-            f"Configuration file {config_file} not found - will be created by setup command")
+            "Configuration file %s not found - will be created by setup command", config_file)
     except Exception as e:
-        logger.warning(f"Failed to load configuration: {e}")
+        logger.warning("Failed to load configuration: %s", e)
         logger.debug(
             "Some commands may not work properly without configuration")
 
 
-# Create subcommand groups
-assignments_app = typer.Typer(
-    help="Assignment setup, orchestration, and management commands")
-repos_app = typer.Typer(
-    help="Repository operations and collaborator management commands")
-secrets_app = typer.Typer(help="Secret and token management commands")
-automation_app = typer.Typer(
-    help="Automation, scheduling, and batch processing commands")
-config_app = typer.Typer(
-    help="Configuration and token management commands")
-
-
-# Universal options callback for assignments commands
-@assignments_app.callback()
-def assignments_callback(
-    ctx: typer.Context,
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Enable verbose output"
-    ),
-    dry_run: bool = typer.Option(
-        False, "--dry-run", help="Show what would be done without executing"
-    )
-):
-    """Assignment setup, orchestration, and management commands."""
-    if verbose:
-        setup_logging(verbose=True)
-    # Store options in context for child commands to access
-    ctx.ensure_object(dict)
-    ctx.obj['verbose'] = verbose
-    ctx.obj['dry_run'] = dry_run
-
-
-# Universal options callback for repos commands
-@repos_app.callback()
-def repos_callback(
-    ctx: typer.Context,
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Enable verbose output"
-    ),
-    dry_run: bool = typer.Option(
-        False, "--dry-run", help="Show what would be done without executing"
-    )
-):
-    """Repository operations and collaborator management commands."""
-    if verbose:
-        setup_logging(verbose=True)
-    # Store options in context for child commands to access
-    ctx.ensure_object(dict)
-    ctx.obj['verbose'] = verbose
-    ctx.obj['dry_run'] = dry_run
-
+def _make_group(help_: str, universal_options: bool = True) -> typer.Typer:
+    """
+    Create a subcommand group.
 
-# Universal options callback for secrets commands
-@secrets_app.callback()
-def secrets_callback(
-    ctx: typer.Context,
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Enable verbose output"
-    ),
-    dry_run: bool = typer.Option(
-        False, "--dry-run", help="Show what would be done without executing"
-    )
-):
-    """Secret and token management commands."""
-    if verbose:
-        setup_logging(verbose=True)
-    # Store options in context for child commands to access
-    ctx.ensure_object(dict)
-    ctx.obj['verbose'] = verbose
-    ctx.obj['dry_run'] = dry_run
+    Groups with universal options get a callback accepting --verbose and
+    --dry-run, which stores them in ``ctx.obj`` as GlobalOpts for the
+    group's commands.
+    """
+    group = typer.Typer(help=help_)
+    if not universal_options:
+        return group
+
+    @group.callback()
+    def callback(
+        ctx: typer.Context,
+        verbose: bool = typer.Option(
+            False, "--verbose", "-v", help="Enable verbose output"
+        ),
+        dry_run: bool = typer.Option(
+            False, "--dry-run", help="Show what would be done without executing"
+        )
+    ):
+        if verbose:
+            setup_logging(verbose=True)
+        # Store options in context for child commands to access, keeping
+        # what main() resolved
+        base = ctx.obj if isinstance(ctx.obj, GlobalOpts) else GlobalOpts()
+        ctx.obj = base._replace(verbose=verbose, dry_run=dry_run)
 
+    callback.__doc__ = help_
+    return group
 
-# Universal options callback for automation commands
-@automation_app.callback()
-def automation_callback(
-    ctx: typer.Context,
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Enable verbose output"
-    ),
-    dry_run: bool = typer.Option(
-        False, "--dry-run", help="Show what would be done without executing"
-    )
-):
-    """Automation, scheduling, and batch processing commands."""
-    if verbose:
-        setup_logging(verbose=True)
-    # Store options in context for child commands to access
-    ctx.ensure_object(dict)
-    ctx.obj['verbose'] = verbose
-    ctx.obj['dry_run'] = dry_run
 
+def _groups_to_register() -> Tuple[str, ...]:
+    """
+    Return the names of the subcommand groups to add to the main app.
 
-# Add subcommand groups to main app
-app.add_typer(assignments_app, name="assignments")
-app.add_typer(repos_app, name="repos")
-app.add_typer(secrets_app, name="secrets")
-app.add_typer(automation_app, name="automation")
-app.add_typer(config_app, name="config")
+    Typer builds the click command tree for every registered group when the
+    app runs. If this process was started to run one group (its name is the
+    first argument), only that group is registered; every other case (root
+    help, completion, root options before the group, or importing this
+    module) registers all of them.
+    """
+    if (_is_cli_process() and sys.argv[1:2]
+            and sys.argv[1] in _TOP_LEVEL_COMMANDS
+            and "_CLASSROOM_PILOT_COMPLETE" not in os.environ):
+        return (sys.argv[1],)
+    return _TOP_LEVEL_COMMANDS
+
+
+# Create subcommand groups and add them to the main app
+assignments_app = _make_group(
+    "Assignment setup, orchestration, and management commands")
+repos_app = _make_group(
+    "Repository operations and collaborator management commands")
+secrets_app = _make_group("Secret and token management commands")
+automation_app = _make_group(
+    "Automation, scheduling, and batch processing commands")
+config_app = _make_group(
+    "Configuration and token management commands", universal_options=False)
+
+_registered = _groups_to_register()
+for _name, _group in zip(_TOP_LEVEL_COMMANDS, (
+        assignments_app, repos_app, secrets_app, automation_app, config_app)):
+    if _name in _registered:
+        app.add_typer(_group, name=_name)
 
 
 # Assignment Commands
@@ -307,34 +562,32 @@ def assignment_setup(
         $ classroom-pilot assignments setup --url "https://classroom.github.com/..."
     """
     # Access universal options from context
-    verbose = ctx.obj.get('verbose', False)
-    dry_run = ctx.obj.get('dry_run', False)
-
-    setup_logging(verbose)
+    verbose = ctx.obj.verbose
+    dry_run = ctx.obj.dry_run
 
     # Delegate to AssignmentService (including dry-run logic)
     try:
-        from .services.assignment_service import AssignmentService
+        AssignmentService = _lazy(
+            ".services.assignment_service").AssignmentService
 
         service = AssignmentService(dry_run=dry_run, verbose=verbose)
         ok, message = service.setup(url=url, simplified=simplified)
-
-        if not ok:
-            logger.error(message)
-            raise typer.Exit(code=1)
-
-        logger.info(f"✅ {message}")
-
     except Exception as e:
-        logger.error(f"Assignment setup failed: {e}")
+        logger.error("Assignment setup failed: %s", e)
+        raise typer.Exit(code=1)
+
+    if not ok:
+        logger.error(message)
         raise typer.Exit(code=1)
 
+    logger.info("✅ %s", message)
+
 
 @assignments_app.command("validate-config")
 def assignment_validate_config(
     ctx: typer.Context,
     config_file: str = typer.Option(
-        "assignment.conf", "--config-file", "-c", help="Configuration file path to validate"
+        DEFAULT_CONFIG_FILE, "--config-file", "-c", help="Configuration file path to validate"
     )
 ):
     """
@@ -345,53 +598,44 @@ def assignment_validate_config(
         $ classroom-pilot assignments validate-config --config-file custom.conf
     """
     # Access universal options from context
-    verbose = ctx.obj.get('verbose', False)
-    dry_run = ctx.obj.get('dry_run', False)
-
-    setup_logging(verbose)
+    verbose = ctx.obj.verbose
+    dry_run = ctx.obj.dry_run
 
-    # Get assignment_root from parent context if it was specified
-    assignment_root = ctx.parent.parent.params.get(
-        'assignment_root', None) if ctx.parent and ctx.parent.parent else None
-
-    # Resolve config file path relative to assignment_root if specified
+    # Resolve config file path relative to --assignment-root if specified
+    assignment_root = ctx.obj.assignment_root
     if assignment_root and not Path(config_file).is_absolute():
-        config_file = str(Path(assignment_root) / config_file)
+        config_file = str(assignment_root / config_file)
 
     if dry_run:
-        logger.info(
-            f"DRY RUN: Would validate configuration file: {config_file}")
-        return
+        return _log_dry_run("assignments.validate-config", config_file=config_file)
 
     # Delegate to AssignmentService
     try:
-        from .services.assignment_service import AssignmentService
+        AssignmentService = _lazy(
+            ".services.assignment_service").AssignmentService
 
         service = AssignmentService(dry_run=dry_run, verbose=verbose)
         ok, message = service.validate_config(config_file=config_file)
-
-        if not ok:
-            logger.error(message)
-            raise typer.Exit(code=1)
-
-        logger.info(f"✅ {message}")
-
     except Exception as e:
-        logger.error(f"Configuration validation failed: {e}")
+        logger.error("Configuration validation failed: %s", e)
         raise typer.Exit(code=1)
 
+    if not ok:
+        logger.error(message)
+        raise typer.Exit(code=1)
+
+    logger.info("✅ %s", message)
+
 
 @assignments_app.command("orchestrate")
 def assignment_orchestrate(
     ctx: typer.Context,
-    force_yes: bool = typer.Option(
-        False, "--yes", "-y", help="Automatically confirm all prompts"),
+    force_yes: bool = _YES_OPTION,
     step: str = typer.Option(
         None, "--step", help="Execute only a specific step (sync, discover, secrets, assist, cycle)"),
     skip_steps: str = typer.Option(
         None, "--skip", help="Skip specific steps (comma-separated: sync,discover,secrets,assist,cycle)"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Execute complete assignment workflow with comprehensive orchestration.
@@ -408,15 +652,14 @@ def assignment_orchestrate(
         $ classroom-pilot assignments orchestrate --config my-assignment.conf
     """
     # Get universal options from context
-    dry_run = ctx.obj.get('dry_run', False)
-    verbose = ctx.obj.get('verbose', False)
-
-    setup_logging(verbose)
+    dry_run = ctx.obj.dry_run
+    verbose = ctx.obj.verbose
     logger.info("Starting assignment orchestration")
 
     # Delegate to AssignmentService
     try:
-        from .services.assignment_service import AssignmentService
+        AssignmentService = _lazy(
+            ".services.assignment_service").AssignmentService
 
         service = AssignmentService(dry_run=dry_run, verbose=verbose)
         ok, message = service.orchestrate(
@@ -425,17 +668,16 @@ def assignment_orchestrate(
             step=step,
             skip_steps=skip_steps
         )
-
-        if not ok:
-            logger.error(message)
-            raise typer.Exit(code=1)
-
-        logger.info(f"✅ {message}")
-
     except Exception as e:
-        logger.error(f"Assignment orchestration failed: {e}")
+        logger.error("Assignment orchestration failed: %s", e)
         raise typer.Exit(code=1)
 
+    if not ok:
+        logger.error(message)
+        raise typer.Exit(code=1)
+
+    logger.info("✅ %s", message)
+
 
 @assignments_app.command("help-student")
 def help_student(
@@ -444,13 +686,11 @@ def help_student(
         None, help="Student repository URL (or leave empty to select from student-repos.txt)"),
     one_student: bool = typer.Option(
         False, "--one-student", help="Use template directly (bypass classroom repository)"),
-    auto_confirm: bool = typer.Option(
-        False, "--yes", "-y", help="Automatically confirm all prompts"),
+    auto_confirm: bool = _YES_OPTION,
     repo_file: str = typer.Option(
         "student-repos.txt", "--file", "-f",
         help="File containing student repository URLs for interactive selection"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Help a specific student with repository updates.
@@ -463,34 +703,16 @@ def help_student(
         $ classroom-pilot assignments help-student --one-student https://github.com/org/assignment-student123
     """
     # Access universal options from context
-    verbose = ctx.obj.get('verbose', False)
-    dry_run = ctx.obj.get('dry_run', False)
-
-    setup_logging(verbose)
+    verbose = ctx.obj.verbose
+    dry_run = ctx.obj.dry_run
 
     # If no repo_url provided, load from file and allow selection
-    if not repo_url:
-        try:
-            repos = load_student_repos(repo_file)
-            if not repos:
-                logger.error(f"No repositories found in {repo_file}")
-                logger.info("💡 To generate a student repository list, run:")
-                logger.info("   $ classroom-pilot repos fetch")
-                raise typer.Exit(code=1)
-
-            repo_url = select_student_repo_interactive(repos)
-            if not repo_url:
-                raise typer.Exit(code=0)  # User cancelled
-
-        except FileNotFoundError:
-            logger.error(f"Repository file not found: {repo_file}")
-            logger.info("💡 To generate a student repository list, run:")
-            logger.info("   $ classroom-pilot repos fetch")
-            raise typer.Exit(code=1)
+    repo_url = _resolve_repo_url(repo_url, repo_file)
 
     # Delegate to AssignmentService
     try:
-        from .services.assignment_service import AssignmentService
+        AssignmentService = _lazy(
+            ".services.assignment_service").AssignmentService
 
         service = AssignmentService(dry_run=dry_run, verbose=verbose)
         ok, message = service.help_student(
@@ -499,17 +721,16 @@ def help_student(
             auto_confirm=auto_confirm,
             config_file=config_file
         )
-
-        if not ok:
-            logger.error(message)
-            raise typer.Exit(code=1)
-
-        logger.info(f"✅ {message}")
-
     except Exception as e:
-        logger.error(f"Student assistance failed: {e}")
+        logger.error("Student assistance failed: %s", e)
         raise typer.Exit(code=1)
 
+    if not ok:
+        logger.error(message)
+        raise typer.Exit(code=1)
+
+    logger.info("✅ %s", message)
+
 
 @assignments_app.command("help-students")
 def help_students(
@@ -517,10 +738,8 @@ def help_students(
     repo_file: str = typer.Option(
         "student-repos.txt", "--file", "-f",
         help="File containing student repository URLs (default: student-repos.txt)"),
-    auto_confirm: bool = typer.Option(
-        False, "--yes", "-y", help="Automatically confirm all prompts"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    auto_confirm: bool = _YES_OPTION,
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Help multiple students with repository updates (batch processing).
@@ -537,22 +756,20 @@ def help_students(
         $ classroom-pilot assignments help-students --file custom-repos.txt
     """
     # Access universal options from context
-    verbose = ctx.obj.get('verbose', False)
-    dry_run = ctx.obj.get('dry_run', False)
-
-    setup_logging(verbose)
+    verbose = ctx.obj.verbose
+    dry_run = ctx.obj.dry_run
 
     # Check if repo_file exists
-    from pathlib import Path
-    if not Path(repo_file).exists():
-        logger.error(f"Repository file not found: {repo_file}")
+    if not os.path.exists(repo_file):
+        logger.error("Repository file not found: %s", repo_file)
         logger.info("💡 To generate a student repository list, run:")
         logger.info("   $ classroom-pilot repos fetch")
         raise typer.Exit(code=1)
 
     # Delegate to AssignmentService
     try:
-        from .services.assignment_service import AssignmentService
+        AssignmentService = _lazy(
+            ".services.assignment_service").AssignmentService
 
         service = AssignmentService(dry_run=dry_run, verbose=verbose)
         ok, message = service.help_students(
@@ -560,22 +777,21 @@ def help_students(
             auto_confirm=auto_confirm,
             config_file=config_file
         )
-
-        if not ok:
-            logger.error(message)
-            raise typer.Exit(code=1)
-
-        logger.info(f"✅ {message}")
-
     except FileNotFoundError as e:
-        logger.error(f"File not found: {e}")
+        logger.error("File not found: %s", e)
         logger.info("💡 To generate a student repository list, run:")
         logger.info("   $ classroom-pilot repos fetch")
         raise typer.Exit(code=1)
     except Exception as e:
-        logger.error(f"Batch student assistance failed: {e}")
+        logger.error("Batch student assistance failed: %s", e)
         raise typer.Exit(code=1)
 
+    if not ok:
+        logger.error(message)
+        raise typer.Exit(code=1)
+
+    logger.info("✅ %s", message)
+
 
 @assignments_app.command("check-student")
 def check_student(
@@ -585,8 +801,7 @@ def check_student(
     repo_file: str = typer.Option(
         "student-repos.txt", "--file", "-f",
         help="File containing student repository URLs for interactive selection"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Check the status of a student repository.
@@ -598,55 +813,36 @@ def check_student(
         $ classroom-pilot assignments check-student https://github.com/org/assignment-student123
     """
     # Access universal options from context
-    verbose = ctx.obj.get('verbose', False)
-    dry_run = ctx.obj.get('dry_run', False)
-
-    setup_logging(verbose)
+    verbose = ctx.obj.verbose
+    dry_run = ctx.obj.dry_run
 
     # If no repo_url provided, load from file and allow selection
-    if not repo_url:
-        try:
-            repos = load_student_repos(repo_file)
-            if not repos:
-                logger.error(f"No repositories found in {repo_file}")
-                logger.info("💡 To generate a student repository list, run:")
-                logger.info("   $ classroom-pilot repos fetch")
-                raise typer.Exit(code=1)
-
-            repo_url = select_student_repo_interactive(repos)
-            if not repo_url:
-                raise typer.Exit(code=0)  # User cancelled
-
-        except FileNotFoundError:
-            logger.error(f"Repository file not found: {repo_file}")
-            logger.info("💡 To generate a student repository list, run:")
-            logger.info("   $ classroom-pilot repos fetch")
-            raise typer.Exit(code=1)
+    repo_url = _resolve_repo_url(repo_url, repo_file)
 
     # Delegate to AssignmentService
     try:
-        from .services.assignment_service import AssignmentService
+        AssignmentService = _lazy(
+            ".services.assignment_service").AssignmentService
 
         service = AssignmentService(dry_run=dry_run, verbose=verbose)
         ok, message = service.check_student(
             repo_url=repo_url,
             config_file=config_file
         )
-
-        if not ok:
-            logger.error(message)
-            # Check if it's an accessibility issue vs update needed
-            if "not accessible" in message:
-                raise typer.Exit(code=1)
-            else:
-                raise typer.Exit(code=2)  # Needs update
-
-        logger.info(f"✅ {message}")
-
     except Exception as e:
-        logger.error(f"Student status check failed: {e}")
+        logger.error("Student status check failed: %s", e)
         raise typer.Exit(code=1)
 
+    if not ok:
+        logger.error(message)
+        # Check if it's an accessibility issue vs update needed
+        if "not accessible" in message:
+            raise typer.Exit(code=1)
+        else:
+            raise typer.Exit(code=2)  # Needs update
+
+    logger.info("✅ %s", message)
+
 
 @assignments_app.command("student-instructions")
 def student_instructions(
@@ -657,8 +853,7 @@ def student_instructions(
     repo_file: str = typer.Option(
         "student-repos.txt", "--file", "-f",
         help="File containing student repository URLs for interactive selection"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Generate update instructions for a student.
@@ -680,35 +875,17 @@ def student_instructions(
         $ classroom-pilot assignments student-instructions https://github.com/org/assignment-student123
         $ classroom-pilot assignments student-instructions https://github.com/org/assignment-student123 -o instructions.txt
     """
-    setup_logging()
-
     # If no repo_url provided, load from file and allow selection
-    if not repo_url:
-        try:
-            repos = load_student_repos(repo_file)
-            if not repos:
-                logger.error(f"No repositories found in {repo_file}")
-                logger.info("💡 To generate a student repository list, run:")
-                logger.info("   $ classroom-pilot repos fetch")
-                raise typer.Exit(code=1)
-
-            repo_url = select_student_repo_interactive(repos)
-            if not repo_url:
-                raise typer.Exit(code=0)  # User cancelled
-
-        except FileNotFoundError:
-            logger.error(f"Repository file not found: {repo_file}")
-            logger.info("💡 To generate a student repository list, run:")
-            logger.info("   $ classroom-pilot repos fetch")
-            raise typer.Exit(code=1)
+    repo_url = _resolve_repo_url(repo_url, repo_file)
 
     logger.info("Generating student instructions")
 
     try:
-        from .assignments.student_helper import StudentUpdateHelper
+        StudentUpdateHelper = _lazy(
+            ".assignments.student_helper").StudentUpdateHelper
 
         # Initialize helper
-        config_path = Path(config_file) if config_file else None
+        config_path = _as_path(config_file)
         helper = StudentUpdateHelper(config_path)
 
         # Generate instructions
@@ -716,26 +893,23 @@ def student_instructions(
 
         # Output instructions
         if output_file:
-            with open(output_file, 'w') as f:
-                f.write(instructions)
-            logger.info(f"Instructions saved to: {output_file}")
+            Path(output_file).write_text(instructions, encoding='utf-8')
+            logger.info("Instructions saved to: %s", output_file)
         else:
             print(instructions)
 
     except ImportError as e:
-        logger.error(f"Failed to import student helper: {e}")
+        logger.error("Failed to import student helper: %s", e)
         raise typer.Exit(code=1)
     except Exception as e:
-        logger.error(f"Failed to generate instructions: {e}")
+        logger.error("Failed to generate instructions: %s", e)
         raise typer.Exit(code=1)
 
 
 @assignments_app.command("check-classroom")
 def check_classroom(
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Enable verbose output"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    verbose: bool = _VERBOSE_OPTION,
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Check if the classroom repository is ready for student updates.
@@ -751,14 +925,16 @@ def check_classroom(
     Example:
         $ classroom-pilot assignments check-classroom
     """
-    setup_logging(verbose)
+    if verbose:
+        setup_logging(verbose=True)
     logger.info("Checking classroom repository status")
 
     try:
-        from .assignments.student_helper import StudentUpdateHelper
+        StudentUpdateHelper = _lazy(
+            ".assignments.student_helper").StudentUpdateHelper
 
         # Initialize helper
-        config_path = Path(config_file) if config_file else None
+        config_path = _as_path(config_file)
         helper = StudentUpdateHelper(config_path)
 
         # Validate configuration
@@ -775,11 +951,13 @@ def check_classroom(
             logger.error("❌ Classroom repository is not ready")
             raise typer.Exit(code=1)
 
+    except typer.Exit:
+        raise
     except ImportError as e:
-        logger.error(f"Failed to import student helper: {e}")
+        logger.error("Failed to import student helper: %s", e)
         raise typer.Exit(code=1)
     except Exception as e:
-        logger.error(f"Classroom status check failed: {e}")
+        logger.error("Classroom status check failed: %s", e)
         raise typer.Exit(code=1)
 
 
@@ -795,8 +973,7 @@ def cycle_single_collaborator(
     repo_file: str = typer.Option(
         "student-repos.txt", "--file", "-f",
         help="File containing student repository URLs for interactive selection"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Cycle collaborator permissions for a single repository.
@@ -822,36 +999,14 @@ def cycle_single_collaborator(
         $ classroom-pilot assignments cycle-collaborator https://github.com/org/repo-student123
         $ classroom-pilot assignments cycle-collaborator https://github.com/org/repo student123 --force
     """
-    # Access universal options from parent context
-    verbose = ctx.parent.params.get('verbose', False)
-    dry_run = ctx.parent.params.get('dry_run', False)
-
-    if verbose:
-        setup_logging(verbose=True)
-    else:
-        setup_logging()
+    # Access universal options from context
+    verbose = ctx.obj.verbose
+    dry_run = ctx.obj.dry_run
 
     logger.info("Cycling single repository collaborator permissions")
 
     # If no repo_url provided, load from file and allow selection
-    if not repo_url:
-        try:
-            repos = load_student_repos(repo_file)
-            if not repos:
-                logger.error(f"No repositories found in {repo_file}")
-                logger.info("💡 To generate a student repository list, run:")
-                logger.info("   $ classroom-pilot repos fetch")
-                raise typer.Exit(code=1)
-
-            repo_url = select_student_repo_interactive(repos)
-            if not repo_url:
-                raise typer.Exit(code=0)  # User cancelled
-
-        except FileNotFoundError:
-            logger.error(f"Repository file not found: {repo_file}")
-            logger.info("💡 To generate a student repository list, run:")
-            logger.info("   $ classroom-pilot repos fetch")
-            raise typer.Exit(code=1)
+    repo_url = _resolve_repo_url(repo_url, repo_file)
 
     # Extract username from URL if not provided
     if not username:
@@ -862,32 +1017,30 @@ def cycle_single_collaborator(
             # Try to extract username after last dash
             if '-' in repo_name:
                 username = repo_name.split('-')[-1]
-                logger.info(f"Extracted username from URL: {username}")
+                logger.info("Extracted username from URL: %s", username)
             else:
                 logger.error("Could not extract username from repository URL")
                 logger.error(
                     "Please provide username explicitly: cycle-collaborator <repo_url> <username>")
                 raise typer.Exit(code=1)
         except (IndexError, AttributeError) as e:
-            logger.error(f"Failed to parse repository URL: {e}")
+            logger.error("Failed to parse repository URL: %s", e)
             raise typer.Exit(code=1)
 
     if verbose:
         logger.debug(
-            f"Verbose mode enabled for cycling collaborator {username} on {repo_url}")
+            "Verbose mode enabled for cycling collaborator %s on %s", username, repo_url)
 
     if dry_run:
-        logger.info(
-            f"DRY RUN: Would cycle collaborator {username} on {repo_url}")
-        logger.info(f"DRY RUN: Force mode: {force}")
-        logger.info(f"DRY RUN: Config file: {config_file}")
-        return
+        return _log_dry_run("assignments.cycle-collaborator", username=username,
+                            repo_url=repo_url, force=force, config_file=config_file)
 
     try:
-        from .assignments.cycle_collaborator import CycleCollaboratorManager
+        CycleCollaboratorManager = _lazy(
+            ".assignments.cycle_collaborator").CycleCollaboratorManager
 
         # Initialize manager
-        config_path = Path(config_file) if config_file else None
+        config_path = _as_path(config_file)
         manager = CycleCollaboratorManager(config_path, auto_confirm=True)
 
         # Validate configuration
@@ -910,11 +1063,13 @@ def cycle_single_collaborator(
             logger.error("❌ Collaborator cycling failed")
             raise typer.Exit(code=1)
 
+    except typer.Exit:
+        raise
     except ImportError as e:
-        logger.error(f"Failed to import cycle collaborator manager: {e}")
+        logger.error("Failed to import cycle collaborator manager: %s", e)
         raise typer.Exit(code=1)
     except Exception as e:
-        logger.error(f"Collaborator cycling failed: {e}")
+        logger.error("Collaborator cycling failed: %s", e)
         raise typer.Exit(code=1)
 
 
@@ -928,8 +1083,10 @@ def cycle_multiple_collaborators(
         False, "--repo-urls", help="Treat batch file as repository URLs (extract usernames)"),
     force: bool = typer.Option(
         False, "--force", "-f", help="Force cycling even when access appears correct"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    concurrency: int = typer.Option(
+        1, "--concurrency", min=1, max=25,
+        help="Number of repositories to cycle at once (default: one at a time)"),
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Cycle collaborator permissions for multiple repositories (batch processing).
@@ -949,6 +1106,7 @@ def cycle_multiple_collaborators(
         batch_file: Path to file containing repository URLs or usernames (default: student-repos.txt)
         repo_url_mode: Treat file as repository URLs instead of usernames
         force: Force cycling even when access appears correct
+        concurrency: Number of repositories to cycle at once (1-25)
         dry_run: Preview actions without making changes
         verbose: Enable detailed logging
         Supports universal options: --verbose, --dry-run
@@ -958,18 +1116,17 @@ def cycle_multiple_collaborators(
         $ classroom-pilot assignments cycle-collaborators --repo-urls
         $ classroom-pilot assignments cycle-collaborators custom-repos.txt --repo-urls --force
     """
-    # Access universal options from parent context
-    verbose = ctx.parent.params.get('verbose', False)
-    dry_run = ctx.parent.params.get('dry_run', False)
+    # Access universal options from context
+    dry_run = ctx.obj.dry_run
 
-    setup_logging(verbose)
     logger.info("Cycling multiple repository collaborator permissions")
 
     try:
-        from .assignments.cycle_collaborator import CycleCollaboratorManager
+        CycleCollaboratorManager = _lazy(
+            ".assignments.cycle_collaborator").CycleCollaboratorManager
 
         # Initialize manager
-        config_path = Path(config_file) if config_file else None
+        config_path = _as_path(config_file)
         manager = CycleCollaboratorManager(config_path, auto_confirm=True)
 
         # Skip validation in dry-run mode
@@ -979,22 +1136,21 @@ def cycle_multiple_collaborators(
                 logger.error("Configuration validation failed")
                 raise typer.Exit(code=1)
 
-        batch_file_path = Path(batch_file)
-        if not batch_file_path.exists():
-            logger.error(f"Batch file not found: {batch_file}")
+        # One stat serves the existence check and the parse cache
+        try:
+            batch_file_stat = os.stat(batch_file)
+        except OSError:
+            logger.error("Batch file not found: %s", batch_file)
             raise typer.Exit(code=1)
 
         if dry_run:
-            logger.info(
-                "DRY RUN: Would cycle collaborator permissions for batch")
-            logger.info(f"Batch file: {batch_file}")
-            logger.info(f"Repository URL mode: {repo_url_mode}")
-            logger.info(f"Force mode: {force}")
-            return
+            return _log_dry_run("assignments.cycle-collaborators", batch_file=batch_file,
+                                repo_url_mode=repo_url_mode, force=force)
 
         # Process batch file
         summary = manager.batch_cycle_from_file(
-            batch_file_path, repo_url_mode, force)
+            Path(batch_file), repo_url_mode, force, concurrency,
+            file_stat=batch_file_stat)
 
         # Display summary
         manager.display_batch_summary(summary)
@@ -1002,19 +1158,21 @@ def cycle_multiple_collaborators(
         # Exit with appropriate code
         if summary.failed_operations > 0:
             logger.warning(
-                f"Completed with {summary.failed_operations} failures")
+                "Completed with %s failures", summary.failed_operations)
             raise typer.Exit(code=1)
         else:
             logger.info("✅ Batch collaborator cycling completed successfully")
 
+    except typer.Exit:
+        raise
     except ImportError as e:
-        logger.error(f"Failed to import cycle collaborator manager: {e}")
+        logger.error("Failed to import cycle collaborator manager: %s", e)
         raise typer.Exit(code=1)
     except FileNotFoundError as e:
-        logger.error(f"Batch file not found: {e}")
+        logger.error("Batch file not found: %s", e)
         raise typer.Exit(code=1)
     except Exception as e:
-        logger.error(f"Batch collaborator cycling failed: {e}")
+        logger.error("Batch collaborator cycling failed: %s", e)
         raise typer.Exit(code=1)
 
 
@@ -1024,13 +1182,11 @@ def check_repository_access(
         None, help="Repository URL to check access for (or leave empty to select from student-repos.txt)"),
     username: Optional[str] = typer.Argument(
         None, help="Username to check access for (auto-extracted from URL if not provided)"),
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Enable verbose output"),
+    verbose: bool = _VERBOSE_OPTION,
     repo_file: str = typer.Option(
         "student-repos.txt", "--file", "-f",
         help="File containing student repository URLs for interactive selection"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Check repository access status for a specific user.
@@ -1054,28 +1210,12 @@ def check_repository_access(
         $ classroom-pilot assignments check-repository-access https://github.com/org/assignment-student123
         $ classroom-pilot assignments check-repository-access https://github.com/org/assignment-student123 student123
     """
-    setup_logging(verbose)
+    if verbose:
+        setup_logging(verbose=True)
     logger.info("Checking repository access status")
 
     # If no repo_url provided, load from file and allow selection
-    if not repo_url:
-        try:
-            repos = load_student_repos(repo_file)
-            if not repos:
-                logger.error(f"No repositories found in {repo_file}")
-                logger.info("💡 To generate a student repository list, run:")
-                logger.info("   $ classroom-pilot repos fetch")
-                raise typer.Exit(code=1)
-
-            repo_url = select_student_repo_interactive(repos)
-            if not repo_url:
-                raise typer.Exit(code=0)  # User cancelled
-
-        except FileNotFoundError:
-            logger.error(f"Repository file not found: {repo_file}")
-            logger.info("💡 To generate a student repository list, run:")
-            logger.info("   $ classroom-pilot repos fetch")
-            raise typer.Exit(code=1)
+    repo_url = _resolve_repo_url(repo_url, repo_file)
 
     # Extract username from URL if not provided
     if not username:
@@ -1086,21 +1226,22 @@ def check_repository_access(
             # Try to extract username after last dash
             if '-' in repo_name:
                 username = repo_name.split('-')[-1]
-                logger.info(f"Extracted username from URL: {username}")
+                logger.info("Extracted username from URL: %s", username)
             else:
                 logger.error("Could not extract username from repository URL")
                 logger.error(
                     "Please provide username explicitly: check-repository-access <repo_url> <username>")
                 raise typer.Exit(code=1)
         except (IndexError, AttributeError) as e:
-            logger.error(f"Failed to parse repository URL: {e}")
+            logger.error("Failed to parse repository URL: %s", e)
             raise typer.Exit(code=1)
 
     try:
-        from .assignments.cycle_collaborator import CycleCollaboratorManager
+        CycleCollaboratorManager = _lazy(
+            ".assignments.cycle_collaborator").CycleCollaboratorManager
 
         # Initialize manager
-        config_path = Path(config_file) if config_file else None
+        config_path = _as_path(config_file)
         manager = CycleCollaboratorManager(config_path)
 
         # Validate configuration
@@ -1125,14 +1266,27 @@ def check_repository_access(
         else:
             logger.info("✅ Repository access is working correctly")
 
+    except typer.Exit:
+        raise
     except ImportError as e:
-        logger.error(f"Failed to import cycle collaborator manager: {e}")
+        logger.error("Failed to import cycle collaborator manager: %s", e)
         raise typer.Exit(code=1)
     except Exception as e:
-        logger.error(f"Repository access check failed: {e}")
+        logger.error("Repository access check failed: %s", e)
         raise typer.Exit(code=1)
 
 
+# PushResult value -> (is failure, status mark, follow-up hint)
+_PUSH_RESULT_REPORTS: Dict[str, Tuple[bool, str, Optional[str]]] = {
+    "success": (False, "✅", None),
+    "up_to_date": (False, "ℹ️", None),
+    "cancelled": (False, "❌", None),
+    "permission_error": (True, "🔒", "Check your GitHub permissions and authentication"),
+    "network_error": (True, "🌐", "Check your network connection and try again"),
+    "repository_error": (True, "📁", "Fix repository issues and try again"),
+}
+
+
 @assignments_app.command("push-to-classroom")
 def push_to_classroom(
     ctx: typer.Context,
@@ -1142,8 +1296,7 @@ def push_to_classroom(
         True, "--interactive/--non-interactive", help="Enable interactive mode for confirmations"),
     branch: str = typer.Option(
         "main", "--branch", "-b", help="Branch to push to classroom repository"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Push template repository changes to the classroom repository.
@@ -1174,14 +1327,13 @@ def push_to_classroom(
         classroom-pilot assignments push-to-classroom --non-interactive --force
     """
     # Access universal options from context
-    verbose = ctx.obj.get('verbose', False)
-    dry_run = ctx.obj.get('dry_run', False)
+    verbose = ctx.obj.verbose
+    dry_run = ctx.obj.dry_run
 
     try:
-        from .assignments.push_manager import ClassroomPushManager, PushResult
+        push_manager = _lazy(".assignments.push_manager")
+        ClassroomPushManager = push_manager.ClassroomPushManager
 
-        # Set up logging
-        setup_logging(verbose)
         logger.info("🚀 Starting classroom repository push workflow")
 
         if dry_run:
@@ -1218,39 +1370,29 @@ def push_to_classroom(
         )
 
         # Handle results
-        if result == PushResult.SUCCESS:
-            logger.info(f"✅ {message}")
-        elif result == PushResult.UP_TO_DATE:
-            logger.info(f"ℹ️ {message}")
-        elif result == PushResult.CANCELLED:
-            logger.info(f"❌ {message}")
-        elif result == PushResult.PERMISSION_ERROR:
-            logger.error(f"🔒 {message}")
-            logger.error("Check your GitHub permissions and authentication")
-            raise typer.Exit(code=1)
-        elif result == PushResult.NETWORK_ERROR:
-            logger.error(f"🌐 {message}")
-            logger.error("Check your network connection and try again")
+        report = _PUSH_RESULT_REPORTS.get(result.value)
+        if report is None:
+            logger.error("❌ Push failed: %s", message)
             raise typer.Exit(code=1)
-        elif result == PushResult.REPOSITORY_ERROR:
-            logger.error(f"📁 {message}")
-            logger.error("Fix repository issues and try again")
-            raise typer.Exit(code=1)
-        else:
-            logger.error(f"❌ Push failed: {message}")
+
+        failed, mark, hint = report
+        (logger.error if failed else logger.info)("%s %s", mark, message)
+        if hint:
+            logger.error(hint)
+        if failed:
             raise typer.Exit(code=1)
 
+    except typer.Exit:
+        raise
     except ImportError as e:
-        logger.error(f"Failed to import push manager: {e}")
+        logger.error("Failed to import push manager: %s", e)
         raise typer.Exit(code=1)
     except KeyboardInterrupt:
         logger.info("❌ Push cancelled by user")
         raise typer.Exit(code=1)
     except Exception as e:
-        logger.error(f"Push workflow failed: {e}")
-        if verbose:
-            import traceback
-            logger.error(traceback.format_exc())
+        # Traceback attached only in verbose mode; logging renders it lazily
+        logger.error("Push workflow failed: %s", e, exc_info=verbose)
         raise typer.Exit(code=1)
 
 
@@ -1258,8 +1400,7 @@ def push_to_classroom(
 @repos_app.command("fetch")
 def repos_fetch(
     ctx: typer.Context,
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Discover and fetch student repositories from GitHub Classroom.
@@ -1281,33 +1422,32 @@ def repos_fetch(
         $ classroom-pilot repos fetch --config custom.conf --verbose --dry-run
     """
     # Access universal options from context
-    verbose = ctx.obj.get('verbose', False)
-    dry_run = ctx.obj.get('dry_run', False)
+    verbose = ctx.obj.verbose
+    dry_run = ctx.obj.dry_run
 
     if verbose:
         logger.debug(
-            f"Verbose mode enabled for repo fetch with config: {config_file}")
+            "Verbose mode enabled for repo fetch with config: %s", config_file)
 
     logger.info("Fetching student repositories")
 
     if dry_run:
-        logger.info(
-            f"DRY RUN: Would fetch student repositories using config: {config_file}")
-        return
+        return _log_dry_run("repos.fetch", config_file=config_file)
     # Delegate to ReposService
     try:
-        from .services.repos_service import ReposService
+        ReposService = _lazy(".services.repos_service").ReposService
 
         service = ReposService(dry_run=dry_run, verbose=verbose)
         ok, message = service.fetch(config_file=config_file)
-        if not ok:
-            logger.error(message)
-            raise typer.Exit(code=1)
-        logger.info(f"✅ {message}")
     except Exception as e:
-        logger.error(f"Repository fetch failed: {e}")
+        logger.error("Repository fetch failed: %s", e)
         raise typer.Exit(code=1)
 
+    if not ok:
+        logger.error(message)
+        raise typer.Exit(code=1)
+    logger.info("✅ %s", message)
+
 
 # Secret Commands
 @secrets_app.command("add")
@@ -1350,8 +1490,8 @@ def secrets_add(
     """
 
     # Access universal options from context
-    verbose = ctx.obj.get('verbose', False)
-    dry_run = ctx.obj.get('dry_run', False)
+    verbose = ctx.obj.verbose
+    dry_run = ctx.obj.dry_run
 
     if verbose:
         logger.debug("Verbose mode enabled for secrets add")
@@ -1359,17 +1499,17 @@ def secrets_add(
     logger.info(
         "Adding secrets to student repositories using global configuration")
 
+    # Parse repository URLs if provided
+    target_repos = None
+    if repo_urls:
+        target_repos = [url.strip()
+                        for url in repo_urls.split(',') if url.strip()]
+
     if dry_run:
-        logger.info("DRY RUN: Would add secrets to student repositories")
-        if repo_urls:
-            target_repos = [url.strip()
-                            for url in repo_urls.split(',') if url.strip()]
-            logger.info(
-                f"DRY RUN: Would process {len(target_repos)} specified repositories")
-        if assignment_root:
-            logger.info(
-                f"DRY RUN: Would use assignment root: {assignment_root}")
-        return
+        return _log_dry_run(
+            "secrets.add",
+            repo_count=len(target_repos) if target_repos is not None else None,
+            assignment_root=assignment_root or None)
 
     # Check if global configuration is loaded
     global_config = get_global_config()
@@ -1388,31 +1528,26 @@ def secrets_add(
             "Please configure SECRETS_CONFIG in your assignment.conf file")
         raise typer.Exit(code=1)
 
-    # Parse repository URLs if provided
-    target_repos = None
-    if repo_urls:
-        target_repos = [url.strip()
-                        for url in repo_urls.split(',') if url.strip()]
-        logger.info(f"Processing {len(target_repos)} specified repositories")
+    if target_repos is not None:
+        logger.info("Processing %d specified repositories", len(target_repos))
 
     # Delegate secrets deployment to service layer
     try:
-        from .services.secrets_service import SecretsService
+        SecretsService = _lazy(".services.secrets_service").SecretsService
 
         service = SecretsService(dry_run=dry_run, verbose=verbose)
         ok, message = service.add_secrets(
             repo_urls=target_repos, force_update=force_update)
-
-        if not ok:
-            logger.error(f"Secret management failed: {message}")
-            raise typer.Exit(code=1)
-
-        logger.info(f"✅ {message}")
-
     except Exception as e:
-        logger.error(f"Secrets command failed: {e}")
+        logger.error("Secrets command failed: %s", e)
+        raise typer.Exit(code=1)
+
+    if not ok:
+        logger.error("Secret management failed: %s", message)
         raise typer.Exit(code=1)
 
+    logger.info("✅ %s", message)
+
 
 @secrets_app.command("manage")
 def secrets_manage(ctx: typer.Context):
@@ -1429,15 +1564,12 @@ def secrets_manage(ctx: typer.Context):
         $ classroom-pilot secrets manage
         $ classroom-pilot secrets manage --verbose --dry-run
     """
-    # Access universal options from parent context
-    verbose = ctx.parent.params.get('verbose', False)
-    dry_run = ctx.parent.params.get('dry_run', False)
+    # Access universal options from context
+    verbose = ctx.obj.verbose
+    dry_run = ctx.obj.dry_run
 
     if verbose:
-        setup_logging(verbose=True)
         logger.debug("Verbose mode enabled for secrets management")
-    else:
-        setup_logging()
 
     if dry_run:
         logger.info("DRY RUN: Would start secret management interface")
@@ -1450,15 +1582,21 @@ def secrets_manage(ctx: typer.Context):
 
 
 # Automation Commands
+def _automation_service(dry_run: bool = False, verbose: bool = False):
+    """Return an AutomationService; the module is imported once per process."""
+    return _lazy(".services.automation_service").AutomationService(
+        dry_run=dry_run, verbose=verbose)
+
+
 @automation_app.command("cron-install")
+@_cli_command("Cron job installation failed")
 def automation_cron_install(
     ctx: typer.Context,
     steps: List[str] = typer.Argument(
         ..., help="Workflow steps to schedule (sync, secrets, cycle, discover, assist)"),
     schedule: Optional[str] = typer.Option(
         None, "--schedule", "-s", help="Cron schedule (e.g., '0 */4 * * *'). Uses default if not provided"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Install cron job for automated workflow steps.
@@ -1474,40 +1612,31 @@ def automation_cron_install(
         classroom-pilot automation cron-install sync secrets cycle --dry-run
     """
     # Access universal options from context
-    verbose = ctx.obj.get('verbose', False)
-    dry_run = ctx.obj.get('dry_run', False)
+    verbose = ctx.obj.verbose
+    dry_run = ctx.obj.dry_run
 
     if verbose:
-        logger.debug(f"Verbose mode enabled for cron installation: {steps}")
+        logger.debug("Verbose mode enabled for cron installation: %s", steps)
 
     if dry_run:
-        logger.info(
-            f"DRY RUN: Would install cron job for steps: {', '.join(steps)}")
-        if schedule:
-            logger.info(f"DRY RUN: Schedule: {schedule}")
-        logger.info(f"DRY RUN: Config file: {config_file}")
-        return
-    try:
-        from .services.automation_service import AutomationService
+        return _log_dry_run("automation.cron-install", steps=', '.join(steps),
+                            schedule=schedule or None, config_file=config_file)
+    service = _automation_service(dry_run=dry_run, verbose=verbose)
+    ok, message = service.cron_install(steps, schedule, config_file)
 
-        service = AutomationService(dry_run=dry_run, verbose=verbose)
-        ok, message = service.cron_install(steps, schedule, config_file)
-        if not ok:
-            typer.echo(f"❌ {message}", color=typer.colors.RED)
-            raise typer.Exit(code=1)
-        typer.echo(f"✅ {message}", color=typer.colors.GREEN)
-    except Exception as e:
-        logger.error(f"Cron job installation failed: {e}")
+    if not ok:
+        typer.echo(f"❌ {message}", color=typer.colors.RED)
         raise typer.Exit(code=1)
+    typer.echo(f"✅ {message}", color=typer.colors.GREEN)
 
 
 @automation_app.command("cron-remove")
+@_cli_command("Cron job removal failed")
 def automation_cron_remove(
     ctx: typer.Context,
     steps: Optional[List[str]] = typer.Argument(
         None, help="Workflow steps to remove (sync, secrets, cycle, discover, assist) or 'all'"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Remove cron jobs for automated workflow steps.
@@ -1521,39 +1650,31 @@ def automation_cron_remove(
         classroom-pilot automation cron-remove secrets cycle
     """
     # Access universal options from context
-    verbose = ctx.obj.get('verbose', False)
-    dry_run = ctx.obj.get('dry_run', False)
-
-    setup_logging(verbose)
-
-    try:
-        from .services.automation_service import AutomationService
+    verbose = ctx.obj.verbose
+    dry_run = ctx.obj.dry_run
 
-        service = AutomationService(dry_run=dry_run, verbose=verbose)
+    if dry_run:
+        if not steps or (len(steps) == 1 and steps[0] == 'all'):
+            typer.echo("[DRY RUN] Would remove all assignment cron jobs")
+        else:
+            typer.echo(
+                f"[DRY RUN] Would remove cron job for steps: {', '.join(steps)}")
+        return
 
-        if dry_run:
-            if not steps or (len(steps) == 1 and steps[0] == 'all'):
-                typer.echo("[DRY RUN] Would remove all assignment cron jobs")
-            else:
-                typer.echo(
-                    f"[DRY RUN] Would remove cron job for steps: {', '.join(steps)}")
-            return
+    service = _automation_service(dry_run=dry_run, verbose=verbose)
+    ok, message = service.cron_remove(steps, config_file)
 
-        ok, message = service.cron_remove(steps, config_file)
-        if not ok:
-            typer.echo(f"❌ {message}", color=typer.colors.RED)
-            raise typer.Exit(code=1)
-        typer.echo(f"✅ {message}", color=typer.colors.GREEN)
-    except Exception as e:
-        logger.error(f"Cron job removal failed: {e}")
+    if not ok:
+        typer.echo(f"❌ {message}", color=typer.colors.RED)
         raise typer.Exit(code=1)
+    typer.echo(f"✅ {message}", color=typer.colors.GREEN)
 
 
 @automation_app.command("cron-status")
+@_cli_command("Failed to get cron job status")
 def automation_cron_status(
     ctx: typer.Context,
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Show status of installed cron jobs.
@@ -1568,8 +1689,8 @@ def automation_cron_status(
         classroom-pilot automation --verbose --dry-run cron-status
     """
     # Access universal options from context
-    verbose = ctx.obj.get('verbose', False)
-    dry_run = ctx.obj.get('dry_run', False)
+    verbose = ctx.obj.verbose
+    dry_run = ctx.obj.dry_run
 
     if verbose:
         logger.debug("Verbose mode enabled for cron status check")
@@ -1577,62 +1698,55 @@ def automation_cron_status(
     logger.info("Checking cron job status...")
 
     if dry_run:
-        logger.info("DRY RUN: Would check cron job status")
-        logger.info(f"DRY RUN: Config file: {config_file}")
-        return
+        return _log_dry_run("automation.cron-status", config_file=config_file)
 
-    try:
-        from .services.automation_service import AutomationService
+    service = _automation_service(dry_run=dry_run, verbose=verbose)
+    ok, data = service.cron_status(config_file)
 
-        service = AutomationService(dry_run=dry_run, verbose=verbose)
-        ok, data = service.cron_status(config_file)
-        if not ok:
-            logger.error(data)
-            raise typer.Exit(code=1)
+    if not ok:
+        logger.error(data)
+        raise typer.Exit(code=1)
 
-        status = data
-        if not status.has_jobs:
-            typer.echo("⚠️  No assignment cron jobs are installed",
-                       color=typer.colors.YELLOW)
-            typer.echo("\nTo install a cron job, run:")
-            typer.echo("  classroom-pilot automation cron-install [steps]")
+    # The report is collected and echoed once instead of line by line
+    status = data
+    if not status.has_jobs:
+        lines = [
+            "⚠️  No assignment cron jobs are installed",
+            "\nTo install a cron job, run:",
+            "  classroom-pilot automation cron-install [steps]",
+        ]
+    else:
+        lines = [
+            f"✅ Assignment cron jobs are installed: {status.total_jobs} job(s)", ""]
+
+        for job in status.installed_jobs:
+            lines.extend((
+                f"📅 Steps: {', '.join(job.steps)}",
+                f"   Schedule: {job.schedule}",
+                f"   Command: {job.command}",
+                "",
+            ))
+
+        if status.log_file_exists and status.last_log_activity:
+            lines.append("📋 Recent log activity:")
+            log_lines = status.last_log_activity.splitlines()
+            lines.extend(f"   {line}" for line in log_lines[-3:])
+        elif status.log_file_exists:
+            lines.append("📋 Log file exists but no recent activity")
         else:
-            typer.echo(
-                f"✅ Assignment cron jobs are installed: {status.total_jobs} job(s)", color=typer.colors.GREEN)
-            typer.echo()
-
-            for job in status.installed_jobs:
-                typer.echo(
-                    f"📅 Steps: {', '.join(job.steps) if hasattr(job, 'steps') else job.steps_key}")
-                typer.echo(f"   Schedule: {job.schedule}")
-                if hasattr(job, 'command'):
-                    typer.echo(f"   Command: {job.command}")
-                typer.echo()
-
-            if status.log_file_exists and status.last_log_activity:
-                typer.echo("📋 Recent log activity:")
-                log_lines = status.last_log_activity.splitlines()
-                for line in log_lines[-3:]:
-                    typer.echo(f"   {line}")
-            elif status.log_file_exists:
-                typer.echo("📋 Log file exists but no recent activity")
-            else:
-                typer.echo(
-                    "⚠️  No log file found - cron jobs may not have run yet")
+            lines.append(
+                "⚠️  No log file found - cron jobs may not have run yet")
 
-    except Exception as e:
-        logger.error(f"Failed to get cron job status: {e}")
-        raise typer.Exit(code=1)
+    typer.echo("\n".join(lines))
 
 
 @automation_app.command("cron-logs")
+@_cli_command("Failed to show logs")
 def automation_cron_logs(
     lines: int = typer.Option(
         30, "--lines", "-n", help="Number of recent log lines to show"),
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Enable verbose output"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path")
+    verbose: bool = _VERBOSE_OPTION,
+    config_file: str = _CONFIG_OPTION
 ):
     """
     Show recent workflow log entries.
@@ -1643,33 +1757,29 @@ def automation_cron_logs(
     Example:
         classroom-pilot automation cron-logs --lines 50
     """
-    setup_logging(verbose)
+    if verbose:
+        setup_logging(verbose=True)
 
-    try:
-        from .services.automation_service import AutomationService
+    service = _automation_service(dry_run=False, verbose=verbose)
+    success, output = service.cron_logs(lines)
 
-        service = AutomationService(dry_run=False, verbose=verbose)
-        success, output = service.cron_logs(lines)
-        if success:
-            typer.echo(output)
+    if success:
+        typer.echo(output)
+    else:
+        if "Log file not found" in output or "not found" in output.lower():
+            typer.echo("📋 No logs available yet",
+                       color=typer.colors.YELLOW)
+            typer.echo(
+                "\nCron jobs may not have run yet, or logging may not be configured.")
+            typer.echo(
+                "Once cron jobs start running, their output will appear here.")
         else:
-            if "Log file not found" in output or "not found" in output.lower():
-                typer.echo("📋 No logs available yet",
-                           color=typer.colors.YELLOW)
-                typer.echo(
-                    "\nCron jobs may not have run yet, or logging may not be configured.")
-                typer.echo(
-                    "Once cron jobs start running, their output will appear here.")
-            else:
-                typer.echo(f"❌ {output}", color=typer.colors.RED)
-                raise typer.Exit(code=1)
-
-    except Exception as e:
-        logger.error(f"Failed to show logs: {e}")
-        raise typer.Exit(code=1)
+            typer.echo(f"❌ {output}", color=typer.colors.RED)
+            raise typer.Exit(code=1)
 
 
 @automation_app.command("cron-schedules")
+@_cli_command("Failed to list schedules")
 def automation_cron_schedules():
     """
     List default schedules for workflow steps.
@@ -1680,28 +1790,39 @@ def automation_cron_schedules():
     Example:
         classroom-pilot automation cron-schedules
     """
-    try:
-        from .services.automation_service import AutomationService
-
-        service = AutomationService()
-        ok, output = service.cron_schedules()
-        if not ok:
-            logger.error(output)
-            raise typer.Exit(code=1)
-        typer.echo(output)
+    service = _automation_service()
+    ok, output = service.cron_schedules()
 
-    except Exception as e:
-        logger.error(f"Failed to list schedules: {e}")
+    if not ok:
+        logger.error(output)
         raise typer.Exit(code=1)
+    typer.echo(output)
+
+
+_CRON_SYNC_REPORTS: Dict[str, Tuple[int, str, str, Optional[int]]] = {
+    "SUCCESS": (logging.INFO, "✅ All workflow steps completed successfully in %.2fs",
+                "total_execution_time", None),
+    "PARTIAL_FAILURE": (logging.WARNING, "⚠️ Some workflow steps failed: %s",
+                        "error_summary", logging.INFO),
+    "COMPLETE_FAILURE": (logging.ERROR, "❌ All workflow steps failed: %s",
+                         "error_summary", logging.ERROR),
+}
+
+_CRON_SYNC_EXIT_CODES: Dict[str, int] = {
+    "COMPLETE_FAILURE": 1,
+    "ENVIRONMENT_ERROR": 1,
+    "CONFIGURATION_ERROR": 1,
+    "PARTIAL_FAILURE": 2,
+}
 
 
 @automation_app.command("cron-sync")
+@_cli_command("Cron sync workflow failed")
 def automation_cron_sync(
     ctx: typer.Context,
     steps: List[str] = typer.Argument(
         None, help="Workflow steps to execute (sync, discover, secrets, assist, cycle)"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config", "-c", help="Configuration file path"),
+    config_file: str = _CONFIG_OPTION,
     stop_on_failure: bool = typer.Option(
         False, "--stop-on-failure", help="Stop execution on first step failure"),
     show_log: bool = typer.Option(
@@ -1745,82 +1866,79 @@ def automation_cron_sync(
         classroom-pilot automation cron-sync --verbose sync
     """
     # Access universal options from context
-    verbose = ctx.obj.get('verbose', False)
-    dry_run = ctx.obj.get('dry_run', False)
-
-    try:
-        from .services.automation_service import AutomationService
+    verbose = ctx.obj.verbose
+    dry_run = ctx.obj.dry_run
 
-        service = AutomationService(dry_run=dry_run, verbose=verbose)
-        ok, result = service.cron_sync(
-            steps, dry_run, verbose, stop_on_failure, show_log)
-        if not ok:
-            logger.error(result)
+    # Report the plan before the sync manager is built; it creates the log directory
+    if dry_run:
+        steps_valid, _, steps_message = _lazy(
+            ".automation.cron_sync").validate_workflow_steps(steps)
+        if not steps_valid:
+            logger.error(steps_message)
             raise typer.Exit(code=1)
+        step_list = "\n".join(
+            f"  {i}. {step}" for i, step in enumerate(steps or ["sync"], 1))
+        log_file = Path.cwd() / _lazy(".automation.cron_manager").CRON_LOG_SUBPATH
+        return _log_dry_run("automation.cron-sync", step_list=step_list, log_file=log_file)
 
-        # If dry-run, print summary and return
-        if dry_run:
-            logger.info("📋 Workflow steps that would be executed:")
-            for i, step in enumerate(steps or ["sync"], 1):
-                logger.info(f"  {i}. {step}")
-            logger.info(
-                f"📂 Log file: {result.get('log_file') if isinstance(result, dict) else 'unknown'}")
-            logger.info(
-                "✅ Dry run completed - use without --dry-run to execute")
-            return
+    service = _automation_service(dry_run=dry_run, verbose=verbose)
+    ok, result = service.cron_sync(
+        steps, dry_run, verbose, stop_on_failure, show_log)
 
-        # Otherwise result is the CronSync result object
-        res = result
-        try:
-            getattr(res, 'overall_result', None)
-        except Exception:
-            pass
+    if not ok:
+        logger.error(result)
+        raise typer.Exit(code=1)
 
-        # Attempt to interpret result similar to prior behavior
-        if hasattr(res, 'overall_result') and res.overall_result.name == 'SUCCESS':
-            logger.info(
-                f"✅ All workflow steps completed successfully in {getattr(res, 'total_execution_time', 0):.2f}s")
-        elif hasattr(res, 'overall_result') and res.overall_result.name == 'PARTIAL_FAILURE':
-            logger.warning(
-                f"⚠️ Some workflow steps failed: {getattr(res, 'error_summary', '')}")
-            logger.info(
-                f"📂 Check log file: {getattr(res, 'log_file_path', '')}")
-        elif hasattr(res, 'overall_result') and res.overall_result.name == 'COMPLETE_FAILURE':
-            logger.error(
-                f"❌ All workflow steps failed: {getattr(res, 'error_summary', '')}")
-            logger.error(
-                f"📂 Check log file: {getattr(res, 'log_file_path', '')}")
+    # Otherwise result is the CronSync result object
+    overall = getattr(result, 'overall_result', None)
+    name = overall.name if overall else None
 
-        if hasattr(res, 'steps_executed') and res.steps_executed:
-            logger.info("📊 Step execution summary:")
-            for step_result in res.steps_executed:
-                status = "✅" if step_result.success else "❌"
-                logger.info(
-                    f"  {status} {step_result.step.value}: {step_result.message}")
+    report = _CRON_SYNC_REPORTS.get(name)
+    if report:
+        level, template, field, log_file_level = report
+        logger.log(level, template, getattr(result, field, None))
+        if log_file_level is not None:
+            logger.log(log_file_level, "📂 Check log file: %s", result.log_file_path)
 
-        if show_log and hasattr(res, 'get_log_tail'):
-            logger.info("📋 Recent log entries:")
-            log_lines = res.get_log_tail(20)
-            for line in log_lines[-10:]:
-                logger.info(f"  {line}")
+    if result.steps_executed:
+        summary_lines = [
+            f"  {'✅' if step_result.success else '❌'} "
+            f"{step_result.step.value}: {step_result.message}"
+            for step_result in result.steps_executed
+        ]
+        logger.info("📊 Step execution summary:\n%s", "\n".join(summary_lines))
 
-        if hasattr(res, 'overall_result') and res.overall_result.name in ['COMPLETE_FAILURE', 'ENVIRONMENT_ERROR', 'CONFIGURATION_ERROR']:
-            raise typer.Exit(code=1)
-        if hasattr(res, 'overall_result') and res.overall_result.name == 'PARTIAL_FAILURE':
-            raise typer.Exit(code=2)
+    if show_log and Path(result.log_file_path).exists():
+        log_lines = _lazy(".automation.cron_manager").read_last_lines(result.log_file_path, 10)
+        logger.info("📋 Recent log entries:\n  %s", "\n  ".join(log_lines))
 
-    except Exception as e:
-        logger.error(f"Cron sync workflow failed: {e}")
-        if verbose:
-            import traceback
-            logger.error(traceback.format_exc())
-        raise typer.Exit(code=1)
+    exit_code = _CRON_SYNC_EXIT_CODES.get(name, 0)
+    if exit_code:
+        raise typer.Exit(code=exit_code)
 
 
 # ========================================
 # Configuration Commands
 # ========================================
 
+# Token expiry tiers: within a week, within a month, later
+_EXPIRY_THRESHOLDS = (7, 30)
+_EXPIRY_LEVELS = (logging.WARNING, logging.INFO, logging.INFO)
+
+
+def _log_expiry(days: int, messages: Tuple[str, str, str], *args: Any) -> None:
+    """
+    Log how soon a token expires, choosing the message and level by tier.
+
+    Args:
+        days: Days until the token expires
+        messages: Message templates for the week/month/later tiers; each
+            receives ``days`` followed by ``args``
+    """
+    tier = bisect.bisect_left(_EXPIRY_THRESHOLDS, days)
+    logger.log(_EXPIRY_LEVELS[tier], messages[tier], days, *args)
+
+
 @config_app.command("set-token")
 def config_set_token(
     token: str = typer.Argument(
@@ -1862,69 +1980,62 @@ def config_set_token(
 
     Generate tokens at: https://github.com/settings/tokens
     """
-    setup_logging()
-
     try:
-        from .utils.token_manager import GitHubTokenManager
-        from .utils.github_classroom_api import GitHubClassroomAPI
+        token_manager_module = _lazy(".utils.token_manager")
+        GitHubTokenManager = token_manager_module.GitHubTokenManager
 
         logger.info("🔑 Updating GitHub Personal Access Token...")
 
         # Validate token format
-        if not token.startswith(('ghp_', 'github_pat_')):
-            logger.warning(
-                "⚠️ Token doesn't start with 'ghp_' or 'github_pat_'")
+        if not token.startswith(token_manager_module.GITHUB_TOKEN_PREFIXES):
+            logger.warning("⚠️ Token doesn't start with %s",
+                           token_manager_module.GITHUB_TOKEN_PREFIXES_TEXT)
             logger.warning("This might not be a valid GitHub token format")
             if not force:
-                confirm = typer.confirm("Continue anyway?")
-                if not confirm:
+                if not _confirm("Continue anyway?"):
                     logger.info("Token update cancelled")
                     raise typer.Exit(0)
 
         # Create API client to validate token
         if not force:
             logger.info("Validating token...")
-            api_client = GitHubClassroomAPI(token)
+            api_client = _lazy(
+                ".utils.github_classroom_api").GitHubClassroomAPI(token)
 
-            # Check token expiration
-            expiration_info = api_client.check_token_expiration()
+            # One request answers both the expiration and the scope checks
+            expiration_info = scope_info = api_client.validate_token()
 
             if expiration_info.get('is_expired'):
                 logger.error("❌ Token has already expired!")
                 logger.error(
-                    f"Expired on: {expiration_info.get('expires_at', 'unknown date')}")
-                logger.error(
-                    "Please generate a new token at: https://github.com/settings/tokens")
+                    "Expired on: %s", expiration_info.get('expires_at', 'unknown date'))
+                logger.error("Please generate a new token at: %s",
+                             token_manager_module.GITHUB_TOKENS_URL)
                 raise typer.Exit(1)
 
             if not expiration_info.get('is_valid'):
                 error_msg = expiration_info.get('error', 'Unknown error')
-                logger.error(f"❌ Token validation failed: {error_msg}")
+                logger.error("❌ Token validation failed: %s", error_msg)
                 raise typer.Exit(1)
 
             # Log expiration info
             if expiration_info.get('days_remaining') is not None:
                 days = expiration_info['days_remaining']
-                if days <= 7:
-                    logger.warning(f"⚠️ Token expires in {days} days!")
-                elif days <= 30:
-                    logger.info(f"ℹ️ Token expires in {days} days")
-                else:
-                    logger.info(f"✓ Token valid for {days} more days")
+                _log_expiry(days, ("⚠️ Token expires in %s days!",
+                                   "ℹ️ Token expires in %s days",
+                                   "✓ Token valid for %s more days"))
             else:
                 logger.info(
                     "✓ Token is valid (classic token with no expiration)")
 
             # Check token scopes
-            scope_info = api_client.validate_token_scopes()
-
             if not scope_info.get('valid'):
                 logger.error("❌ Token validation failed")
                 raise typer.Exit(1)
 
             scopes = scope_info.get('scopes', [])
             logger.info(
-                f"Token scopes: {', '.join(scopes) if scopes else 'none'}")
+                "Token scopes: %s", ', '.join(scopes) if scopes else 'none')
 
             # Check for required scopes
             if not scope_info.get('has_repo'):
@@ -1951,7 +2062,7 @@ def config_set_token(
                     "  ✓ repo - Full control of private repositories")
                 logger.warning("  ✓ read:org - Read organization data")
                 logger.warning("")
-                if not typer.confirm("Do you want to save this token anyway?"):
+                if not _confirm("Do you want to save this token anyway?"):
                     logger.info("Token update cancelled")
                     raise typer.Exit(0)
 
@@ -1959,20 +2070,20 @@ def config_set_token(
         validated_expires_at = None
         if expires_at:
             try:
-                from datetime import datetime
                 # Parse to validate format
-                datetime.fromisoformat(expires_at.replace('Z', '+00:00'))
+                token_manager_module.parse_iso_datetime(expires_at)
                 validated_expires_at = expires_at
-                logger.info(f"✓ Expiration date set to: {expires_at}")
+                logger.info("✓ Expiration date set to: %s", expires_at)
             except ValueError as e:
-                logger.error(f"❌ Invalid date format: {e}")
+                logger.error("❌ Invalid date format: %s", e)
                 logger.error("Expected ISO format: YYYY-MM-DDTHH:MM:SS+00:00")
                 raise typer.Exit(1)
 
         # Save token with metadata
         token_manager = GitHubTokenManager()
 
-        # Get scopes from validation if we ran it, otherwise let save_token detect them
+        # Keep the scopes validation found; --force stores the token without
+        # any network request
         scopes_to_save = None
         if not force:
             scopes_to_save = scope_info.get('scopes', [])
@@ -1980,7 +2091,8 @@ def config_set_token(
         success = token_manager.save_token(
             token,
             expires_at=validated_expires_at,
-            scopes=scopes_to_save
+            scopes=scopes_to_save,
+            verify=not force
         )
 
         if not success:
@@ -1989,18 +2101,24 @@ def config_set_token(
 
         logger.info("")
         logger.info("✅ Token updated successfully!")
-        logger.info(f"Token saved to: {token_manager.config_file}")
+        logger.info("Token saved to: %s", token_manager.config_file)
         logger.info("")
         logger.info(
             "You can now use classroom-pilot commands with the new token.")
 
+    except typer.Exit:
+        raise
     except Exception as e:
-        logger.error(f"Failed to update token: {e}")
+        logger.error("Failed to update token: %s", e)
         raise typer.Exit(1)
 
 
 @config_app.command("check-token")
-def config_check_token():
+def config_check_token(
+    json_output: bool = typer.Option(
+        False, "--json",
+        help="Print the token status as one JSON object instead of the report")
+):
     """
     Check the current GitHub token status, expiration, and scopes.
 
@@ -2011,30 +2129,49 @@ def config_check_token():
     - Configured scopes
     - Warnings for missing required scopes
 
-    Example:
+    With --json the report is skipped and a single object is printed; the
+    exit code is 0 only for a valid, unexpired token.
+
+    Examples:
         classroom-pilot config check-token
+        classroom-pilot config check-token --json
     """
-    setup_logging()
-
     try:
-        from .utils.token_manager import GitHubTokenManager
-        from .utils.github_classroom_api import GitHubClassroomAPI
-
-        logger.info("🔍 Checking GitHub token status...")
-        logger.info("")
+        token_manager_module = _lazy(".utils.token_manager")
+        GitHubTokenManager = token_manager_module.GitHubTokenManager
+        GitHubClassroomAPI = _lazy(
+            ".utils.github_classroom_api").GitHubClassroomAPI
+        parse_iso_datetime = token_manager_module.parse_iso_datetime
 
         # Get token
         token_manager = GitHubTokenManager()
         token = token_manager.get_github_token()
 
+        if json_output:
+            import json
+
+            info = GitHubClassroomAPI(token).validate_token() if token else {
+                'error': 'No GitHub token found'}
+            ok = bool(info.get('is_valid')) and not info.get('is_expired')
+            typer.echo(json.dumps({
+                'valid': ok,
+                **{key: info.get(key) for key in (
+                    'token_type', 'expires_at', 'days_remaining', 'scopes',
+                    'has_repo', 'has_read_org', 'error')},
+            }))
+            raise typer.Exit(0 if ok else 1)
+
+        logger.info("🔍 Checking GitHub token status...")
+        logger.info("")
+
         if not token:
-            logger.error("❌ No GitHub token found!")
-            logger.error("")
-            logger.error("To set a token:")
-            logger.error("  classroom-pilot config set-token <your-token>")
-            logger.error("")
             logger.error(
-                "Generate tokens at: https://github.com/settings/tokens")
+                "❌ No GitHub token found!\n"
+                "\n"
+                "To set a token:\n"
+                "  classroom-pilot config set-token <your-token>\n"
+                "\n"
+                "Generate tokens at: %s", token_manager_module.GITHUB_TOKENS_URL)
             raise typer.Exit(1)
 
         # Create API client
@@ -2042,7 +2179,8 @@ def config_check_token():
 
         # Check expiration
         logger.info("📅 Token Expiration:")
-        expiration_info = api_client.check_token_expiration()
+        # One request answers both the expiration and the scope checks
+        expiration_info = scope_info = api_client.validate_token()
 
         if expiration_info.get('is_expired'):
             expires_at = expiration_info.get('expires_at')
@@ -2052,49 +2190,42 @@ def config_check_token():
             if expires_at:
                 # Format the date in a more readable way
                 try:
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(
-                        expires_at.replace('Z', '+00:00'))
+                    dt = parse_iso_datetime(expires_at)
                     formatted_date = dt.strftime('%B %d, %Y at %I:%M %p %Z')
-                    logger.error(f"  Expired on: {formatted_date}")
+                    logger.error("  Expired on: %s", formatted_date)
                 except Exception:
                     # Fallback to ISO format if parsing fails
-                    logger.error(f"  Expired on: {expires_at}")
+                    logger.error("  Expired on: %s", expires_at)
 
                 if days_past > 0:
                     logger.error(
-                        f"  ({days_past} day{'s' if days_past != 1 else ''} ago)")
+                        "  (%s day%s ago)", days_past, 's' if days_past != 1 else '')
             else:
                 logger.error(
                     "  Expiration date: Not available in token config")
-            logger.error("")
-            logger.error("🔧 To fix:")
             logger.error(
-                "  1. Generate new token: https://github.com/settings/tokens")
-            logger.error(
-                "  2. Update token: classroom-pilot config set-token <new-token>")
+                "\n"
+                "🔧 To fix:\n"
+                "  1. Generate new token: %s\n"
+                "  2. Update token: classroom-pilot config set-token <new-token>",
+                token_manager_module.GITHUB_TOKENS_URL)
             raise typer.Exit(1)
 
         if not expiration_info.get('is_valid'):
             error_msg = expiration_info.get('error', 'Unknown error')
-            logger.error(f"  ❌ Token is invalid: {error_msg}")
+            logger.error("  ❌ Token is invalid: %s", error_msg)
             raise typer.Exit(1)
 
         # Display expiration info
         if expiration_info.get('days_remaining') is not None:
             days = expiration_info['days_remaining']
             expires_at = expiration_info.get('expires_at', 'unknown')
-            if days <= 7:
-                logger.warning(
-                    f"  ⚠️ Expires in {days} days (on {expires_at})")
-                logger.warning("  Consider generating a new token soon!")
-            elif days <= 30:
-                logger.info(f"  ⏰ Expires in {days} days (on {expires_at})")
-            else:
-                logger.info(
-                    f"  ✓ Valid for {days} more days (until {expires_at})")
+            _log_expiry(days, ("  ⚠️ Expires in %s days (on %s)\n"
+                               "  Consider generating a new token soon!",
+                               "  ⏰ Expires in %s days (on %s)",
+                               "  ✓ Valid for %s more days (until %s)"), expires_at)
             logger.info(
-                f"  Token type: {expiration_info.get('token_type', 'unknown')}")
+                "  Token type: %s", expiration_info.get('token_type', 'unknown'))
         else:
             # Classic token - check if user manually set expiration in config
             logger.info("  ✓ Token is valid")
@@ -2102,21 +2233,15 @@ def config_check_token():
             # Try to get stored expiration date from config file
             stored_expiration = None
             try:
-                import json
-                if token_manager.config_file.exists():
-                    with open(token_manager.config_file, 'r') as f:
-                        config_data = json.load(f)
-                        stored_expiration = config_data.get(
-                            'github_token', {}).get('expires_at')
+                stored_expiration = (token_manager.get_config().get(
+                    'github_token') or {}).get('expires_at')
             except Exception as e:
-                logger.debug(f"Could not read stored expiration: {e}")
+                logger.debug("Could not read stored expiration: %s", e)
 
             if stored_expiration:
                 # Calculate days remaining from stored expiration
                 try:
-                    from datetime import datetime, timezone
-                    expires_dt = datetime.fromisoformat(
-                        stored_expiration.replace('Z', '+00:00'))
+                    expires_dt = parse_iso_datetime(stored_expiration)
                     now = datetime.now(timezone.utc)
                     days_remaining = (expires_dt - now).days
 
@@ -2125,42 +2250,33 @@ def config_check_token():
                         '%B %d, %Y at %I:%M %p %Z')
 
                     if days_remaining < 0:
-                        logger.error(f"  ❌ Token expired on: {formatted_date}")
-                        logger.error(f"  ({abs(days_remaining)} days ago)")
-                    elif days_remaining <= 7:
-                        logger.warning(
-                            f"  ⚠️ Expires in {days_remaining} days")
-                        logger.warning(f"  Expiration date: {formatted_date}")
-                        logger.warning(
-                            "  Consider generating a new token soon!")
-                    elif days_remaining <= 30:
-                        logger.info(f"  ⏰ Expires in {days_remaining} days")
-                        logger.info(f"  Expiration date: {formatted_date}")
+                        logger.error("  ❌ Token expired on: %s", formatted_date)
+                        logger.error("  (%s days ago)", abs(days_remaining))
                     else:
-                        logger.info(
-                            f"  ✓ Valid for {days_remaining} more days")
-                        logger.info(f"  Expiration date: {formatted_date}")
+                        _log_expiry(days_remaining, (
+                            "  ⚠️ Expires in %s days\n"
+                            "  Expiration date: %s\n"
+                            "  Consider generating a new token soon!",
+                            "  ⏰ Expires in %s days\n  Expiration date: %s",
+                            "  ✓ Valid for %s more days\n  Expiration date: %s"),
+                            formatted_date)
 
                     logger.info(
-                        f"  Token type: classic (expiration set manually)")
+                        "  Token type: classic (expiration set manually)")
                 except Exception as e:
                     logger.debug(
-                        f"Could not parse stored expiration date: {e}")
+                        "Could not parse stored expiration date: %s", e)
                     logger.info(
-                        f"  Expiration date (manually set): {stored_expiration}")
-                    logger.info(f"  Token type: classic")
+                        "  Expiration date (manually set): %s", stored_expiration)
+                    logger.info("  Token type: classic")
             else:
-                logger.info(f"  Token type: classic (no expiration set)")
-                logger.warning(
-                    "  ⚠️ Consider setting an expiration date for tracking:")
+                logger.info("  Token type: classic (no expiration set)")
                 logger.warning(
+                    "  ⚠️ Consider setting an expiration date for tracking:\n"
                     "     classroom-pilot config set-token <token> --expires-at <date>")
 
-        logger.info("")
-
         # Check scopes
-        logger.info("🔐 Token Scopes:")
-        scope_info = api_client.validate_token_scopes()
+        logger.info("\n🔐 Token Scopes:")
 
         if not scope_info.get('valid'):
             logger.error("  ❌ Could not validate token scopes")
@@ -2168,12 +2284,11 @@ def config_check_token():
 
         scopes = scope_info.get('scopes', [])
         if scopes:
-            logger.info(f"  Configured scopes: {', '.join(scopes)}")
+            logger.info("  Configured scopes: %s", ', '.join(scopes))
         else:
             logger.warning("  ⚠️ No scopes found (this is unusual)")
 
-        logger.info("")
-        logger.info("📋 Required Scopes Check:")
+        logger.info("\n📋 Required Scopes Check:")
 
         if scope_info.get('has_repo'):
             logger.info("  ✓ repo - Full control of private repositories")
@@ -2194,17 +2309,18 @@ def config_check_token():
             logger.info(
                 "✅ Token is properly configured with all required scopes!")
         else:
-            logger.warning("⚠️ Token is missing some required scopes")
-            logger.warning(
-                "Some operations may fail with authorization errors")
-            logger.warning("")
-            logger.warning("To fix:")
-            logger.warning("  1. Generate new token with required scopes")
             logger.warning(
+                "⚠️ Token is missing some required scopes\n"
+                "Some operations may fail with authorization errors\n"
+                "\n"
+                "To fix:\n"
+                "  1. Generate new token with required scopes\n"
                 "  2. Update: classroom-pilot config set-token <new-token>")
 
+    except typer.Exit:
+        raise
     except Exception as e:
-        logger.error(f"Failed to check token: {e}")
+        logger.error("Failed to check token: %s", e)
         raise typer.Exit(1)
 
 
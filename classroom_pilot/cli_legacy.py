@@ -5,163 +5,209 @@ This module provides a simplified command-line interface that avoids
 complex type annotations that cause compatibility issues in CI environments.
 """
 
+import logging
+import sys
+from pathlib import Path
+
 import typer
 
-from .config import Configuration
-from .bash_wrapper import BashWrapper
-from .utils import setup_logging, logger
+# Same logger instance as ``classroom_pilot.utils.logger``; resolved through
+# the stdlib so that parser-only paths (--help, completion) skip the rich stack.
+logger = logging.getLogger("classroom_pilot")
 
-# Create the absolutely minimal Typer application
-app = typer.Typer(
-    help="Classroom Pilot - Comprehensive automation suite for managing assignments."
-)
 
+def _status_glyph(symbol: str, fallback: str) -> str:
+    """Return symbol, or an ASCII fallback if stderr cannot encode it."""
+    encoding = getattr(sys.stderr, "encoding", None) or "ascii"
+    try:
+        symbol.encode(encoding)
+    except (UnicodeEncodeError, LookupError):
+        return fallback
+    return symbol
 
-@app.command()
-def run(
-    dry_run: bool = False,
-    verbose: bool = False,
-    config_file: str = None,
-    yes: bool = False,
-):
-    """Run the complete classroom workflow (sync, discover, secrets, assist)."""
-    # Setup logging
-    setup_logging(verbose)
 
-    # Load configuration
-    config = Configuration.load(config_file)
+# Result markers for command log messages. Legacy consoles (e.g. cp1252 on
+# Windows) cannot encode emoji, and every such record would fail to emit.
+_OK = _status_glyph("✅", "[OK]")
+_FAIL = _status_glyph("❌", "[FAILED]")
 
-    wrapper = BashWrapper(
-        config,
-        dry_run=dry_run,
-        verbose=verbose,
-        auto_yes=yes
-    )
-    success = wrapper.assignment_orchestrator(workflow_type="run")
+# Resolved on first use by _load_config_and_wrapper()
+_ConfigLoader = None
+_BashWrapper = None
 
-    if success:
-        logger.info("✅ Workflow completed successfully")
-    else:
-        logger.error("❌ Workflow failed")
-        raise typer.Exit(code=1)
+# Wrappers already built in this process, keyed by (config path, flags)
+_WRAPPER_CACHE = {}
 
 
-@app.command()
-def sync(
+def setup_logging(verbose: bool = False) -> None:
+    """Configure logging, importing the rich-backed logger on first use."""
+    from .utils.logger import setup_logging as _setup_logging
+    _setup_logging(verbose)
+
+
+def _load_config_and_wrapper(
+    config_file: str = None,
     dry_run: bool = False,
     verbose: bool = False,
-    config_file: str = None,
     yes: bool = False,
 ):
-    """Sync template repository to GitHub Classroom."""
-    # Setup logging
-    setup_logging(verbose)
-
-    # Load configuration
-    config = Configuration.load(config_file)
+    """
+    Load configuration and build a BashWrapper for a command.
+
+    The configuration and bash wrapper modules are only imported when a
+    command actually runs, so ``--help`` and completion stay cheap. Wrappers
+    are reused for repeated calls with the same arguments; their
+    configuration is refreshed from ConfigLoader, which only re-parses the
+    file when it changed on disk.
+
+    Args:
+        config_file: Optional path to configuration file
+        dry_run: Enable dry-run mode
+        verbose: Enable verbose output
+        yes: Automatically answer yes to prompts
+
+    Returns:
+        Configured BashWrapper instance
+    """
+    global _ConfigLoader, _BashWrapper
+    if _ConfigLoader is None:
+        from .config.loader import ConfigLoader as _ConfigLoader
+    if _BashWrapper is None:
+        from .bash_wrapper import BashWrapper as _BashWrapper
 
-    wrapper = BashWrapper(
-        config,
-        dry_run=dry_run,
-        verbose=verbose,
-        auto_yes=yes
-    )
-    success = wrapper.push_to_classroom()
+    setup_logging(verbose)
 
-    if success:
-        logger.info("✅ Sync completed successfully")
+    loader = _ConfigLoader(Path(config_file) if config_file else None)
+    config = loader.load()
+
+    cache_key = (str(loader.config_path), dry_run, verbose, yes)
+    wrapper = _WRAPPER_CACHE.get(cache_key)
+    if wrapper is None:
+        wrapper = _BashWrapper(
+            config,
+            dry_run=dry_run,
+            verbose=verbose,
+            auto_yes=yes
+        )
+        _WRAPPER_CACHE[cache_key] = wrapper
     else:
-        logger.error("❌ Sync failed")
-        raise typer.Exit(code=1)
+        wrapper.config = config
 
+    return wrapper
 
-@app.command()
-def discover(
-    dry_run: bool = False,
-    verbose: bool = False,
-    config_file: str = None,
-    yes: bool = False,
-):
-    """Discover and fetch student repositories from GitHub Classroom."""
-    # Setup logging
-    setup_logging(verbose)
 
-    # Load configuration
-    config = Configuration.load(config_file)
+# Create the absolutely minimal Typer application. Help and error output use
+# plain click formatting so rich is never imported on the parser-only path.
+app = typer.Typer(
+    help="Classroom Pilot - Comprehensive automation suite for managing assignments.",
+    rich_markup_mode=None,
+    pretty_exceptions_enable=False
+)
 
-    wrapper = BashWrapper(
-        config,
-        dry_run=dry_run,
-        verbose=verbose,
-        auto_yes=yes
-    )
-    success = wrapper.fetch_student_repos()
 
-    if success:
-        logger.info("✅ Discovery completed successfully")
+# Commands that only run a single BashWrapper step:
+# command name -> (BashWrapper method, help text, subject for result
+# messages, --config-file default, whether the options are declared with
+# typer.Option short flags and help or as plain --flag/--no-flag switches)
+_WRAPPER_COMMANDS = {
+    "sync": ("push_to_classroom",
+             "Sync template repository to GitHub Classroom.", "Sync",
+             None, False),
+    "discover": ("fetch_student_repos",
+                 "Discover and fetch student repositories from GitHub Classroom.",
+                 "Discovery", None, False),
+    "secrets": ("add_secrets_to_students",
+                "Add or update secrets in student repositories.",
+                "Secrets management", None, False),
+    "assist": ("student_update_helper",
+               "Assist students with common repository issues.",
+               "Student assistance", None, False),
+    "setup-bash": ("setup_assignment",
+                   "Setup a new assignment configuration (Legacy bash version).",
+                   "Setup", "assignment.conf", True),
+    "update": ("update_assignment",
+               "Update assignment configuration and repositories.", "Update",
+               "assignment.conf", True),
+    "cron-sync": ("cron_sync", "Execute scheduled synchronization tasks.",
+                  "Cron sync", "assignment.conf", True),
+}
+
+
+def _make_wrapper_command(method: str, subject: str, config_default, typed_options: bool):
+    """Build a command that runs one BashWrapper method and reports the result."""
+    def run_step(dry_run, verbose, config_file, yes):
+        wrapper = _load_config_and_wrapper(config_file, dry_run, verbose, yes)
+        success = getattr(wrapper, method)()
+
+        if success:
+            logger.info("%s %s completed successfully", _OK, subject)
+        else:
+            logger.error("%s %s failed", _FAIL, subject)
+            raise typer.Exit(code=1)
+
+    if typed_options:
+        def command(
+            dry_run: bool = typer.Option(
+                False, "--dry-run", help="Show what would be done without executing"),
+            verbose: bool = typer.Option(
+                False, "--verbose", "-v", help="Enable verbose output"),
+            config_file: str = typer.Option(
+                config_default, "--config-file", "-c", help="Path to configuration file"),
+            yes: bool = typer.Option(False, "--yes", "-y",
+                                     help="Automatically answer yes to prompts")
+        ):
+            run_step(dry_run, verbose, config_file, yes)
     else:
-        logger.error("❌ Discovery failed")
-        raise typer.Exit(code=1)
+        def command(
+            dry_run: bool = False,
+            verbose: bool = False,
+            config_file: str = config_default,
+            yes: bool = False,
+        ):
+            run_step(dry_run, verbose, config_file, yes)
 
+    return command
 
-@app.command()
-def secrets(
-    dry_run: bool = False,
-    verbose: bool = False,
-    config_file: str = None,
-    yes: bool = False,
-):
-    """Add or update secrets in student repositories."""
-    # Setup logging
-    setup_logging(verbose)
 
-    # Load configuration
-    config = Configuration.load(config_file)
-
-    wrapper = BashWrapper(
-        config,
-        dry_run=dry_run,
-        verbose=verbose,
-        auto_yes=yes
-    )
-    success = wrapper.add_secrets_to_students()
-
-    if success:
-        logger.info("✅ Secrets management completed successfully")
-    else:
-        logger.error("❌ Secrets management failed")
-        raise typer.Exit(code=1)
+def _register_wrapper_commands(*names: str) -> None:
+    """Add the named _WRAPPER_COMMANDS to the app, in the given order."""
+    for name in names:
+        method, help_, subject, config_default, typed_options = _WRAPPER_COMMANDS[name]
+        app.command(name=name, help=help_)(
+            _make_wrapper_command(method, subject, config_default, typed_options))
 
 
 @app.command()
-def assist(
+def run(
+    parallel: bool = typer.Option(
+        False, "--parallel", help="Run the secrets and assist steps concurrently"),
     dry_run: bool = False,
     verbose: bool = False,
     config_file: str = None,
     yes: bool = False,
 ):
-    """Assist students with common repository issues."""
-    # Setup logging
-    setup_logging(verbose)
-
-    # Load configuration
-    config = Configuration.load(config_file)
-
-    wrapper = BashWrapper(
-        config,
-        dry_run=dry_run,
-        verbose=verbose,
-        auto_yes=yes
-    )
-    success = wrapper.student_update_helper()
+    """Run the complete classroom workflow (sync, discover, secrets, assist)."""
+    wrapper = _load_config_and_wrapper(config_file, dry_run, verbose, yes)
+
+    if parallel:
+        # Steps run non-interactively, so confirm once up front
+        if not (yes or dry_run):
+            typer.confirm(
+                "Do you want to proceed with this workflow?", abort=True)
+        success = wrapper.assignment_orchestrator_concurrent()
+    else:
+        success = wrapper.assignment_orchestrator()
 
     if success:
-        logger.info("✅ Student assistance completed successfully")
+        logger.info("%s Workflow completed successfully", _OK)
     else:
-        logger.error("❌ Student assistance failed")
+        logger.error("%s Workflow failed", _FAIL)
         raise typer.Exit(code=1)
 
 
+_register_wrapper_commands("sync", "discover", "secrets", "assist")
+
+
 @app.command()
 def setup():
     """Setup a new assignment configuration (Interactive Python wizard)."""
@@ -179,68 +225,7 @@ def setup():
         raise typer.Exit(code=1)
 
 
-@app.command(name="setup-bash")
-def setup_bash(
-    dry_run: bool = typer.Option(
-        False, "--dry-run", help="Show what would be done without executing"),
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Enable verbose output"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config-file", "-c", help="Path to configuration file"),
-    yes: bool = typer.Option(False, "--yes", "-y",
-                             help="Automatically answer yes to prompts")
-):
-    """Setup a new assignment configuration (Legacy bash version)."""
-    setup_logging(verbose)
-
-    # Load configuration
-    config = Configuration.load(config_file)
-
-    wrapper = BashWrapper(
-        config,
-        dry_run=dry_run,
-        verbose=verbose,
-        auto_yes=yes
-    )
-    success = wrapper.setup_assignment()
-
-    if success:
-        logger.info("✅ Setup completed successfully")
-    else:
-        logger.error("❌ Setup failed")
-        raise typer.Exit(code=1)
-
-
-@app.command()
-def update(
-    dry_run: bool = typer.Option(
-        False, "--dry-run", help="Show what would be done without executing"),
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Enable verbose output"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config-file", "-c", help="Path to configuration file"),
-    yes: bool = typer.Option(False, "--yes", "-y",
-                             help="Automatically answer yes to prompts")
-):
-    """Update assignment configuration and repositories."""
-    setup_logging(verbose)
-
-    # Load configuration
-    config = Configuration.load(config_file)
-
-    wrapper = BashWrapper(
-        config,
-        dry_run=dry_run,
-        verbose=verbose,
-        auto_yes=yes
-    )
-    success = wrapper.update_assignment()
-
-    if success:
-        logger.info("✅ Update completed successfully")
-    else:
-        logger.error("❌ Update failed")
-        raise typer.Exit(code=1)
+_register_wrapper_commands("setup-bash", "update")
 
 
 @app.command()
@@ -257,56 +242,17 @@ def cron(
                              help="Automatically answer yes to prompts")
 ):
     """Manage cron automation jobs."""
-    setup_logging(verbose)
-
-    # Load configuration
-    config = Configuration.load(config_file)
-
-    wrapper = BashWrapper(
-        config,
-        dry_run=dry_run,
-        verbose=verbose,
-        auto_yes=yes
-    )
+    wrapper = _load_config_and_wrapper(config_file, dry_run, verbose, yes)
     success = wrapper.manage_cron(action)
 
     if success:
-        logger.info("✅ Cron management completed successfully")
+        logger.info("%s Cron management completed successfully", _OK)
     else:
-        logger.error("❌ Cron management failed")
+        logger.error("%s Cron management failed", _FAIL)
         raise typer.Exit(code=1)
 
 
-@app.command(name="cron-sync")
-def cron_sync(
-    dry_run: bool = typer.Option(
-        False, "--dry-run", help="Show what would be done without executing"),
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Enable verbose output"),
-    config_file: str = typer.Option(
-        "assignment.conf", "--config-file", "-c", help="Path to configuration file"),
-    yes: bool = typer.Option(False, "--yes", "-y",
-                             help="Automatically answer yes to prompts")
-):
-    """Execute scheduled synchronization tasks."""
-    setup_logging(verbose)
-
-    # Load configuration
-    config = Configuration.load(config_file)
-
-    wrapper = BashWrapper(
-        config,
-        dry_run=dry_run,
-        verbose=verbose,
-        auto_yes=yes
-    )
-    success = wrapper.cron_sync()
-
-    if success:
-        logger.info("✅ Cron sync completed successfully")
-    else:
-        logger.error("❌ Cron sync failed")
-        raise typer.Exit(code=1)
+_register_wrapper_commands("cron-sync")
 
 
 @app.command()
@@ -329,17 +275,7 @@ def cycle(
                              help="Automatically answer yes to prompts")
 ):
     """Cycle repository collaborator permissions."""
-    setup_logging(verbose)
-
-    # Load configuration
-    config = Configuration.load(config_file)
-
-    wrapper = BashWrapper(
-        config,
-        dry_run=dry_run,
-        verbose=verbose,
-        auto_yes=yes
-    )
+    wrapper = _load_config_and_wrapper(config_file, dry_run, verbose, yes)
     success = wrapper.cycle_collaborator(
         assignment_prefix=assignment_prefix,
         username=username,
@@ -350,16 +286,17 @@ def cycle(
     )
 
     if success:
-        logger.info("✅ Collaborator cycling completed successfully")
+        logger.info("%s Collaborator cycling completed successfully", _OK)
     else:
-        logger.error("❌ Collaborator cycling failed")
+        logger.error("%s Collaborator cycling failed", _FAIL)
         raise typer.Exit(code=1)
 
 
 @app.command()
 def version():
     """Show version information."""
-    typer.echo("Classroom Pilot v1.0.0")
+    from ._version import get_version
+    typer.echo(f"Classroom Pilot v{get_version()}")
     typer.echo("Python CLI for GitHub Classroom automation")
 
 
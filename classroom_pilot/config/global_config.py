@@ -10,6 +10,7 @@ from typing import Dict, Optional, List
 from dataclasses import dataclass
 
 from ..utils import logger
+from ..utils.file_cache import FileParseCache
 
 
 @dataclass
@@ -101,11 +102,18 @@ class ConfigurationManager:
     def __init__(self):
         self._config: Optional[GlobalConfig] = None
         self._config_file_path: Optional[Path] = None
+        # Parsed configuration files, reused while unchanged on disk
+        self._parsed = FileParseCache()
 
     def load_config(self, config_file: Optional[str] = None, assignment_root: Optional[Path] = None) -> GlobalConfig:
         """
         Load configuration from assignment.conf file.
 
+        Each file is only parsed again if its modification time or size
+        changed since it was last loaded, so switching between configuration
+        files (e.g. the default and a command's --config) does not re-parse
+        either of them.
+
         Args:
             config_file: Configuration file name (default: assignment.conf)
             assignment_root: Root directory to look for config file
@@ -122,21 +130,28 @@ class ConfigurationManager:
         else:
             config_path = Path.cwd() / config_file
 
-        if not config_path.exists():
+        try:
+            stat = config_path.stat()
+        except OSError:
             raise FileNotFoundError(
                 f"Configuration file not found: {config_path}")
 
         self._config_file_path = config_path
+        self._config = self._parsed.load(config_path, self._load_file, stat)
+        return self._config
+
+    def _load_file(self, config_path: Path) -> GlobalConfig:
+        """Parse a configuration file into a GlobalConfig."""
         logger.info(f"Loading configuration from: {config_path}")
 
         # Parse the configuration file
         raw_config = self._parse_config_file(config_path)
 
         # Create GlobalConfig instance
-        self._config = self._create_global_config(raw_config)
+        config = self._create_global_config(raw_config)
 
         logger.info("✅ Configuration loaded successfully")
-        return self._config
+        return config
 
     def _parse_config_file(self, config_path: Path) -> Dict[str, str]:
         """Parse bash-style configuration file."""
@@ -9,9 +9,13 @@ and integrates with PathManager for automatic file discovery.
 from pathlib import Path
 from typing import Dict, Any, Optional
 from ..utils import get_logger, PathManager
+from ..utils.file_cache import FileParseCache
 
 logger = get_logger("config.loader")
 
+# Parsed configuration files, reused while unchanged on disk
+_PARSE_CACHE = FileParseCache()
+
 
 class ConfigLoader:
     """
@@ -103,29 +107,40 @@ class ConfigLoader:
             return {}
 
         try:
-            # Read configuration file (shell format)
-            config = {}
-            with open(self.config_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip comments and empty lines
-                    if not line or line.startswith('#'):
-                        continue
-
-                    # Parse variable assignments
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip().strip('"\'')  # Remove quotes
-                        config[key] = value
-
-            logger.info(f"Loaded configuration from {self.config_path}")
-            return config
+            stat = self.config_path.stat()
+        except OSError:
+            stat = None
 
+        try:
+            if stat is None:
+                return self._parse(self.config_path)
+            # Reuse the parsed result while the file is unchanged on disk
+            return _PARSE_CACHE.load(self.config_path, self._parse, stat)
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}")
             return {}
 
+    @staticmethod
+    def _parse(config_path: Path) -> Dict[str, Any]:
+        """Parse a shell-format configuration file into a dictionary."""
+        config = {}
+        with open(config_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                # Skip comments and empty lines
+                if not line or line.startswith('#'):
+                    continue
+
+                # Parse variable assignments
+                if '=' in line:
+                    key, value = line.split('=', 1)
+                    key = key.strip()
+                    value = value.strip().strip('"\'')  # Remove quotes
+                    config[key] = value
+
+        logger.info(f"Loaded configuration from {config_path}")
+        return config
+
     def get_value(self, key: str, default: Any = None) -> Any:
         """
         Retrieve a specific configuration value with optional default fallback.
@@ -200,6 +215,7 @@ class ConfigLoader:
             existing_config.update(updates)
 
             # Write back to file
+            _PARSE_CACHE.discard(self.config_path)
             with open(self.config_path, 'w') as f:
                 f.write("# GitHub Classroom Assignment Configuration\n")
                 f.write("# Updated by ConfigLoader\n\n")
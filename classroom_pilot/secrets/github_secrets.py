@@ -5,6 +5,7 @@ This module provides a comprehensive Python implementation
 for adding secrets to student GitHub repositories using global configuration.
 """
 
+import os
 import subprocess
 from datetime import datetime
 from pathlib import Path
@@ -16,6 +17,7 @@ import requests
 from ..utils import logger
 from ..config.global_config import get_global_config
 from ..utils.github_classroom_api import create_classroom_api_client, GitHubClassroomAPIError
+from ..utils.token_pool import TokenPool, load_extra_tokens
 
 
 class GitHubSecretsManager:
@@ -42,6 +44,8 @@ class GitHubSecretsManager:
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "classroom-pilot"
         }
+        # Extra tokens from GITHUB_TOKENS / GITHUB_TOKENS_FILE share the load
+        self._token_pool = TokenPool([self.github_token] + load_extra_tokens())
 
     def _get_github_token(self) -> str:
         """Get GitHub token using the centralized token manager."""
@@ -78,7 +82,6 @@ class GitHubSecretsManager:
         except (subprocess.CalledProcessError, FileNotFoundError):
             logger.warning("Could not get GitHub token from gh CLI")
             # Fallback to environment variable
-            import os
             token = os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN")
             if not token:
                 raise ValueError(
@@ -89,7 +92,10 @@ class GitHubSecretsManager:
         """Make authenticated GitHub API request."""
         full_url = f"{self.base_url}{url}" if url.startswith("/") else url
 
-        kwargs.setdefault("headers", {}).update(self.headers)
+        token = self._token_pool.next_token()
+        headers = kwargs.setdefault("headers", {})
+        headers.update(self.headers)
+        headers["Authorization"] = f"token {token}"
 
         if self.dry_run and method.upper() in ["POST", "PUT", "PATCH", "DELETE"]:
             logger.info(f"[DRY RUN] Would {method.upper()} {full_url}")
@@ -100,6 +106,7 @@ class GitHubSecretsManager:
             return mock_response
 
         response = requests.request(method, full_url, **kwargs)
+        self._token_pool.update(token, response.headers)
         response.raise_for_status()
         return response
 
@@ -241,11 +248,16 @@ class GitHubSecretsManager:
                 "--body", secret_value
             ]
 
+            env = None
+            if len(self._token_pool) > 1:
+                env = {**os.environ, "GH_TOKEN": self._token_pool.next_token()}
+
             _result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                env=env
             )
 
             action = "Created" if not existing_secret else "Updated"
@@ -0,0 +1,100 @@
+"""
+In-process cache of parsed files.
+
+Configuration, token and repository list files are read several times during
+one command. FileParseCache keeps the parsed result per file and parses again
+only when the file's modification time or size changes. read_list_file parses
+the one-entry-per-line lists (student-repos.txt, batch files) they point at.
+"""
+
+import copy
+import mmap
+import os
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+# A non-blank, non-comment line of a list file, without surrounding
+# whitespace ([^\S\n] is any whitespace except the line break)
+_LIST_LINE_PATTERN = r'^[^\S\n]*([^#\s][^\n]*?)[^\S\n]*$'
+_LIST_LINE_RE = re.compile(_LIST_LINE_PATTERN, re.MULTILINE)
+_LIST_LINE_BYTES_RE = re.compile(_LIST_LINE_PATTERN.encode(), re.MULTILINE)
+
+# List files larger than this are scanned through mmap, not read_text
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def read_list_file(path: Union[str, Path], size: int) -> List[str]:
+    """
+    Return the non-blank, non-comment lines of a list file, stripped.
+
+    Args:
+        path: File to read
+        size: Size of the file in bytes; large files are scanned through mmap
+    """
+    if size > _MMAP_THRESHOLD:
+        with open(path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [line.decode('utf-8', errors='replace')
+                    for line in _LIST_LINE_BYTES_RE.findall(mm)]
+
+    data = Path(path).read_text(encoding='utf-8', errors='replace')
+    return _LIST_LINE_RE.findall(data)
+
+
+def _resolve(path: Union[str, Path]) -> Path:
+    """Return ``path`` made absolute with symlinks resolved."""
+    return Path(os.path.realpath(path))
+
+
+class FileParseCache:
+    """
+    Parsed file contents keyed by resolved path and on-disk signature.
+
+    Entries are keyed by the resolved path (``os.path.realpath``, which is
+    ``Path.resolve()`` without its extra stat), so a relative path stays
+    correct after the working directory changes. Every call returns a deep
+    copy, so callers may modify what they get. Errors from the parser
+    propagate and nothing is stored; the oldest entries are dropped beyond
+    ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Path, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+
+    def load(self, path: Union[str, Path], parse: Callable[[Path], Any],
+             stat: Optional[os.stat_result] = None) -> Any:
+        """
+        Return the parsed contents of ``path``, calling ``parse`` on a miss.
+
+        Args:
+            path: File to read
+            parse: Called with the resolved path to parse the file
+            stat: A stat result the caller already has for ``path``
+
+        Raises:
+            OSError: If ``path`` cannot be stat'ed
+        """
+        key = _resolve(path)
+        if stat is None:
+            stat = os.stat(key)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._entries.get(key)
+        if cached is None or cached[0] != signature:
+            cached = (signature, parse(key))
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return copy.deepcopy(cached[1])
+
+    def discard(self, path: Union[str, Path]) -> None:
+        """Forget the entry for ``path``, e.g. before rewriting the file."""
+        self._entries.pop(_resolve(path), None)
+
+    def clear(self) -> None:
+        """Forget every entry."""
+        self._entries.clear()
@@ -10,10 +10,13 @@ https://docs.github.com/en/rest/classroom
 
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from . import logger
+from .token_manager import GITHUB_TOKENS_URL, parse_iso_datetime
 
 
 class GitHubClassroomAPIError(Exception):
@@ -42,6 +45,12 @@ class GitHubClassroomAPI:
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "classroom-pilot"
         }
+        # One keep-alive connection pool for every call made by this client
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4, pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.3)))
 
     def validate_token_scopes(self) -> Dict[str, bool]:
         """
@@ -52,22 +61,8 @@ class GitHubClassroomAPI:
         """
         try:
             # Make a request to get token information
-            response = requests.get(
-                f"{self.base_url}/user",
-                headers=self.headers
-            )
-
-            # Check for X-OAuth-Scopes header
-            scopes = response.headers.get('X-OAuth-Scopes', '')
-            scope_list = [s.strip() for s in scopes.split(',') if s.strip()]
-
-            return {
-                'valid': response.status_code == 200,
-                'scopes': scope_list,
-                'has_repo': 'repo' in scope_list or 'public_repo' in scope_list,
-                'has_read_org': 'read:org' in scope_list or 'admin:org' in scope_list or 'repo' in scope_list,
-                'status_code': response.status_code
-            }
+            response = self.session.get(f"{self.base_url}/user")
+            return self._scopes_from_response(response)
         except Exception as e:
             logger.debug(f"Error validating token scopes: {e}")
             return {
@@ -94,104 +89,147 @@ class GitHubClassroomAPI:
             - token_type: str - 'fine-grained' or 'classic'
             - error: str - Error message if check failed
         """
-        from datetime import datetime, timezone
-
         try:
             # Check token validity with rate limit endpoint (doesn't count against rate limit)
-            response = requests.get(
-                f"{self.base_url}/rate_limit",
-                headers=self.headers
-            )
+            response = self.session.get(f"{self.base_url}/rate_limit")
+            return self._expiration_from_response(response)
+        except Exception as e:
+            logger.debug(f"Error checking token expiration: {e}")
+            return {
+                'is_expired': False,
+                'is_valid': False,
+                'expires_at': None,
+                'days_remaining': None,
+                'token_type': 'unknown',
+                'error': str(e)
+            }
 
-            if response.status_code == 401:
-                # Token is invalid/expired, but try to get stored expiration date from token manager
-                stored_expires_at = None
-                stored_days_remaining = None
+    def validate_token(self) -> Dict[str, any]:
+        """
+        Check token expiration and scopes with a single request.
 
-                try:
-                    from ..utils.token_manager import GitHubTokenManager
-                    token_manager = GitHubTokenManager()
-                    token_data = token_manager._get_token_from_config()
-
-                    if token_data and isinstance(token_data, dict):
-                        stored_expires_at = token_data.get('expires_at')
-
-                        if stored_expires_at:
-                            try:
-                                expiry_date = datetime.fromisoformat(
-                                    stored_expires_at.replace('Z', '+00:00'))
-                                now = datetime.now(timezone.utc)
-                                stored_days_remaining = (
-                                    expiry_date - now).days
-                            except Exception as e:
-                                logger.debug(
-                                    f"Error parsing stored expiration date: {e}")
-                except Exception as e:
-                    logger.debug(
-                        f"Could not retrieve stored token expiration: {e}")
+        ``/rate_limit`` responses carry both the expiration header and
+        ``X-OAuth-Scopes``, so one round-trip answers what
+        check_token_expiration() and validate_token_scopes() would.
 
-                return {
-                    'is_expired': True,
-                    'is_valid': False,
-                    'expires_at': stored_expires_at,
-                    'days_remaining': stored_days_remaining if stored_days_remaining is not None else 0,
-                    'token_type': 'expired',
-                    'error': 'Token is invalid or expired (401 Unauthorized)'
-                }
+        Returns:
+            The check_token_expiration() keys merged with the
+            validate_token_scopes() keys (valid, scopes, has_repo,
+            has_read_org, status_code)
+        """
+        try:
+            response = self.session.get(f"{self.base_url}/rate_limit")
+            return {**self._scopes_from_response(response),
+                    **self._expiration_from_response(response)}
+        except Exception as e:
+            logger.debug(f"Error validating token: {e}")
+            return {
+                'is_expired': False,
+                'is_valid': False,
+                'expires_at': None,
+                'days_remaining': None,
+                'token_type': 'unknown',
+                'valid': False,
+                'scopes': [],
+                'has_repo': False,
+                'has_read_org': False,
+                'error': str(e)
+            }
 
-            if response.status_code != 200:
-                return {
-                    'is_expired': False,
-                    'is_valid': False,
-                    'expires_at': None,
-                    'days_remaining': None,
-                    'token_type': 'unknown',
-                    'error': f'Token validation failed with status {response.status_code}'
-                }
+    @staticmethod
+    def _scopes_from_response(response: requests.Response) -> Dict[str, any]:
+        """Read the token's scopes from the X-OAuth-Scopes header of a response."""
+        scopes = response.headers.get('X-OAuth-Scopes', '')
+        scope_list = [s.strip() for s in scopes.split(',') if s.strip()]
+
+        return {
+            'valid': response.status_code == 200,
+            'scopes': scope_list,
+            'has_repo': 'repo' in scope_list or 'public_repo' in scope_list,
+            'has_read_org': 'read:org' in scope_list or 'admin:org' in scope_list or 'repo' in scope_list,
+            'status_code': response.status_code
+        }
 
-            # Token is valid, now check if it has expiration info
-            # GitHub fine-grained tokens include expiration in X-GitHub-Authentication-Token-Expiration header
-            expiration_header = response.headers.get(
-                'X-GitHub-Authentication-Token-Expiration')
+    def _expiration_from_response(self, response: requests.Response) -> Dict[str, any]:
+        """Interpret an authenticated response as check_token_expiration() does."""
+        from datetime import datetime, timezone
 
-            if expiration_header:
-                # Fine-grained token with expiration
-                try:
-                    expires_at = datetime.fromisoformat(
-                        expiration_header.replace('Z', '+00:00'))
-                    now = datetime.now(timezone.utc)
-                    days_remaining = (expires_at - now).days
-
-                    return {
-                        'is_expired': days_remaining < 0,
-                        'is_valid': days_remaining >= 0,
-                        'expires_at': expiration_header,
-                        'days_remaining': days_remaining,
-                        'token_type': 'fine-grained'
-                    }
-                except Exception as e:
-                    logger.debug(f"Error parsing expiration date: {e}")
+        if response.status_code == 401:
+            # Token is invalid/expired, but try to get stored expiration date from token manager
+            stored_expires_at = None
+            stored_days_remaining = None
+
+            try:
+                from ..utils.token_manager import GitHubTokenManager
+                token_manager = GitHubTokenManager()
+                token_data = token_manager._get_token_from_config()
+
+                if token_data and isinstance(token_data, dict):
+                    stored_expires_at = token_data.get('expires_at')
+
+                    if stored_expires_at:
+                        try:
+                            expiry_date = parse_iso_datetime(stored_expires_at)
+                            now = datetime.now(timezone.utc)
+                            stored_days_remaining = (
+                                expiry_date - now).days
+                        except Exception as e:
+                            logger.debug(
+                                f"Error parsing stored expiration date: {e}")
+            except Exception as e:
+                logger.debug(
+                    f"Could not retrieve stored token expiration: {e}")
 
-            # Classic token (no expiration) or couldn't get expiration info
             return {
-                'is_expired': False,
-                'is_valid': True,
-                'expires_at': None,
-                'days_remaining': None,
-                'token_type': 'classic'
+                'is_expired': True,
+                'is_valid': False,
+                'expires_at': stored_expires_at,
+                'days_remaining': stored_days_remaining if stored_days_remaining is not None else 0,
+                'token_type': 'expired',
+                'error': 'Token is invalid or expired (401 Unauthorized)'
             }
 
-        except Exception as e:
-            logger.debug(f"Error checking token expiration: {e}")
+        if response.status_code != 200:
             return {
                 'is_expired': False,
                 'is_valid': False,
                 'expires_at': None,
                 'days_remaining': None,
                 'token_type': 'unknown',
-                'error': str(e)
+                'error': f'Token validation failed with status {response.status_code}'
             }
 
+        # Token is valid, now check if it has expiration info
+        # GitHub fine-grained tokens include expiration in X-GitHub-Authentication-Token-Expiration header
+        expiration_header = response.headers.get(
+            'X-GitHub-Authentication-Token-Expiration')
+
+        if expiration_header:
+            # Fine-grained token with expiration
+            try:
+                expires_at = parse_iso_datetime(expiration_header)
+                now = datetime.now(timezone.utc)
+                days_remaining = (expires_at - now).days
+
+                return {
+                    'is_expired': days_remaining < 0,
+                    'is_valid': days_remaining >= 0,
+                    'expires_at': expiration_header,
+                    'days_remaining': days_remaining,
+                    'token_type': 'fine-grained'
+                }
+            except Exception as e:
+                logger.debug(f"Error parsing expiration date: {e}")
+
+        # Classic token (no expiration) or couldn't get expiration info
+        return {
+            'is_expired': False,
+            'is_valid': True,
+            'expires_at': None,
+            'days_remaining': None,
+            'token_type': 'classic'
+        }
+
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """
         Make authenticated request to GitHub API.
@@ -208,10 +246,9 @@ class GitHubClassroomAPI:
             GitHubClassroomAPIError: If request fails
         """
         url = f"{self.base_url}{endpoint}"
-        kwargs.setdefault("headers", {}).update(self.headers)
 
         try:
-            response = requests.request(method, url, **kwargs)
+            response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
             return response
         except requests.RequestException as e:
@@ -229,7 +266,7 @@ class GitHubClassroomAPI:
                 error_message += "\n  • 'repo' - Full control of private repositories"
                 error_message += "\n  • 'read:org' - Read organization membership and team data"
                 error_message += "\n\n🔧 To fix this:"
-                error_message += "\n  1. Go to https://github.com/settings/tokens"
+                error_message += f"\n  1. Go to {GITHUB_TOKENS_URL}"
                 error_message += "\n  2. Generate a new token with 'repo' and 'read:org' scopes"
                 error_message += "\n  3. Run: classroom-pilot config set-token <your-token>"
             elif status_code == 403:
@@ -579,9 +616,9 @@ class GitHubClassroomAPI:
             List of repository URLs
         """
         try:
-            # Check token expiration first
-            logger.debug("Checking GitHub token expiration...")
-            expiration_info = self.check_token_expiration()
+            # Check token expiration and scopes first, in one request
+            logger.debug("Checking GitHub token expiration and scopes...")
+            expiration_info = scope_info = self.validate_token()
 
             if expiration_info.get('is_expired'):
                 logger.error("❌ GitHub token has EXPIRED!")
@@ -590,7 +627,7 @@ class GitHubClassroomAPI:
                 logger.error("")
                 logger.error("🔧 To fix this issue:")
                 logger.error(
-                    "  1. Generate a new token at: https://github.com/settings/tokens")
+                    f"  1. Generate a new token at: {GITHUB_TOKENS_URL}")
                 logger.error("  2. Select these scopes:")
                 logger.error(
                     "     ✓ repo (Full control of private repositories)")
@@ -611,7 +648,7 @@ class GitHubClassroomAPI:
                 logger.error("🔧 To fix this issue:")
                 logger.error("  1. Verify your token is correct")
                 logger.error(
-                    "  2. Generate a new token if needed: https://github.com/settings/tokens")
+                    f"  2. Generate a new token if needed: {GITHUB_TOKENS_URL}")
                 logger.error("  3. Update your token:")
                 logger.error(
                     "     classroom-pilot config set-token <your-token>")
@@ -636,9 +673,6 @@ class GitHubClassroomAPI:
                     "✓ Token is valid (classic token with no expiration)")
 
             # Validate token scopes before attempting to list repos
-            logger.debug("Validating GitHub token scopes...")
-            scope_info = self.validate_token_scopes()
-
             if not scope_info.get('valid'):
                 logger.error("❌ GitHub token validation failed")
                 if 'error' in scope_info:
@@ -737,7 +771,7 @@ class GitHubClassroomAPI:
         page = 1
 
         while True:
-            logger.debug(f"Fetching organization repositories page {page}")
+            logger.debug("Fetching organization repositories page %s", page)
 
             response = self._make_request(
                 "GET",
@@ -823,7 +857,7 @@ class GitHubClassroomAPI:
             # Student repositories should have the assignment prefix followed by a dash
             if repo_name.startswith(f"{assignment_prefix}-"):
                 student_repos.append(repo_url)
-                logger.debug(f"Found student repository: {repo_name}")
+                logger.debug("Found student repository: %s", repo_name)
 
         # Log template repositories found
         if template_repos:
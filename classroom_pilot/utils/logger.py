@@ -17,6 +17,9 @@ except ImportError:
 # Global logger instance
 logger = logging.getLogger("classroom_pilot")
 
+# Settings the handlers were last built with; None until setup_logging() runs
+_configured_with = None
+
 
 def setup_logging(verbose: bool = False, log_file: Optional[Path] = None) -> None:
     """
@@ -25,7 +28,18 @@ def setup_logging(verbose: bool = False, log_file: Optional[Path] = None) -> Non
     Args:
         verbose: Enable verbose (DEBUG) logging
         log_file: Optional log file path
+
+    Repeated calls with the same settings are no-ops, so a group callback and
+    the command it dispatches to can both call this without rebuilding the
+    handlers.
     """
+    global _configured_with
+
+    # The plain stream handler binds sys.stderr, so a swapped stream counts too
+    settings = (verbose, log_file, None if RICH_AVAILABLE else sys.stderr)
+    if settings == _configured_with and logger.handlers:
+        return
+
     # Set logging level
     level = logging.DEBUG if verbose else logging.INFO
 
@@ -73,6 +87,8 @@ def setup_logging(verbose: bool = False, log_file: Optional[Path] = None) -> Non
     # Set level for root logger to prevent duplicate messages
     logging.getLogger().setLevel(logging.WARNING)
 
+    _configured_with = settings
+
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for a specific module."""
@@ -13,9 +13,26 @@ import platform
 import subprocess
 
 from ..utils import get_logger
+from .file_cache import FileParseCache
 
 logger = get_logger("utils.token_manager")
 
+# Prefixes of GitHub tokens that can authenticate API calls: classic and
+# fine-grained PATs, OAuth, user-to-server and server-to-server (Actions) tokens
+GITHUB_TOKEN_PREFIXES = ('ghp_', 'github_pat_', 'gho_', 'ghu_', 'ghs_')
+# The same prefixes for messages, e.g. "'ghp_' or 'github_pat_' or ..."
+GITHUB_TOKEN_PREFIXES_TEXT = " or ".join(f"'{prefix}'" for prefix in GITHUB_TOKEN_PREFIXES)
+
+# Where users create personal access tokens
+GITHUB_TOKENS_URL = "https://github.com/settings/tokens"
+
+
+def parse_iso_datetime(value):
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC on Python 3.10."""
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
 
 class GitHubTokenManager:
     """
@@ -31,6 +48,8 @@ class GitHubTokenManager:
     def __init__(self):
         self.config_dir = Path.home() / ".config" / "classroom-pilot"
         self.config_file = self.config_dir / "token_config.json"
+        # The parsed config file, reused while unchanged on disk
+        self._config_cache = FileParseCache(maxsize=1)
 
     def get_github_token(self):
         """Get GitHub token with fallback strategy and expiration check.
@@ -75,7 +94,7 @@ class GitHubTokenManager:
         logger.error("❌ No GitHub token found")
         return None  # Let caller handle the setup
 
-    def save_token(self, token, expires_at=None, scopes=None):
+    def save_token(self, token, expires_at=None, scopes=None, verify=True):
         """
         Save a GitHub token to the config file with metadata.
 
@@ -84,16 +103,22 @@ class GitHubTokenManager:
             expires_at (str, optional): ISO format expiration date (e.g., "2026-10-19T00:00:00+00:00")
                                        If provided, this OVERRIDES any expiration from GitHub API
             scopes (list, optional): List of token scopes
+            verify (bool): Query GitHub for the token's metadata; when False the
+                           token is stored with only the given expiration and scopes
 
         Returns:
             bool: True if saved successfully, False otherwise
         """
         try:
-            # Verify token is valid
-            token_data = self._verify_and_get_token_info(token)
-            if not token_data:
-                logger.error("Failed to verify token")
-                return False
+            if verify:
+                # Verify token is valid
+                token_data = self._verify_and_get_token_info(token)
+                if not token_data:
+                    logger.error("Failed to verify token")
+                    return False
+            else:
+                token_data = {'token': token, 'verified_at': None,
+                              'scopes': [], 'expires_at': None}
 
             # IMPORTANT: Override expires_at if provided by user
             # This allows manual expiration tracking for classic tokens
@@ -117,22 +142,7 @@ class GitHubTokenManager:
             if scopes:
                 token_data['scopes'] = scopes
 
-            # Create config directory if it doesn't exist
-            self.config_dir.mkdir(parents=True, exist_ok=True)
-
-            # Prepare config data
-            config_data = {
-                'github_token': token_data,
-                'stored_at': datetime.now(timezone.utc).isoformat(),
-                'storage_type': 'config_file'
-            }
-
-            # Write to config file
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
-
-            # Set restrictive permissions (owner read/write only)
-            self.config_file.chmod(0o600)
+            self._write_token_config(token_data)
 
             logger.debug(f"Token saved to: {self.config_file}")
             return True
@@ -141,6 +151,41 @@ class GitHubTokenManager:
             logger.error(f"Failed to save token: {e}")
             return False
 
+    def _write_token_config(self, token_data):
+        """
+        Write the token config file atomically with owner-only permissions.
+
+        The data goes to a private (0600) temporary file that is then moved
+        into place, so readers never see a partial or world-readable token
+        file. The temporary file is removed if the write or the move fails.
+
+        Args:
+            token_data (dict): Token metadata to store under 'github_token'
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+
+        config_data = {
+            'github_token': token_data,
+            'stored_at': datetime.now(timezone.utc).isoformat(),
+            'storage_type': 'config_file'
+        }
+
+        tmp_file = self.config_file.with_name(self.config_file.name + '.tmp')
+        try:
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(config_data, f, indent=2)
+            # os.open's mode is filtered by the umask and ignored for an
+            # existing file; set it explicitly
+            os.chmod(tmp_file, 0o600)
+            os.replace(tmp_file, self.config_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
     def setup_new_token(self):
         """Guide user through setting up a new GitHub token.
 
@@ -166,7 +211,7 @@ class GitHubTokenManager:
             "  • workflow (update GitHub Actions workflows)", "")
 
         print_colored("\n🔗 Create a token at:", Colors.CYAN)
-        print_colored("  https://github.com/settings/tokens", "")
+        print_colored(f"  {GITHUB_TOKENS_URL}", "")
         print_colored("💡 Type 'q' or 'quit' to exit", Colors.CYAN)
 
         while True:
@@ -197,9 +242,9 @@ class GitHubTokenManager:
                 continue
 
             # Basic token format validation
-            if not (token.startswith('ghp_') or token.startswith('github_pat_')):
+            if not token.startswith(GITHUB_TOKEN_PREFIXES):
                 print_colored(
-                    "⚠️ Token should start with 'ghp_' (classic) or 'github_pat_' (fine-grained)", Colors.YELLOW)
+                    f"⚠️ Token should start with {GITHUB_TOKEN_PREFIXES_TEXT}", Colors.YELLOW)
                 proceed = input("Continue anyway? (y/n/q): ").strip().lower()
                 if proceed == 'q':
                     print_colored(
@@ -459,8 +504,7 @@ class GitHubTokenManager:
             return
 
         try:
-            expiry_date = datetime.fromisoformat(
-                expires_at.replace('Z', '+00:00'))
+            expiry_date = parse_iso_datetime(expires_at)
             now = datetime.now(timezone.utc)
             days_until_expiry = (expiry_date - now).days
 
@@ -489,16 +533,30 @@ class GitHubTokenManager:
             logger.debug(f"Keychain access failed: {e}")
         return None
 
-    def _get_token_from_config(self):
-        """Get token from user config file."""
+    def get_config(self):
+        """
+        Return the parsed token config file, or {} when it is missing or unreadable.
+
+        The parsed file is kept until its modification time or size changes,
+        so repeated lookups during one command read it from disk once.
+        """
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    return config.get('github_token')
+            return self._config_cache.load(self.config_file, self._read_config_file)
+        except FileNotFoundError:
+            return {}
         except Exception as e:
             logger.debug(f"Config file access failed: {e}")
-        return None
+            return {}
+
+    @staticmethod
+    def _read_config_file(config_file):
+        """Parse the JSON token config file."""
+        with open(config_file, 'r') as f:
+            return json.load(f)
+
+    def _get_token_from_config(self):
+        """Get token from user config file."""
+        return self.get_config().get('github_token')
 
     def _ask_storage_preference(self):
         """Ask user where to store the token."""
@@ -583,19 +641,7 @@ class GitHubTokenManager:
 
         elif storage_choice == 3:
             # Config file
-            self.config_dir.mkdir(parents=True, exist_ok=True)
-
-            config_data = {
-                'github_token': token_data,
-                'stored_at': datetime.now(timezone.utc).isoformat(),
-                'storage_type': 'config_file'
-            }
-
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
-
-            # Set restrictive permissions
-            self.config_file.chmod(0o600)
+            self._write_token_config(token_data)
 
             print_colored(
                 f"✅ Token stored in: {self.config_file}", Colors.GREEN)
@@ -0,0 +1,131 @@
+"""
+Round-robin pool of GitHub API tokens.
+
+Large batch runs (secrets for a whole class, collaborator cycling) can use up
+a single token's hourly rate limit. Additional tokens can be supplied through
+the ``GITHUB_TOKENS`` environment variable (separated by commas or
+whitespace) or a file named by ``GITHUB_TOKENS_FILE`` (one token per line).
+Requests are spread across all tokens, and tokens that are close to their
+limit are skipped until their rate-limit window resets.
+"""
+
+import itertools
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Mapping, Optional
+
+from .logger import get_logger
+
+logger = get_logger("utils.token_pool")
+
+# Tokens with fewer remaining requests than this are skipped while others have more
+RATE_LIMIT_FLOOR = 50
+
+
+@dataclass
+class RateLimit:
+    """Last known rate-limit state of a token."""
+    remaining: Optional[int] = None
+    reset: float = 0.0
+
+    def exhausted(self, now: float) -> bool:
+        """Return True if the token should be skipped at time ``now``."""
+        return (self.remaining is not None
+                and self.remaining < RATE_LIMIT_FLOOR
+                and now < self.reset)
+
+
+def load_extra_tokens() -> List[str]:
+    """
+    Read additional API tokens from ``GITHUB_TOKENS`` and ``GITHUB_TOKENS_FILE``.
+
+    Blank lines and lines starting with ``#`` in the token file are ignored.
+
+    Returns:
+        Tokens in the order they were given (may be empty)
+    """
+    tokens = re.split(r'[\s,]+', os.getenv('GITHUB_TOKENS', ''))
+
+    token_file = os.getenv('GITHUB_TOKENS_FILE')
+    if token_file:
+        try:
+            lines = Path(token_file).expanduser().read_text(
+                encoding='utf-8').splitlines()
+        except OSError as e:
+            logger.warning("Could not read GITHUB_TOKENS_FILE: %s", e)
+        else:
+            tokens.extend(line.strip() for line in lines
+                          if not line.lstrip().startswith('#'))
+
+    return [token for token in tokens if token]
+
+
+class TokenPool:
+    """
+    Hand out GitHub tokens round-robin, skipping tokens near their rate limit.
+
+    Thread-safe, so one pool can be shared by concurrent batch workers.
+    """
+
+    def __init__(self, tokens: List[str]):
+        """
+        Initialize the pool.
+
+        Args:
+            tokens: API tokens; duplicates are dropped, order is kept
+        """
+        self.tokens = list(dict.fromkeys(t for t in tokens if t))
+        self._limits = {token: RateLimit() for token in self.tokens}
+        self._cycle = itertools.cycle(self.tokens)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def next_token(self) -> Optional[str]:
+        """
+        Return the next token that is not close to its rate limit.
+
+        If every token is near its limit, the one with the most remaining
+        requests is returned. Returns None for an empty pool.
+        """
+        if not self.tokens:
+            return None
+
+        now = time.time()
+        with self._lock:
+            for _ in range(len(self.tokens)):
+                token = next(self._cycle)
+                if not self._limits[token].exhausted(now):
+                    return token
+            return max(self.tokens,
+                       key=lambda t: self._limits[t].remaining or 0)
+
+    def update(self, token: str, headers: Mapping[str, str]) -> None:
+        """
+        Record a token's rate-limit state from response headers.
+
+        Args:
+            token: Token the request was made with
+            headers: Response headers (``X-RateLimit-Remaining``/``-Reset``)
+        """
+        limit = self._limits.get(token)
+        if limit is None:
+            return
+
+        lowered = {name.lower(): value for name, value in headers.items()}
+        try:
+            remaining = int(lowered['x-ratelimit-remaining'])
+        except (KeyError, TypeError, ValueError):
+            return
+
+        with self._lock:
+            limit.remaining = remaining
+            try:
+                limit.reset = float(lowered.get('x-ratelimit-reset', 0))
+            except (TypeError, ValueError):
+                limit.reset = 0.0
@@ -45,6 +45,7 @@ import subprocess
 import sys
 import os
 from pathlib import Path
+from unittest.mock import patch
 import pytest
 
 
@@ -155,6 +156,48 @@ class TestBasicCLI:
         assert success, f"Version flag failed: {stderr}"
         assert "v" in stdout.lower() or "version" in stdout.lower()
 
+    @pytest.mark.parametrize("args", [
+        ["--version"],
+        ["--config", "other.conf", "--version"],
+        ["--assignment-root=/tmp", "--version", "--help"],
+    ])
+    def test_version_flag_skips_typer(self, args):
+        """Test --version before any subcommand is answered without Typer."""
+        script = (
+            "import atexit, sys\n"
+            f"sys.argv = ['classroom-pilot'] + {args!r}\n"
+            "atexit.register(lambda: sys.stderr.write(\n"
+            "    'TYPER:%s' % ('typer' in sys.modules)))\n"
+            "import classroom_pilot.cli\n"
+        )
+        success, stdout, stderr = run_cli_command(
+            [sys.executable, "-c", script])
+
+        from classroom_pilot.cli import _version_text
+        assert success, f"Version fast path failed: {stderr}"
+        assert stdout == _version_text() + "\n"
+        assert "TYPER:False" in stderr
+
+    def test_version_after_subcommand_uses_typer(self):
+        """Test --version after a subcommand is left to Typer."""
+        from classroom_pilot.cli import _version_requested
+        assert not _version_requested(["repos", "--version"])
+        assert not _version_requested(["--help", "--version"])
+
+    def test_group_invocation_registers_only_that_group(self):
+        """Test running one group skips building the other groups."""
+        script = (
+            "import sys\n"
+            "sys.argv = ['classroom-pilot', 'repos', '--help']\n"
+            "from classroom_pilot.cli import app\n"
+            "print(' '.join(g.name for g in app.registered_groups))\n"
+        )
+        success, stdout, stderr = run_cli_command(
+            [sys.executable, "-c", script])
+
+        assert success, f"CLI import failed: {stderr}"
+        assert stdout.split() == ["repos"]
+
     def test_help_without_config(self):
         """Test help works without configuration file."""
         # First, try to verify the module can be imported
@@ -189,6 +232,44 @@ class TestBasicCLI:
         assert "usage:" in stdout_lower or "usage" in stdout_lower, f"'Usage:' not found in stdout: {stdout}"
 
 
+class TestShellCompletion:
+    """Test the bash completion fast path for top-level command groups."""
+
+    def test_fast_path_lists_registered_groups(self):
+        """Test the static command list matches the groups on the app."""
+        from classroom_pilot.cli import app, _TOP_LEVEL_COMMANDS
+
+        registered = tuple(group.name for group in app.registered_groups)
+        assert _TOP_LEVEL_COMMANDS == registered
+
+    @pytest.mark.parametrize("incomplete", ["", "a", "rep", "x"])
+    def test_fast_path_skips_typer(self, incomplete):
+        """Test first-word completion is answered before Typer is imported."""
+        script = (
+            "import sys, runpy\n"
+            "try:\n"
+            "    runpy.run_module('classroom_pilot.cli', run_name='cli')\n"
+            "finally:\n"
+            "    sys.stderr.write('TYPER:%s' % ('typer' in sys.modules))\n"
+        )
+        env = os.environ.copy()
+        env.update({
+            "_CLASSROOM_PILOT_COMPLETE": "complete_bash",
+            "COMP_WORDS": f"classroom-pilot {incomplete}",
+            "COMP_CWORD": "1",
+        })
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True, text=True, timeout=30, env=env)
+
+        expected = [name for name in
+                    ("assignments", "repos", "secrets", "automation", "config")
+                    if name.startswith(incomplete)]
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.splitlines() == (expected or [""])
+        assert "TYPER:False" in result.stderr
+
+
 class TestWorkflowCommands:
     """Test main workflow commands with dry-run."""
 
@@ -208,6 +289,18 @@ class TestWorkflowCommands:
         # Dry run message appears in stderr from logger
         assert "[DRY RUN]" in stderr or "Dry run:" in stderr or "DRY RUN:" in stderr
 
+    def test_dry_run_report_skips_unset_options(self):
+        """Test that dry-run lines for options that were not given are omitted."""
+        from classroom_pilot import cli
+
+        with patch.object(cli.logger, "info") as mock_info:
+            cli._log_dry_run("secrets.add", repo_count=2, assignment_root=None)
+
+        assert [c.args[0] for c in mock_info.call_args_list] == [
+            "DRY RUN: Would add secrets to student repositories",
+            "DRY RUN: Would process 2 specified repositories",
+        ]
+
     @pytest.mark.skipif(
         os.getenv("CI") and not (
             os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN")),
@@ -263,6 +356,93 @@ class TestManagementCommands:
         # Dry run message appears in stderr from logger
         assert "DRY RUN:" in stderr
 
+    @patch('classroom_pilot.services.automation_service.AutomationService.cron_status')
+    def test_cron_status_report_single_echo(self, mock_status):
+        """Test the cron-status report is written with one echo call."""
+        from types import SimpleNamespace
+        from typer.testing import CliRunner
+        from classroom_pilot.cli import app
+
+        jobs = [SimpleNamespace(steps=["sync"], schedule="0 2 * * *", command="cmd"),
+                SimpleNamespace(steps=["secrets", "cycle"], schedule="0 3 * * *", command="cmd")]
+        mock_status.return_value = (True, SimpleNamespace(
+            has_jobs=True, total_jobs=2, installed_jobs=jobs,
+            log_file_exists=True, last_log_activity="a\nb\nc\nd"))
+
+        with patch('typer.echo') as mock_echo:
+            result = CliRunner().invoke(app, ["automation", "cron-status"])
+
+        assert result.exit_code == 0
+        mock_echo.assert_called_once()
+        report = mock_echo.call_args.args[0]
+        assert "📅 Steps: secrets, cycle" in report
+        assert report.endswith("   b\n   c\n   d")
+
+    @pytest.mark.parametrize("outcome,exit_code", [
+        ("SUCCESS", 0), ("PARTIAL_FAILURE", 2),
+        ("COMPLETE_FAILURE", 1), ("ENVIRONMENT_ERROR", 1),
+    ])
+    @patch('classroom_pilot.services.automation_service.AutomationService.cron_sync')
+    def test_cron_sync_exit_codes(self, mock_sync, outcome, exit_code, tmp_path):
+        """Test cron-sync maps each overall result to its exit code."""
+        from classroom_pilot.automation.cron_sync import CronSyncExecutionResult, CronSyncResult
+        from typer.testing import CliRunner
+        from classroom_pilot.cli import app
+
+        log_file = tmp_path / "cron.log"
+        log_file.write_text("first\nsecond\n")
+        mock_sync.return_value = (True, CronSyncExecutionResult(
+            overall_result=CronSyncResult[outcome], steps_executed=[],
+            total_execution_time=1.0, log_file_path=str(log_file),
+            error_summary="boom"))
+
+        result = CliRunner().invoke(app, ["automation", "cron-sync", "--show-log"])
+
+        assert result.exit_code == exit_code
+
+    @patch('classroom_pilot.automation.cron_sync.CronSyncManager')
+    def test_cron_sync_dry_run_skips_manager(self, mock_manager, tmp_path, monkeypatch):
+        """Test cron-sync dry run reports the plan without building the sync manager."""
+        from typer.testing import CliRunner
+        from classroom_pilot.cli import app
+
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(
+            app, ["automation", "--dry-run", "cron-sync", "sync", "secrets"])
+
+        assert result.exit_code == 0
+        mock_manager.assert_not_called()
+        assert not (tmp_path / "tools").exists()
+
+    def test_cron_sync_dry_run_rejects_invalid_step(self, tmp_path, monkeypatch):
+        """Test cron-sync dry run fails on an unknown step instead of reporting a plan."""
+        from typer.testing import CliRunner
+        from classroom_pilot.cli import app
+
+        monkeypatch.chdir(tmp_path)
+        with patch('classroom_pilot.cli.logger') as mock_logger:
+            result = CliRunner().invoke(
+                app, ["automation", "--dry-run", "cron-sync", "sync", "bogus"])
+
+        assert result.exit_code == 1
+        assert "bogus" in mock_logger.error.call_args.args[0]
+        assert not (tmp_path / "tools").exists()
+
+    @patch('classroom_pilot.services.automation_service.AutomationService.cron_schedules')
+    def test_automation_command_error_exits_1(self, mock_schedules):
+        """Test an unexpected service error is logged and turned into exit code 1."""
+        from typer.testing import CliRunner
+        from classroom_pilot.cli import app
+
+        mock_schedules.side_effect = RuntimeError("crontab missing")
+
+        with patch('classroom_pilot.cli.logger') as mock_logger:
+            result = CliRunner().invoke(app, ["automation", "cron-schedules"])
+
+        assert result.exit_code == 1
+        assert mock_logger.error.call_args.args[:3] == (
+            "%s: %s", "Failed to list schedules", mock_schedules.side_effect)
+
 
 class TestCycleCommands:
     """
@@ -282,6 +462,132 @@ class TestCycleCommands:
         assert "Cycle collaborator permissions" in stdout or "cycle" in stdout.lower()
 
 
+class TestCommandExitCodes:
+    """
+    Test that commands surface the exit code they choose.
+
+    typer.Exit derives from Exception, so an exit raised inside a broad
+    ``except Exception`` block would be swallowed and re-raised as code 1.
+    """
+
+    @patch('classroom_pilot.services.assignment_service.AssignmentService.check_student')
+    def test_check_student_needs_update_exits_with_code_2(self, mock_check):
+        """Test check-student exits with 2 when the repository needs an update."""
+        from typer.testing import CliRunner
+        from classroom_pilot.cli import app
+
+        mock_check.return_value = (False, "Repository needs update")
+
+        result = CliRunner().invoke(
+            app, ["assignments", "check-student",
+                  "https://github.com/org/assignment-student123"])
+
+        assert result.exit_code == 2
+        assert "Student status check failed" not in result.output
+
+    @patch('classroom_pilot.services.assignment_service.AssignmentService.check_student')
+    def test_check_student_not_accessible_exits_with_code_1(self, mock_check):
+        """Test check-student exits with 1 when the repository is not accessible."""
+        from typer.testing import CliRunner
+        from classroom_pilot.cli import app
+
+        mock_check.return_value = (False, "Repository not accessible")
+
+        result = CliRunner().invoke(
+            app, ["assignments", "check-student",
+                  "https://github.com/org/assignment-student123"])
+
+        assert result.exit_code == 1
+
+    @pytest.mark.parametrize("result_name, exit_code", [
+        ("SUCCESS", 0),
+        ("UP_TO_DATE", 0),
+        ("NETWORK_ERROR", 1),
+        ("GIT_ERROR", 1),
+    ])
+    def test_push_to_classroom_result_exit_codes(self, result_name, exit_code):
+        """Test push-to-classroom maps each push result to its exit code."""
+        from typer.testing import CliRunner
+        from classroom_pilot.cli import app
+        from classroom_pilot.assignments.push_manager import PushResult
+
+        with patch('classroom_pilot.cli.get_global_config'), \
+                patch('classroom_pilot.assignments.push_manager.ClassroomPushManager') as mock_cls:
+            mock_cls.return_value.execute_push_workflow.return_value = (
+                PushResult[result_name], "push finished")
+            result = CliRunner().invoke(
+                app, ["assignments", "push-to-classroom", "--non-interactive"])
+
+        assert result.exit_code == exit_code
+
+
+class TestLoadStudentRepos:
+    """Test parsing and caching of the student repository list file."""
+
+    def test_repeated_loads_reuse_parsed_file(self, tmp_path):
+        """Test an unchanged file is parsed once and a rewritten one again."""
+        from classroom_pilot.cli import load_student_repos, _read_student_repos
+
+        repo_file = tmp_path / "student-repos.txt"
+        repo_file.write_text(
+            "# comment\n  https://github.com/org/a-s1  \n\n\t#indented\n")
+
+        with patch('classroom_pilot.cli._read_student_repos',
+                   wraps=_read_student_repos) as mock_read:
+            first = load_student_repos(str(repo_file))
+            second = load_student_repos(str(repo_file))
+
+        assert first == second == ["https://github.com/org/a-s1"]
+        assert mock_read.call_count == 1
+
+        repo_file.write_text(
+            "https://github.com/org/a-s1\nhttps://github.com/org/a-s2\n")
+        assert len(load_student_repos(str(repo_file))) == 2
+
+    def test_large_file_matches_small_file_parsing(self, tmp_path):
+        """Test the mmap path for large rosters parses like the text path."""
+        from classroom_pilot import cli
+        from classroom_pilot.utils import file_cache
+
+        entries = "".join(
+            f"  https://github.com/org/a-s{i}\t\r\n# note\r\n\r\n"
+            for i in range(3000))
+        repo_file = tmp_path / "student-repos.txt"
+        repo_file.write_bytes(entries.encode())
+        assert repo_file.stat().st_size > file_cache._MMAP_THRESHOLD
+
+        repos = cli.load_student_repos(str(repo_file))
+
+        assert len(repos) == 3000
+        assert repos[0] == "https://github.com/org/a-s0"
+        assert repos[-1] == "https://github.com/org/a-s2999"
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test a missing file still raises FileNotFoundError."""
+        from classroom_pilot.cli import load_student_repos
+
+        with pytest.raises(FileNotFoundError, match="Repository file not found"):
+            load_student_repos(str(tmp_path / "missing.txt"))
+
+
+class TestSelectStudentRepo:
+    """Test the interactive student repository selector."""
+
+    def test_menu_lists_students_and_returns_choice(self, capsys):
+        """Test the menu shows every repository and returns the chosen URL."""
+        from classroom_pilot.cli import select_student_repo_interactive
+
+        repos = ["https://github.com/org/a-s1", "https://github.com/org/a-s2"]
+        with patch('builtins.input', return_value="2"):
+            selected = select_student_repo_interactive(repos)
+
+        out = capsys.readouterr().out
+        assert selected == repos[1]
+        assert "  1. a-s1\n     https://github.com/org/a-s1\n" in out
+        assert "  0. Cancel\n" in out
+        assert "Selected: a-s2" in out
+
+
 class TestGlobalOptions:
     """
     TestGlobalOptions contains comprehensive tests for global CLI options that apply
@@ -477,3 +783,92 @@ STUDENT_FILES=assignment.ipynb
         assert success, f"Assignment root with custom config failed: {stderr}"
         # Should show that it loaded the custom config from the assignment root
         assert "custom.conf" in stderr or "Configuration loaded" in stderr
+
+
+class TestLegacyCLI:
+    """
+    Tests for the legacy bash-wrapper CLI in classroom_pilot.cli_legacy.
+
+    Commands are only materialized when the app is invoked, and the
+    configuration/bash wrapper stacks are imported by the command that needs
+    them, so parser-only paths must not pull them in.
+    """
+
+    def test_help_does_not_load_command_dependencies(self):
+        """Test that rendering --help leaves heavy command modules unloaded."""
+        script = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from classroom_pilot.cli_legacy import app\n"
+            "result = CliRunner().invoke(app, ['--help'])\n"
+            "assert result.exit_code == 0, result.output\n"
+            "loaded = [m for m in ('classroom_pilot.bash_wrapper',\n"
+            "                      'classroom_pilot.config',\n"
+            "                      'classroom_pilot.assignments', 'rich')\n"
+            "          if m in sys.modules]\n"
+            "print('LOADED:' + ','.join(loaded))\n"
+        )
+        success, stdout, stderr = run_cli_command(
+            [sys.executable, "-c", script])
+
+        assert success, f"Legacy CLI help failed: {stderr}"
+        assert "LOADED:\n" in stdout, f"Unexpected imports: {stdout}"
+
+    def test_wrapper_commands_keep_their_option_declarations(self):
+        """Test table-built commands keep each command's own flags and defaults."""
+        from typer.testing import CliRunner
+        from classroom_pilot.cli_legacy import app
+
+        runner = CliRunner()
+        sync_help = runner.invoke(app, ["sync", "--help"]).output
+        update_help = runner.invoke(app, ["update", "--help"]).output
+
+        assert "--no-dry-run" in sync_help and "-c," not in sync_help
+        assert "-c, --config-file" in update_help
+        assert "assignment.conf" in update_help
+        assert "--no-dry-run" not in update_help
+
+    def test_run_parallel_overlaps_secrets_and_assist(self, tmp_path):
+        """Test run --parallel executes the orchestrator steps in workflow order."""
+        from typer.testing import CliRunner
+        from classroom_pilot.bash_wrapper import BashWrapper
+        from classroom_pilot.cli_legacy import app
+
+        config_file = tmp_path / "assignment.conf"
+        config_file.write_text('CLASSROOM_URL="https://classroom.github.com/a/x"\n')
+
+        with patch.object(BashWrapper, "_execute_script",
+                          return_value=True) as mock_execute:
+            result = CliRunner().invoke(
+                app, ["run", "--parallel", "--yes", "--config-file", str(config_file)])
+
+        assert result.exit_code == 0, result.output
+        steps = [call.args[1][1] for call in mock_execute.call_args_list]
+        assert steps[:2] == ["sync", "discover"]
+        assert sorted(steps[2:4]) == ["assist", "secrets"]
+        assert steps[4] == "cycle"
+
+    def test_bash_wrapper_session_prepares_environment_once(self):
+        """Test a BashWrapper session reuses the environment across scripts."""
+        from classroom_pilot.bash_wrapper import BashWrapper
+
+        wrapper = BashWrapper({"CLASSROOM_URL": "https://classroom.github.com/a/x"})
+
+        with patch.object(BashWrapper, "_get_script_path",
+                          return_value=Path("/bin/true")) as mock_path, \
+                patch.object(BashWrapper, "_prepare_environment",
+                             wraps=wrapper._prepare_environment) as mock_env, \
+                patch("subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = ""
+            with wrapper:
+                assert wrapper.push_to_classroom()
+                assert wrapper.fetch_student_repos()
+                assert wrapper.push_to_classroom()
+
+            assert mock_env.call_count == 1
+            assert mock_path.call_count == 2
+
+            # Outside the session every script prepares its own environment
+            wrapper.push_to_classroom()
+            assert mock_env.call_count == 2
@@ -5,6 +5,8 @@ These tests verify the functionality of the config subcommand group
 including token management operations.
 """
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from typer.testing import CliRunner
@@ -51,14 +53,12 @@ class TestConfigSetToken:
     def test_set_token_with_valid_token(self, runner, mock_token_manager, mock_api_client):
         """Test setting a valid token with all required scopes."""
         # Setup mocks
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': False,
             'is_valid': True,
             'expires_at': '2026-01-01T00:00:00+00:00',
             'days_remaining': 74,
-            'token_type': 'fine-grained'
-        }
-        mock_api_client.validate_token_scopes.return_value = {
+            'token_type': 'fine-grained',
             'valid': True,
             'scopes': ['repo', 'read:org'],
             'has_repo': True,
@@ -77,7 +77,7 @@ class TestConfigSetToken:
 
     def test_set_token_with_expired_token(self, runner, mock_token_manager, mock_api_client):
         """Test setting an expired token fails."""
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': True,
             'is_valid': False,
             'expires_at': '2025-10-01T00:00:00+00:00',
@@ -95,7 +95,7 @@ class TestConfigSetToken:
 
     def test_set_token_with_invalid_token(self, runner, mock_token_manager, mock_api_client):
         """Test setting an invalid token fails."""
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': False,
             'is_valid': False,
             'expires_at': None,
@@ -114,14 +114,12 @@ class TestConfigSetToken:
 
     def test_set_token_missing_repo_scope(self, runner, mock_token_manager, mock_api_client):
         """Test setting token without repo scope shows warning and prompts user."""
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': False,
             'is_valid': True,
             'expires_at': None,
             'days_remaining': None,
-            'token_type': 'classic'
-        }
-        mock_api_client.validate_token_scopes.return_value = {
+            'token_type': 'classic',
             'valid': True,
             'scopes': ['public_repo'],
             'has_repo': False,
@@ -142,14 +140,12 @@ class TestConfigSetToken:
 
     def test_set_token_missing_scopes_with_confirmation(self, runner, mock_token_manager, mock_api_client):
         """Test setting token with missing scopes when user confirms."""
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': False,
             'is_valid': True,
             'expires_at': None,
             'days_remaining': None,
-            'token_type': 'classic'
-        }
-        mock_api_client.validate_token_scopes.return_value = {
+            'token_type': 'classic',
             'valid': True,
             'scopes': ['public_repo'],
             'has_repo': False,
@@ -167,6 +163,14 @@ class TestConfigSetToken:
         assert "✅ Token updated successfully!" in result.stdout
         mock_token_manager.save_token.assert_called_once()
 
+    def test_set_token_prompt_without_input_declines(self, runner, mock_token_manager, mock_api_client):
+        """Test a prompt with nothing on stdin takes its default instead of aborting."""
+        result = runner.invoke(app, ["config", "set-token", "not_a_github_token_1234567890"])
+
+        assert result.exit_code == 0
+        mock_api_client.validate_token.assert_not_called()
+        mock_token_manager.save_token.assert_not_called()
+
     def test_set_token_with_force_flag(self, runner, mock_token_manager, mock_api_client):
         """Test setting token with --force flag bypasses validation."""
         mock_token_manager.save_token.return_value = True
@@ -179,20 +183,18 @@ class TestConfigSetToken:
         assert result.exit_code == 0
         assert "✅ Token updated successfully!" in result.stdout
         mock_token_manager.save_token.assert_called_once()
+        assert mock_token_manager.save_token.call_args.kwargs['verify'] is False
         # Validation methods should not be called with --force
-        mock_api_client.check_token_expiration.assert_not_called()
-        mock_api_client.validate_token_scopes.assert_not_called()
+        mock_api_client.validate_token.assert_not_called()
 
     def test_set_token_invalid_format_with_confirmation(self, runner, mock_token_manager, mock_api_client):
         """Test setting token with invalid format shows warning."""
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': False,
             'is_valid': True,
             'expires_at': None,
             'days_remaining': None,
-            'token_type': 'classic'
-        }
-        mock_api_client.validate_token_scopes.return_value = {
+            'token_type': 'classic',
             'valid': True,
             'scopes': ['repo', 'read:org'],
             'has_repo': True,
@@ -208,18 +210,17 @@ class TestConfigSetToken:
 
         assert result.exit_code == 0
         assert "⚠️ Token doesn't start with 'ghp_' or 'github_pat_'" in result.stdout
+        assert "'gho_' or 'ghu_' or 'ghs_'" in result.stdout
         mock_token_manager.save_token.assert_called_once()
 
     def test_set_token_expiring_soon_warning(self, runner, mock_token_manager, mock_api_client):
         """Test setting token that expires soon shows warning."""
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': False,
             'is_valid': True,
             'expires_at': '2025-10-25T00:00:00+00:00',
             'days_remaining': 6,
-            'token_type': 'fine-grained'
-        }
-        mock_api_client.validate_token_scopes.return_value = {
+            'token_type': 'fine-grained',
             'valid': True,
             'scopes': ['repo', 'read:org'],
             'has_repo': True,
@@ -239,14 +240,12 @@ class TestConfigSetToken:
 
     def test_set_token_with_expires_at_parameter(self, runner, mock_token_manager, mock_api_client):
         """Test setting token with explicit expiration date."""
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': False,
             'is_valid': True,
             'expires_at': None,
             'days_remaining': None,
-            'token_type': 'classic'
-        }
-        mock_api_client.validate_token_scopes.return_value = {
+            'token_type': 'classic',
             'valid': True,
             'scopes': ['repo', 'read:org'],
             'has_repo': True,
@@ -269,14 +268,12 @@ class TestConfigSetToken:
 
     def test_set_token_with_invalid_expires_at_format(self, runner, mock_token_manager, mock_api_client):
         """Test setting token with invalid expiration date format."""
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': False,
             'is_valid': True,
             'expires_at': None,
             'days_remaining': None,
-            'token_type': 'classic'
-        }
-        mock_api_client.validate_token_scopes.return_value = {
+            'token_type': 'classic',
             'valid': True,
             'scopes': ['repo', 'read:org'],
             'has_repo': True,
@@ -319,14 +316,12 @@ class TestConfigCheckToken:
     def test_check_token_valid_with_expiration(self, runner, mock_token_manager, mock_api_client):
         """Test check-token with valid token that has expiration."""
         mock_token_manager.get_github_token.return_value = "ghp_valid123"
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': False,
             'is_valid': True,
             'expires_at': '2026-01-01T00:00:00+00:00',
             'days_remaining': 74,
-            'token_type': 'fine-grained'
-        }
-        mock_api_client.validate_token_scopes.return_value = {
+            'token_type': 'fine-grained',
             'valid': True,
             'scopes': ['repo', 'read:org', 'workflow'],
             'has_repo': True,
@@ -346,7 +341,7 @@ class TestConfigCheckToken:
     def test_check_token_expired(self, runner, mock_token_manager, mock_api_client):
         """Test check-token with expired token."""
         mock_token_manager.get_github_token.return_value = "ghp_expired123"
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': True,
             'is_valid': False,
             'expires_at': '2025-10-17T00:00:00+00:00',
@@ -365,14 +360,12 @@ class TestConfigCheckToken:
     def test_check_token_expiring_soon(self, runner, mock_token_manager, mock_api_client):
         """Test check-token with token expiring soon."""
         mock_token_manager.get_github_token.return_value = "ghp_expiring123"
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': False,
             'is_valid': True,
             'expires_at': '2025-10-25T00:00:00+00:00',
             'days_remaining': 6,
-            'token_type': 'fine-grained'
-        }
-        mock_api_client.validate_token_scopes.return_value = {
+            'token_type': 'fine-grained',
             'valid': True,
             'scopes': ['repo', 'read:org'],
             'has_repo': True,
@@ -389,14 +382,12 @@ class TestConfigCheckToken:
     def test_check_token_classic_no_expiration(self, runner, mock_token_manager, mock_api_client):
         """Test check-token with classic token (no expiration)."""
         mock_token_manager.get_github_token.return_value = "ghp_classic123"
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': False,
             'is_valid': True,
             'expires_at': None,
             'days_remaining': None,
-            'token_type': 'classic'
-        }
-        mock_api_client.validate_token_scopes.return_value = {
+            'token_type': 'classic',
             'valid': True,
             'scopes': ['repo', 'read:org'],
             'has_repo': True,
@@ -414,14 +405,12 @@ class TestConfigCheckToken:
     def test_check_token_missing_repo_scope(self, runner, mock_token_manager, mock_api_client):
         """Test check-token with token missing repo scope."""
         mock_token_manager.get_github_token.return_value = "ghp_limited123"
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': False,
             'is_valid': True,
             'expires_at': None,
             'days_remaining': None,
-            'token_type': 'classic'
-        }
-        mock_api_client.validate_token_scopes.return_value = {
+            'token_type': 'classic',
             'valid': True,
             'scopes': ['public_repo', 'read:org'],
             'has_repo': False,
@@ -438,14 +427,12 @@ class TestConfigCheckToken:
     def test_check_token_missing_read_org_scope(self, runner, mock_token_manager, mock_api_client):
         """Test check-token with token missing read:org scope."""
         mock_token_manager.get_github_token.return_value = "ghp_limited123"
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': False,
             'is_valid': True,
             'expires_at': None,
             'days_remaining': None,
-            'token_type': 'classic'
-        }
-        mock_api_client.validate_token_scopes.return_value = {
+            'token_type': 'classic',
             'valid': True,
             'scopes': ['repo'],
             'has_repo': True,
@@ -462,7 +449,7 @@ class TestConfigCheckToken:
     def test_check_token_invalid(self, runner, mock_token_manager, mock_api_client):
         """Test check-token with invalid token."""
         mock_token_manager.get_github_token.return_value = "ghp_invalid123"
-        mock_api_client.check_token_expiration.return_value = {
+        mock_api_client.validate_token.return_value = {
             'is_expired': False,
             'is_valid': False,
             'expires_at': None,
@@ -476,6 +463,40 @@ class TestConfigCheckToken:
         assert result.exit_code == 1
         assert "❌ Token is invalid" in result.stdout
 
+    def test_check_token_json_valid(self, runner, mock_token_manager, mock_api_client):
+        """Test --json prints one object and exits 0 for a valid token."""
+        mock_token_manager.get_github_token.return_value = "ghp_valid123"
+        mock_api_client.validate_token.return_value = {
+            'is_expired': False,
+            'is_valid': True,
+            'expires_at': None,
+            'days_remaining': None,
+            'token_type': 'classic',
+            'valid': True,
+            'scopes': ['repo'],
+            'has_repo': True,
+            'has_read_org': True,
+            'status_code': 200
+        }
+
+        result = runner.invoke(app, ["config", "check-token", "--json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == {
+            'valid': True, 'token_type': 'classic', 'expires_at': None,
+            'days_remaining': None, 'scopes': ['repo'], 'has_repo': True,
+            'has_read_org': True, 'error': None}
+
+    def test_check_token_json_without_token(self, runner, mock_token_manager, mock_api_client):
+        """Test --json reports a missing token without calling the API."""
+        mock_token_manager.get_github_token.return_value = None
+
+        result = runner.invoke(app, ["config", "check-token", "--json"])
+
+        assert result.exit_code == 1
+        assert json.loads(result.stdout)['error'] == 'No GitHub token found'
+        mock_api_client.validate_token.assert_not_called()
+
 
 class TestConfigAppIntegration:
     """Integration tests for config app commands."""
@@ -495,3 +516,61 @@ class TestConfigAppIntegration:
 
         # Typer shows error when no subcommand provided
         assert result.exit_code == 2
+
+
+class TestExpiryTiers:
+    """Tests for the shared token expiry message selection."""
+
+    @pytest.mark.parametrize("days,tier,level", [
+        (-1, 0, "warning"), (7, 0, "warning"), (8, 1, "info"),
+        (30, 1, "info"), (31, 2, "info"),
+    ])
+    def test_log_expiry_tiers(self, days, tier, level):
+        """Test each day count maps to the week/month/later message."""
+        import logging
+        from classroom_pilot.cli import _log_expiry
+
+        messages = ("week %s", "month %s", "later %s")
+        with patch('classroom_pilot.cli.logger') as mock_logger:
+            _log_expiry(days, messages)
+
+        mock_logger.log.assert_called_once_with(
+            getattr(logging, level.upper()), messages[tier], days)
+
+
+class TestValidateToken:
+    """Tests for the combined expiration and scope check."""
+
+    @patch('classroom_pilot.utils.github_classroom_api.requests.Session.get')
+    def test_validate_token_uses_one_request(self, mock_get):
+        """Test expiration and scopes are both read from a single response."""
+        from classroom_pilot.utils.github_classroom_api import GitHubClassroomAPI
+
+        mock_get.return_value = Mock(status_code=200, headers={
+            'X-OAuth-Scopes': 'repo, read:org',
+            'X-GitHub-Authentication-Token-Expiration': '2999-01-01T00:00:00+00:00',
+        })
+
+        info = GitHubClassroomAPI("ghp_token").validate_token()
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args.args[0].endswith("/rate_limit")
+        assert info['is_valid'] and info['valid']
+        assert info['token_type'] == 'fine-grained'
+        assert info['scopes'] == ['repo', 'read:org']
+        assert info['has_repo'] and info['has_read_org']
+
+    def test_client_reuses_one_session(self):
+        """Test token checks and API calls go through the client's pooled session."""
+        from classroom_pilot.utils.github_classroom_api import GitHubClassroomAPI
+
+        client = GitHubClassroomAPI("ghp_token")
+        assert client.session.headers["Authorization"] == "token ghp_token"
+
+        with patch.object(client.session, 'request') as mock_request:
+            mock_request.return_value = Mock(status_code=200, headers={})
+            client.validate_token()
+            client._make_request("GET", "/classrooms")
+
+        assert [c.args[1] for c in mock_request.call_args_list] == [
+            "https://api.github.com/rate_limit", "https://api.github.com/classrooms"]
@@ -1209,6 +1209,34 @@ GITHUB_ORGANIZATION=test-org"""
             assert config1['CLASSROOM_URL'] == 'https://classroom.github.com/test'
             assert config2['CLASSROOM_URL'] == 'https://classroom.github.com/test'
 
+    def test_integration_parse_cache_tracks_file_changes(self):
+        """
+        Test that repeated loads reuse the parsed result until the file changes.
+
+        This test verifies that a second load of an unchanged file is served
+        from the in-process parse cache without reopening the file, and that
+        rewriting the file with different content is picked up immediately.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "cached.conf"
+            config_path.write_text("CLASSROOM_URL=https://classroom.github.com/a\n")
+
+            with patch('classroom_pilot.config.loader.PathManager'):
+                loader = ConfigLoader(config_path)
+                first = loader.load()
+
+                with patch('builtins.open', side_effect=AssertionError("re-read")):
+                    second = loader.load()
+
+                assert second == first
+                second['EXTRA'] = 'mutated'
+                assert 'EXTRA' not in loader.load()
+
+                config_path.write_text(
+                    "CLASSROOM_URL=https://classroom.github.com/changed\n")
+                assert loader.load()['CLASSROOM_URL'] == \
+                    'https://classroom.github.com/changed'
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
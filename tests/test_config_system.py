@@ -6,6 +6,7 @@ Tests configuration loading, validation, and generation.
 
 from pathlib import Path
 import pytest
+from unittest.mock import patch
 
 from classroom_pilot.config.loader import ConfigLoader
 from classroom_pilot.config.validator import ConfigValidator
@@ -465,3 +466,41 @@ ASSIGNMENT_FILE="assignment.ipynb"
             assert config.github_organization == "relative-org"
         finally:
             os.chdir(original_cwd)
+
+    def test_load_config_reuses_unchanged_file(self, tmp_path):
+        """Test reloading an unchanged file skips parsing, a changed one does not."""
+        from classroom_pilot.config.global_config import ConfigurationManager
+
+        config_file = tmp_path / "assignment.conf"
+        config_file.write_text('GITHUB_ORGANIZATION="first-org"\n')
+        manager = ConfigurationManager()
+
+        with patch.object(manager, '_parse_config_file',
+                          wraps=manager._parse_config_file) as mock_parse:
+            first = manager.load_config(assignment_root=tmp_path)
+            second = manager.load_config(assignment_root=tmp_path)
+            assert second == first and second is not first
+            assert mock_parse.call_count == 1
+
+            config_file.write_text('GITHUB_ORGANIZATION="second-organization"\n')
+            third = manager.load_config(assignment_root=tmp_path)
+
+        assert mock_parse.call_count == 2
+        assert third.github_organization == "second-organization"
+
+    def test_load_config_alternating_files_parse_once(self, tmp_path):
+        """Test switching between two unchanged files parses each only once."""
+        from classroom_pilot.config.global_config import ConfigurationManager
+
+        (tmp_path / "assignment.conf").write_text('GITHUB_ORGANIZATION="org-a"\n')
+        (tmp_path / "other.conf").write_text('GITHUB_ORGANIZATION="org-b"\n')
+        manager = ConfigurationManager()
+
+        with patch.object(manager, '_parse_config_file',
+                          wraps=manager._parse_config_file) as mock_parse:
+            orgs = [manager.load_config(name, tmp_path).github_organization
+                    for name in ("assignment.conf", "other.conf") * 2]
+
+        assert orgs == ["org-a", "org-b", "org-a", "org-b"]
+        assert mock_parse.call_count == 2
+        assert manager.get_config_file_path() == tmp_path / "other.conf"
@@ -7,13 +7,13 @@ status checking, validation, and error handling.
 
 import pytest
 import subprocess
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import Mock, patch
 from pathlib import Path
 from datetime import datetime
 
 from classroom_pilot.automation.cron_manager import (
     CronManager, CronJob, CronJobType, CronOperationResult,
-    CronValidationResult, CronStatus
+    CronValidationResult, CronStatus, read_last_lines
 )
 from classroom_pilot.config import GlobalConfig
 
@@ -421,6 +421,26 @@ class TestCronInstallation:
         assert "successfully" in message
         mock_set_crontab.assert_called_once()
 
+    @patch('classroom_pilot.automation.cron_manager.CronManager.validate_prerequisites')
+    @patch('classroom_pilot.automation.cron_manager.CronManager._get_current_crontab')
+    @patch('classroom_pilot.automation.cron_manager.CronManager._set_crontab')
+    def test_install_cron_job_reads_crontab_once(
+        self, mock_set_crontab, mock_get_crontab, mock_validate_prereq, cron_manager
+    ):
+        """Test that the existence check and the update share one crontab read."""
+        mock_validate_prereq.return_value = CronValidationResult(True, [], [])
+        mock_get_crontab.return_value = "0 0 * * * /existing/command\n"
+        mock_set_crontab.return_value = True
+
+        result, _ = cron_manager.install_cron_job(
+            ["sync", "secrets"], "0 */4 * * *")
+
+        assert result == CronOperationResult.SUCCESS
+        mock_get_crontab.assert_called_once()
+        new_crontab = mock_set_crontab.call_args.args[0]
+        assert new_crontab.startswith("0 0 * * * /existing/command\n")
+        assert "cron-sync" in new_crontab and "sync secrets" in new_crontab
+
     @patch('classroom_pilot.automation.cron_manager.CronManager.validate_prerequisites')
     def test_install_cron_job_prereq_failure(self, mock_validate_prereq, cron_manager):
         """Test cron job installation with prerequisite validation failure."""
@@ -691,14 +711,13 @@ class TestCronStatus:
         assert secrets_job.schedule == "0 2 * * *"
 
     @patch('classroom_pilot.automation.cron_manager.CronManager._get_current_crontab')
-    @patch('classroom_pilot.automation.cron_manager.Path.exists')
-    @patch('builtins.open', new_callable=mock_open, read_data="Log line 1\nLog line 2\nLog line 3\n")
     def test_get_cron_status_with_log_file(
-        self, mock_file, mock_exists, mock_get_crontab, cron_manager
+        self, mock_get_crontab, cron_manager, tmp_path
     ):
         """Test getting status with log file present."""
         mock_get_crontab.return_value = None
-        mock_exists.return_value = True
+        cron_manager.log_file_path = tmp_path / "cron.log"
+        cron_manager.log_file_path.write_text("Log line 0\nLog line 1\nLog line 2\nLog line 3\n")
 
         status = cron_manager.get_cron_status()
 
@@ -706,6 +725,16 @@ class TestCronStatus:
         assert status.log_file_path == cron_manager.log_file_path
         assert status.last_log_activity == "Log line 1\nLog line 2\nLog line 3"
 
+    def test_read_last_lines_spans_blocks(self, tmp_path):
+        """Test that the log tail is found when it crosses read blocks."""
+        log_file = tmp_path / "cron.log"
+        log_file.write_text("".join(f"entry {i:05d}\n" for i in range(5000)))
+
+        assert read_last_lines(log_file, 3, block_size=16) == [
+            "entry 04997", "entry 04998", "entry 04999"]
+        assert read_last_lines(log_file, 0) == []
+        assert len(read_last_lines(log_file, 10000)) == 5000
+
     @patch('classroom_pilot.automation.cron_manager.subprocess.run')
     @patch('classroom_pilot.automation.cron_manager.Path.exists')
     @patch('classroom_pilot.automation.cron_manager.Path.stat')
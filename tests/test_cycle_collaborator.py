@@ -7,6 +7,7 @@ error handling scenarios, and batch processing operations.
 """
 
 import json
+import os
 import subprocess
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -214,6 +215,25 @@ class TestCycleCollaboratorManager:
 
         assert result is False
 
+    def test_check_pending_invitations_records_pooled_token_limits(self, cycle_manager):
+        """Test a pooled request reads the body and the token's rate-limit headers."""
+        from classroom_pilot.utils.token_pool import TokenPool
+
+        cycle_manager._token_pool = TokenPool(["ghp_pooled"])
+        body = json.dumps([{"invitee": {"login": "user"}, "id": 123}])
+        response = Mock(
+            stdout=f'HTTP/2.0 200 OK\r\nX-Ratelimit-Remaining: 7\r\n'
+                   f'X-Ratelimit-Reset: 4102444800\r\n\r\n{body}',
+            returncode=0, stderr="")
+
+        with patch('subprocess.run', return_value=response) as mock_run:
+            assert cycle_manager._check_pending_invitations("owner", "repo", "user") is True
+
+        assert mock_run.call_args.args[0] == [
+            'gh', 'api', '--include', 'repos/owner/repo/invitations']
+        assert mock_run.call_args.kwargs['env']['GH_TOKEN'] == "ghp_pooled"
+        assert cycle_manager._token_pool._limits["ghp_pooled"].remaining == 7
+
     def test_check_repository_status_ok(self, cycle_manager):
         """Test repository status check for working repository."""
         with patch.object(cycle_manager, '_check_repository_accessibility', return_value=True), \
@@ -276,7 +296,8 @@ class TestCycleCollaboratorManager:
 
         assert result is True
         mock_run.assert_called_once_with(
-            ['gh', 'api', 'repos/owner/repo/collaborators/user', '--method', 'DELETE'],
+            ['gh', 'api', '--include', 'repos/owner/repo/collaborators/user',
+             '--method', 'DELETE'],
             capture_output=True,
             text=True,
             check=True
@@ -301,7 +322,7 @@ class TestCycleCollaboratorManager:
 
         assert result is True
         mock_run.assert_called_once_with([
-            'gh', 'api', 'repos/owner/repo/collaborators/user',
+            'gh', 'api', '--include', 'repos/owner/repo/collaborators/user',
             '--method', 'PUT',
             '--field', 'permission=write'
         ], capture_output=True, text=True, check=True)
@@ -316,6 +337,38 @@ class TestCycleCollaboratorManager:
 
         assert result is False
 
+    @patch('time.sleep')
+    @patch('subprocess.run')
+    def test_add_collaborator_retries_after_retry_after(self, mock_run, mock_sleep,
+                                                        cycle_manager):
+        """Test a 403 carrying Retry-After is retried after the given delay."""
+        limited = subprocess.CalledProcessError(1, 'gh api')
+        limited.stdout = "HTTP/2.0 403 Forbidden\r\nRetry-After: 2\r\n\r\n{}"
+        mock_run.side_effect = [limited, Mock(returncode=0)]
+
+        result = cycle_manager._add_collaborator(
+            "owner", "repo", "user", "write")
+
+        assert result is True
+        assert mock_run.call_count == 2
+        mock_sleep.assert_called_once_with(2)
+
+    @patch('time.sleep')
+    @patch('subprocess.run')
+    def test_add_collaborator_does_not_retry_plain_forbidden(self, mock_run, mock_sleep,
+                                                             cycle_manager):
+        """Test a 403 without rate limit headers fails without retrying."""
+        forbidden = subprocess.CalledProcessError(1, 'gh api')
+        forbidden.stdout = "HTTP/2.0 403 Forbidden\r\n\r\n{\"message\": \"rate limit\"}"
+        mock_run.side_effect = forbidden
+
+        result = cycle_manager._add_collaborator(
+            "owner", "repo", "user", "write")
+
+        assert result is False
+        assert mock_run.call_count == 1
+        mock_sleep.assert_not_called()
+
     def test_cycle_single_repository_already_ok(self, cycle_manager):
         """Test cycling when repository access is already OK."""
         mock_status = RepositoryStatus(
@@ -475,7 +528,8 @@ class TestCycleCollaboratorManager:
             actions_taken=[]
         )
 
-        with patch.object(cycle_manager, 'cycle_single_repository', side_effect=[mock_result1, mock_result2]):
+        with patch.object(cycle_manager, 'check_repository_statuses', return_value={}), \
+                patch.object(cycle_manager, 'cycle_single_repository', side_effect=[mock_result1, mock_result2]):
             results = cycle_manager.cycle_multiple_repositories(
                 repo_urls, "user")
 
@@ -484,6 +538,75 @@ class TestCycleCollaboratorManager:
             assert results[1].result == CycleResult.SKIPPED
             assert mock_sleep.call_count == 2  # Sleep between operations
 
+    @patch('subprocess.run')
+    def test_check_repository_statuses_batches_graphql(self, mock_run, cycle_manager):
+        """Test repository statuses are fetched with one GraphQL query."""
+        graphql_response = Mock(returncode=1, stdout=json.dumps({
+            "data": {
+                "r0": {"collaborators": {"totalCount": 1}},
+                "r1": {"collaborators": {"totalCount": 0}},
+                "r2": None,
+            },
+            "errors": [{"type": "NOT_FOUND", "path": ["r2"]}]
+        }))
+        invitations_response = Mock(returncode=0, stdout=json.dumps(
+            [{"invitee": {"login": "user"}}]))
+        mock_run.side_effect = [graphql_response, invitations_response]
+
+        targets = [
+            ("https://github.com/owner/repo1", "user"),
+            ("https://github.com/owner/repo2", "user"),
+            ("https://github.com/owner/missing", "user"),
+            ("not-a-url", "user"),
+        ]
+        statuses = cycle_manager.check_repository_statuses(targets)
+
+        graphql_cmd = mock_run.call_args_list[0][0][0]
+        assert graphql_cmd[:3] == ['gh', 'api', 'graphql']
+        assert 'n2=missing' in graphql_cmd
+        assert mock_run.call_count == 2
+
+        ok = statuses[targets[0]]
+        assert ok.access_status == AccessStatus.OK
+        assert ok.needs_cycling is False
+
+        corrupted = statuses[targets[1]]
+        assert corrupted.access_status == AccessStatus.CORRUPTED
+        assert corrupted.has_pending_invitation is True
+        assert corrupted.needs_cycling is True
+
+        missing = statuses[targets[2]]
+        assert missing.accessible is False
+        assert missing.access_status == AccessStatus.NOT_FOUND
+
+        # Unparseable URLs are left for the per-repository check
+        assert targets[3] not in statuses
+
+    def test_query_collaborators_graphql_uses_pooled_token(self, cycle_manager):
+        """Test the batched GraphQL query runs with the next pooled token."""
+        from classroom_pilot.utils.token_pool import TokenPool
+
+        cycle_manager._token_pool = TokenPool(["ghp_pooled"])
+        response = Mock(returncode=0, stdout=json.dumps({
+            "data": {"r0": {"collaborators": {"totalCount": 1}}}}))
+
+        with patch('subprocess.run', return_value=response) as mock_run:
+            data = cycle_manager._query_collaborators_graphql(
+                [("owner", "repo", "user")])
+
+        assert data == {"r0": {"collaborators": {"totalCount": 1}}}
+        assert mock_run.call_args.kwargs['env']['GH_TOKEN'] == "ghp_pooled"
+
+    @patch('subprocess.run')
+    def test_check_repository_statuses_request_failure(self, mock_run, cycle_manager):
+        """Test a failed GraphQL request leaves every target unresolved."""
+        mock_run.side_effect = FileNotFoundError("gh")
+
+        statuses = cycle_manager.check_repository_statuses(
+            [("https://github.com/owner/repo1", "user")])
+
+        assert statuses == {}
+
     def test_extract_username_from_repo_url_with_prefix(self, cycle_manager):
         """Test username extraction from repository URL with assignment prefix."""
         test_cases = [
@@ -540,7 +663,8 @@ class TestCycleCollaboratorManager:
             actions_taken=[]
         )
 
-        with patch.object(cycle_manager, 'cycle_single_repository', side_effect=[mock_result1, mock_result2]):
+        with patch.object(cycle_manager, 'check_repository_statuses', return_value={}), \
+                patch.object(cycle_manager, 'cycle_single_repository', side_effect=[mock_result1, mock_result2]):
             summary = cycle_manager.batch_cycle_from_file(
                 batch_file, repo_url_mode=True)
 
@@ -575,7 +699,8 @@ class TestCycleCollaboratorManager:
             actions_taken=[]
         )
 
-        with patch.object(cycle_manager, 'cycle_single_repository', side_effect=[mock_result1, mock_result2]):
+        with patch.object(cycle_manager, 'check_repository_statuses', return_value={}), \
+                patch.object(cycle_manager, 'cycle_single_repository', side_effect=[mock_result1, mock_result2]):
             summary = cycle_manager.batch_cycle_from_file(
                 batch_file, repo_url_mode=False)
 
@@ -584,6 +709,111 @@ class TestCycleCollaboratorManager:
             assert summary.skipped_operations == 1
             assert summary.failed_operations == 0
 
+    def test_batch_cycle_from_file_prefetches_statuses(self, cycle_manager, tmp_path):
+        """Test batch cycling checks all repositories in one batched lookup."""
+        batch_file = tmp_path / "usernames.txt"
+        batch_file.write_text("student1\nstudent2\n")
+
+        url1 = "https://github.com/test-org/assignment1-student1"
+        url2 = "https://github.com/test-org/assignment1-student2"
+        status1 = RepositoryStatus(
+            repo_url=url1,
+            username="student1",
+            accessible=True,
+            has_collaborator_access=True,
+            has_pending_invitation=False,
+            access_status=AccessStatus.OK,
+            needs_cycling=False
+        )
+        skipped = CycleOperation(
+            repo_url=url1,
+            username="student1",
+            result=CycleResult.SKIPPED,
+            message="Already OK",
+            actions_taken=[]
+        )
+
+        with patch.object(cycle_manager, 'check_repository_statuses',
+                          return_value={(url1, "student1"): status1}) as mock_statuses, \
+                patch.object(cycle_manager, 'cycle_single_repository',
+                             return_value=skipped) as mock_cycle:
+            summary = cycle_manager.batch_cycle_from_file(
+                batch_file, repo_url_mode=False)
+
+        mock_statuses.assert_called_once_with(
+            [(url1, "student1"), (url2, "student2")])
+        passed = {c.args[0]: c.kwargs["status"] for c in mock_cycle.call_args_list}
+        assert passed == {url1: status1, url2: None}
+        assert summary.total_repositories == 2
+
+    def test_batch_cycle_from_parsed_concurrency(self, cycle_manager):
+        """Test batch cycling runs repositories concurrently, keeping order."""
+        import threading
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def cycle(repo_url, username, force, status=None):
+            barrier.wait()  # only passes if three calls are in flight
+            return CycleOperation(
+                repo_url=repo_url,
+                username=username,
+                result=CycleResult.SUCCESS,
+                message="Success",
+                actions_taken=[]
+            )
+
+        with patch.object(cycle_manager, 'check_repository_statuses', return_value={}), \
+                patch.object(cycle_manager, 'cycle_single_repository', side_effect=cycle):
+            summary = cycle_manager.batch_cycle_from_parsed(
+                ["student1", "student2", "student3"], concurrency=3)
+
+        assert summary.successful_operations == 3
+        assert summary.errors == []
+
+    def test_batch_cycle_from_file_reuses_parsed_entries(self, cycle_manager, tmp_path):
+        """Test an unchanged batch file is parsed once across runs."""
+        batch_file = tmp_path / "usernames.txt"
+        batch_file.write_text("# roster\nstudent1\n")
+
+        from classroom_pilot.utils.file_cache import read_list_file
+
+        with patch.object(cycle_manager, 'batch_cycle_from_parsed') as mock_parsed, \
+                patch('classroom_pilot.assignments.cycle_collaborator.read_list_file',
+                      wraps=read_list_file) as mock_read:
+            cycle_manager.batch_cycle_from_file(batch_file)
+            cycle_manager.batch_cycle_from_file(batch_file)
+
+        assert mock_read.call_count == 1
+        assert [c.args[0] for c in mock_parsed.call_args_list] == [
+            ["student1"], ["student1"]]
+
+    def test_batch_cycle_from_file_large_file(self, cycle_manager, tmp_path):
+        """Test a batch file above the mmap threshold parses like a small one."""
+        from classroom_pilot.utils import file_cache
+
+        entries = [f"student{i}" for i in range(8000)]
+        batch_file = tmp_path / "roster.txt"
+        batch_file.write_text(
+            "# roster\n\n" + "\n".join(f"  {e}\r" for e in entries) + "\n")
+        assert batch_file.stat().st_size > file_cache._MMAP_THRESHOLD
+
+        with patch.object(cycle_manager, 'batch_cycle_from_parsed') as mock_parsed:
+            cycle_manager.batch_cycle_from_file(batch_file)
+
+        assert mock_parsed.call_args.args[0] == entries
+
+    def test_batch_cycle_from_file_uses_given_stat(self, cycle_manager, tmp_path):
+        """Test a stat result from the caller is reused instead of a new stat."""
+        batch_file = tmp_path / "given-stat.txt"
+        batch_file.write_text("student1\nstudent2\n")
+        file_stat = os.stat(batch_file)
+
+        with patch.object(cycle_manager, 'batch_cycle_from_parsed') as mock_parsed, \
+                patch.object(Path, 'stat', side_effect=AssertionError("stat called")):
+            cycle_manager.batch_cycle_from_file(batch_file, file_stat=file_stat)
+
+        assert mock_parsed.call_args.args[0] == ["student1", "student2"]
+
     def test_batch_cycle_from_file_no_prefix(self, cycle_manager, tmp_path):
         """Test batch cycling from file in username mode without assignment prefix."""
         cycle_manager.assignment_prefix = None
@@ -671,3 +901,23 @@ class TestCycleCollaboratorManager:
         assert "Successful Operations: 3" in captured.out
         assert "Error 1" in captured.out
         assert "Error 2" in captured.out
+
+    def test_display_batch_summary_single_write(self, cycle_manager):
+        """Test that the summary is written to the given stream in one call."""
+        summary = BatchSummary(
+            total_repositories=2,
+            successful_operations=1,
+            skipped_operations=0,
+            failed_operations=1,
+            repositories_fixed=1,
+            repositories_already_ok=0,
+            errors=["Error 1"]
+        )
+        out = Mock()
+
+        cycle_manager.display_batch_summary(summary, file=out)
+
+        out.write.assert_called_once()
+        text = out.write.call_args.args[0]
+        assert text.startswith("\n=== Batch Operation Summary ===\n")
+        assert text.endswith("  • Error 1\n")
@@ -0,0 +1,83 @@
+"""
+Tests for the round-robin GitHub token pool.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from classroom_pilot.utils.token_pool import TokenPool, load_extra_tokens
+
+
+class TestTokenPool:
+    """Test token rotation and rate-limit skipping."""
+
+    def test_round_robin(self):
+        """Tokens are handed out in turn; duplicates are dropped."""
+        pool = TokenPool(["a", "b", "a", "c"])
+
+        assert len(pool) == 3
+        assert [pool.next_token() for _ in range(4)] == ["a", "b", "c", "a"]
+
+    def test_skips_token_near_limit(self):
+        """A token below the floor is skipped until its window resets."""
+        pool = TokenPool(["a", "b"])
+        reset = str(int(time.time()) + 600)
+        pool.update("a", {"X-RateLimit-Remaining": "3",
+                          "X-RateLimit-Reset": reset})
+
+        assert [pool.next_token() for _ in range(3)] == ["b", "b", "b"]
+
+        pool.update("a", {"X-RateLimit-Remaining": "3",
+                          "X-RateLimit-Reset": str(int(time.time()) - 1)})
+        assert "a" in {pool.next_token() for _ in range(2)}
+
+    def test_all_exhausted_returns_most_remaining(self):
+        """When every token is near its limit the fullest one is used."""
+        pool = TokenPool(["a", "b"])
+        reset = str(int(time.time()) + 600)
+        pool.update("a", {"x-ratelimit-remaining": "1", "x-ratelimit-reset": reset})
+        pool.update("b", {"x-ratelimit-remaining": "7", "x-ratelimit-reset": reset})
+
+        assert pool.next_token() == "b"
+
+    def test_empty_pool(self):
+        """An empty pool yields no token."""
+        assert TokenPool([]).next_token() is None
+
+    def test_load_extra_tokens(self, tmp_path, monkeypatch):
+        """Tokens are read from GITHUB_TOKENS and GITHUB_TOKENS_FILE."""
+        token_file = tmp_path / "tokens.txt"
+        token_file.write_text("# class tokens\nghp_two\n\nghp_three\n")
+        monkeypatch.setenv("GITHUB_TOKENS", "ghp_one, ghp_two")
+        monkeypatch.setenv("GITHUB_TOKENS_FILE", str(token_file))
+
+        assert load_extra_tokens() == ["ghp_one", "ghp_two", "ghp_two", "ghp_three"]
+
+
+class TestSecretsManagerTokenRotation:
+    """Test that GitHubSecretsManager spreads API requests across tokens."""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        monkeypatch.setenv("GITHUB_TOKENS", "ghp_extra")
+        monkeypatch.delenv("GITHUB_TOKENS_FILE", raising=False)
+        from classroom_pilot.secrets.github_secrets import GitHubSecretsManager
+        with patch('classroom_pilot.secrets.github_secrets.get_global_config',
+                   return_value=MagicMock()), \
+                patch.object(GitHubSecretsManager, '_get_github_token',
+                             return_value='ghp_main'):
+            return GitHubSecretsManager()
+
+    def test_make_request_rotates_tokens(self, manager):
+        """Consecutive requests use different Authorization headers."""
+        response = MagicMock(headers={"X-RateLimit-Remaining": "4000"})
+        with patch('classroom_pilot.secrets.github_secrets.requests.request',
+                   return_value=response) as mock_request:
+            manager._make_request("GET", "/repos/org/a")
+            manager._make_request("GET", "/repos/org/b")
+
+        used = [c.kwargs["headers"]["Authorization"]
+                for c in mock_request.call_args_list]
+        assert used == ["token ghp_main", "token ghp_extra"]
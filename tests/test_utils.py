@@ -4,6 +4,8 @@ Test suite for the utilities package.
 Tests logging, git operations, path management, and UI components.
 """
 
+import json
+import logging
 from pathlib import Path
 import os
 import subprocess
@@ -34,6 +36,20 @@ class TestLogger:
         logger = get_logger("test_verbose")
         assert logger is not None
 
+    def test_setup_logging_is_idempotent(self):
+        """Test that repeated setup with the same settings keeps the handlers."""
+        from classroom_pilot.utils.logger import logger as root_logger
+
+        setup_logging(verbose=False)
+        handlers = list(root_logger.handlers)
+        setup_logging(verbose=False)
+        assert root_logger.handlers == handlers
+
+        setup_logging(verbose=True)
+        assert len(root_logger.handlers) == 1
+        assert root_logger.handlers != handlers
+        assert root_logger.level == logging.DEBUG
+
     def test_get_logger(self):
         """Test logger creation."""
         logger1 = get_logger("module1")
@@ -404,6 +420,134 @@ class TestFileOperations:
         assert content.count("# Instructor-only files") == 1
 
 
+class TestFileParseCache:
+    """Test the shared parsed-file cache."""
+
+    def test_relative_path_follows_working_directory(self, temp_directory, monkeypatch):
+        """Test the same relative name in two directories is not served stale."""
+        from classroom_pilot.utils.file_cache import FileParseCache
+
+        for name in ("a", "b"):
+            (temp_directory / name).mkdir()
+            (temp_directory / name / "list.txt").write_text(name)
+
+        cache = FileParseCache()
+        monkeypatch.chdir(temp_directory / "a")
+        assert cache.load("list.txt", Path.read_text) == "a"
+        monkeypatch.chdir(temp_directory / "b")
+        assert cache.load("list.txt", Path.read_text) == "b"
+
+    def test_returns_copies_and_reparses_changes(self, temp_directory):
+        """Test callers get independent copies until the file changes."""
+        from classroom_pilot.utils.file_cache import FileParseCache
+
+        data_file = temp_directory / "data.json"
+        data_file.write_text('{"items": [1]}')
+        parse = MagicMock(side_effect=lambda path: json.loads(path.read_text()))
+        cache = FileParseCache()
+
+        first = cache.load(data_file, parse)
+        first["items"].append(2)
+        assert cache.load(data_file, parse) == {"items": [1]}
+        assert parse.call_count == 1
+
+        data_file.write_text('{"items": [1, 2, 3]}')
+        assert cache.load(data_file, parse) == {"items": [1, 2, 3]}
+        assert parse.call_count == 2
+
+
+class TestTokenManagerConfig:
+    """Test GitHubTokenManager config file reads."""
+
+    def test_get_config_parses_file_once(self, temp_directory):
+        """Test the token config is re-read only after the file changes."""
+        from classroom_pilot.utils.token_manager import GitHubTokenManager
+
+        manager = GitHubTokenManager()
+        manager.config_file = temp_directory / "token_config.json"
+        assert manager.get_config() == {}
+
+        manager.config_file.write_text('{"github_token": {"token": "ghp_one"}}')
+        with patch('classroom_pilot.utils.token_manager.json.load', wraps=json.load) as mock_load:
+            assert manager._get_token_from_config() == {"token": "ghp_one"}
+            assert manager.get_config()["github_token"]["token"] == "ghp_one"
+            assert mock_load.call_count == 1
+
+            manager.config_file.write_text('{"github_token": {"token": "ghp_second"}}')
+            assert manager._get_token_from_config() == {"token": "ghp_second"}
+            assert mock_load.call_count == 2
+
+    def test_save_token_replaces_file_privately(self, temp_directory):
+        """Test the saved token file is owner-only and no temporary file remains."""
+        from classroom_pilot.utils.token_manager import GitHubTokenManager
+
+        manager = GitHubTokenManager()
+        manager.config_dir = temp_directory / "config"
+        manager.config_file = manager.config_dir / "token_config.json"
+
+        with patch.object(manager, '_verify_and_get_token_info',
+                          return_value={'token': 'ghp_one'}):
+            assert manager.save_token("ghp_one") is True
+
+        assert manager.get_config()["github_token"]["token"] == "ghp_one"
+        assert manager.config_file.stat().st_mode & 0o777 == 0o600
+        assert [p.name for p in manager.config_dir.iterdir()] == ["token_config.json"]
+
+    def test_store_token_config_file_is_private(self, temp_directory):
+        """Test the interactive config-file choice writes through the same private replace."""
+        from classroom_pilot.utils.token_manager import GitHubTokenManager
+
+        manager = GitHubTokenManager()
+        manager.config_dir = temp_directory / "config"
+        manager.config_file = manager.config_dir / "token_config.json"
+
+        with patch('classroom_pilot.utils.ui_components.print_colored'):
+            manager._store_token("ghp_one", {'token': 'ghp_one'}, 3)
+
+        assert manager.get_config()["github_token"]["token"] == "ghp_one"
+        assert manager.config_file.stat().st_mode & 0o777 == 0o600
+        assert [p.name for p in manager.config_dir.iterdir()] == ["token_config.json"]
+
+    def test_save_token_removes_temporary_file_on_failure(self, temp_directory):
+        """Test a failed replace leaves neither a temporary file nor a token file."""
+        from classroom_pilot.utils.token_manager import GitHubTokenManager
+
+        manager = GitHubTokenManager()
+        manager.config_dir = temp_directory
+        manager.config_file = temp_directory / "token_config.json"
+
+        with patch('classroom_pilot.utils.token_manager.os.replace',
+                   side_effect=OSError("disk full")):
+            assert manager.save_token("ghp_one", verify=False) is False
+
+        assert list(temp_directory.iterdir()) == []
+
+    def test_save_token_without_verify_skips_github(self, temp_directory):
+        """Test verify=False stores the token without querying GitHub."""
+        from classroom_pilot.utils.token_manager import GitHubTokenManager
+
+        manager = GitHubTokenManager()
+        manager.config_dir = temp_directory
+        manager.config_file = temp_directory / "token_config.json"
+
+        with patch.object(manager, '_verify_and_get_token_info') as mock_verify:
+            assert manager.save_token("ghp_one", expires_at="2026-01-01T00:00:00+00:00",
+                                      verify=False) is True
+            mock_verify.assert_not_called()
+
+        token_data = manager.get_config()["github_token"]
+        assert token_data["token"] == "ghp_one"
+        assert token_data["expires_at_source"] == "manual"
+
+    def test_parse_iso_datetime_accepts_z_suffix(self):
+        """Test a trailing 'Z' parses to the same instant as '+00:00'."""
+        from classroom_pilot.utils.token_manager import parse_iso_datetime
+
+        assert parse_iso_datetime("2026-01-01T00:00:00Z") == \
+            parse_iso_datetime("2026-01-01T00:00:00+00:00")
+        assert parse_iso_datetime("2026-01-01T00:00:00Z").utcoffset().total_seconds() == 0
+
+
 class TestUtilsIntegration:
     """Test integration between utility components."""
 